@@ -0,0 +1,36 @@
+"""Console entry point with fast paths for ``--version`` and the daemon."""
+
+import sys
+
+
+def main() -> None:
+    """
+    Run the T3 CLI.
+
+    ``--version`` is answered without importing Typer, and when
+    ``T3_USE_DAEMON`` is set the invocation is forwarded to a running daemon,
+    falling back to in-process execution if none is reachable.
+    """
+    argv = sys.argv[1:]
+    if argv in (["--version"], ["-v"]):
+        from t3 import __version__
+
+        sys.stdout.write(f"T3 CLI version: {__version__}\n")
+        return
+
+    from t3.core.daemon import daemon_enabled
+
+    if daemon_enabled() and argv[:1] != ["daemon"]:
+        from t3.core.daemon import run_remote
+
+        exit_code = run_remote(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from t3.main import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
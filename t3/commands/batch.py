@@ -0,0 +1,146 @@
+"""Batch execution command."""
+
+import json
+import shlex
+import sys
+import time
+from pathlib import Path
+
+import typer
+
+from t3.core.batch import parse_batch
+from t3.core.config import ConfigConflictError, get_config
+from t3.core.output import Column, get_renderer
+
+batch_app = typer.Typer(add_completion=False)
+
+# Commands that must not be nested inside a batch.
+UNSUPPORTED_COMMANDS = {"batch", "daemon"}
+
+
+@batch_app.command()
+def batch(
+    ctx: typer.Context,
+    source: str = typer.Argument(
+        "-", help="File with one command per line or a JSON array ('-' for stdin)"
+    ),
+    continue_on_error: bool = typer.Option(
+        False, "--continue-on-error", help="Keep going after a command fails"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Output the report as JSON"),
+) -> None:
+    """Run many T3 commands in a single process."""
+    try:
+        text = sys.stdin.read() if source == "-" else Path(source).read_text()
+        commands = parse_batch(text)
+    except (OSError, ValueError) as e:
+        get_renderer().message("error", f"Failed to read batch: {e}")
+        raise typer.Exit(1) from e
+
+    root = ctx.find_root().command
+    started = time.perf_counter()
+
+    try:
+        with get_config().transaction():
+            results = _run_commands(root, commands, continue_on_error)
+    except ConfigConflictError as e:
+        get_renderer().message("error", f"Configuration not saved: {e}")
+        raise typer.Exit(1) from e
+
+    total_seconds = time.perf_counter() - started
+    failed = sum(1 for _, exit_code, _ in results if exit_code != 0)
+
+    renderer = get_renderer()
+    if as_json or renderer.structured:
+        report = {
+            "total": len(commands),
+            "executed": len(results),
+            "failed": failed,
+            "seconds": round(total_seconds, 4),
+            "commands": [
+                {"argv": argv, "exit_code": exit_code, "ms": round(elapsed_ms, 3)}
+                for argv, exit_code, elapsed_ms in results
+            ],
+        }
+        if renderer.structured:
+            renderer.record(report)
+        else:
+            typer.echo(json.dumps(report, indent=2))
+    else:
+        _print_report(results, len(commands), total_seconds)
+
+    if failed:
+        raise typer.Exit(1)
+
+
+def _run_commands(
+    root: typer.core.TyperGroup, commands: list[list[str]], continue_on_error: bool
+) -> list[tuple[list[str], int, float]]:
+    """Run commands in order and collect their exit statuses and timings."""
+    results = []
+    for argv in commands:
+        command_started = time.perf_counter()
+        if argv[0] in UNSUPPORTED_COMMANDS:
+            get_renderer().message("error", f"'{argv[0]}' cannot run inside a batch")
+            exit_code = 1
+        else:
+            exit_code = _invoke(root, argv)
+
+        elapsed_ms = (time.perf_counter() - command_started) * 1000
+        results.append((argv, exit_code, elapsed_ms))
+        if exit_code != 0 and not continue_on_error:
+            break
+    return results
+
+
+def _invoke(root: typer.core.TyperGroup, argv: list[str]) -> int:
+    """Run one command line through the application and return its status."""
+    try:
+        root.main(args=argv, prog_name="t3", standalone_mode=True)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        get_renderer().message("error", str(e.code), icon="")
+        return 1
+    except Exception as e:
+        # A crashing command fails on its own, like under the daemon,
+        # instead of aborting the batch and its pending config changes.
+        get_renderer().message(
+            "error", f"'{shlex.join(argv)}' crashed: {type(e).__name__}: {e}"
+        )
+        return 1
+    return 0
+
+
+def _print_report(
+    results: list[tuple[list[str], int, float]], total: int, total_seconds: float
+) -> None:
+    """Print per-command exit statuses and overall throughput."""
+    renderer = get_renderer()
+    columns = (
+        Column("#", style="blue", justify="right"),
+        Column("Command", style="cyan", format=shlex.join),
+        Column("Exit", justify="right"),
+        Column("Time (ms)", style="green", justify="right", format="{:.1f}".format),
+    )
+    rows = (
+        (index, argv, exit_code, elapsed_ms)
+        for index, (argv, exit_code, elapsed_ms) in enumerate(results, start=1)
+    )
+    renderer.table(columns, rows, title="T3 Batch")
+
+    failed = sum(1 for _, exit_code, _ in results if exit_code != 0)
+    skipped = total - len(results)
+    rate = len(results) / total_seconds if total_seconds else 0.0
+    summary = f"{len(results) - failed} succeeded, {failed} failed"
+    if skipped:
+        summary += f", {skipped} skipped"
+    renderer.message(
+        "error" if failed else "success",
+        f"{summary} in {total_seconds:.2f}s ({rate:.0f} commands/s)",
+        icon="",
+        style="bold red" if failed else "bold green",
+    )
+
+
+batch_command = typer.main.get_command(batch_app)
@@ -0,0 +1,311 @@
+"""Benchmark commands."""
+
+import asyncio
+import json
+import os
+import platform
+import shlex
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from t3 import __version__
+from t3.core.bench import DEFAULT_STARTUP_COMMANDS, StartupResult, benchmark_startup
+from t3.core.edge import (
+    DEFAULT_CONFIG,
+    camera_profile,
+    estimate_jpeg_bytes,
+    iter_cameras,
+    load_edge_config,
+)
+from t3.core.output import Column, get_renderer
+from t3.core.pipeline import (
+    MOCK_BROKER,
+    PROTOCOLS,
+    MockBroker,
+    MqttPublisher,
+    PipelineLoad,
+    PipelineReport,
+    run_pipeline,
+)
+from t3.core.utils import format_size, redact_url
+
+bench_app = typer.Typer(help="Performance benchmarks")
+
+
+@bench_app.command()
+def startup(
+    runs: int = typer.Option(10, "--runs", "-n", min=1, help="Timed launches"),
+    import_runs: int = typer.Option(
+        3, "--import-runs", min=0, help="Launches profiled with -X importtime"
+    ),
+    top: int = typer.Option(15, "--top", min=1, help="Modules shown per command"),
+    commands: list[str] | None = typer.Option(
+        None,
+        "--command",
+        "-c",
+        help="Command line to benchmark (repeatable), e.g. 'config show'",
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Output results as JSON"),
+) -> None:
+    """
+    Measure cold-start wall time and import cost of T3 CLI commands.
+
+    Exits with status 1 if any launch of a benchmarked command failed.
+    """
+    targets = (
+        {command: shlex.split(command) for command in commands}
+        if commands
+        else DEFAULT_STARTUP_COMMANDS
+    )
+
+    renderer = get_renderer()
+    results = []
+    for name, argv in targets.items():
+        if not as_json:
+            renderer.message(
+                "info", f"Benchmarking 't3 {name}'...", icon="⏱️ ", style="cyan"
+            )
+        results.append(benchmark_startup(name, argv, runs, import_runs, top))
+
+    if as_json or renderer.structured:
+        report = {
+            "t3_version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": [result.to_dict() for result in results],
+        }
+        if renderer.structured:
+            renderer.record(report)
+        else:
+            typer.echo(json.dumps(report, indent=2))
+    else:
+        _print_summary(results)
+        for result in results:
+            if result.imports:
+                _print_imports(result)
+
+    if any(result.exit_code for result in results):
+        raise typer.Exit(1)
+
+
+def _milliseconds(value: float) -> str:
+    """Format a duration in milliseconds."""
+    return f"{value:.1f}"
+
+
+def _print_summary(results: list[StartupResult]) -> None:
+    """Print the wall-time summary table."""
+    columns = (
+        Column("Command", style="cyan", format="t3 {}".format),
+        Column("Runs", justify="right"),
+        Column("p50 (ms)", style="green", justify="right", format=_milliseconds),
+        Column("p95 (ms)", style="yellow", justify="right", format=_milliseconds),
+        Column("Min (ms)", style="blue", justify="right", format=_milliseconds),
+        Column("Max (ms)", style="blue", justify="right", format=_milliseconds),
+        Column("Exit", justify="right"),
+    )
+    rows = (
+        (
+            result.name,
+            result.runs,
+            result.p50_ms,
+            result.p95_ms,
+            result.min_ms,
+            result.max_ms,
+            result.exit_code,
+        )
+        for result in results
+    )
+    get_renderer().table(columns, rows, title="T3 CLI Startup")
+
+
+def _print_imports(result: StartupResult) -> None:
+    """Print the per-module import breakdown for one command."""
+    columns = (
+        Column("Module", style="cyan"),
+        Column("Self (ms)", style="green", justify="right", format="{:.2f}".format),
+        Column(
+            "Cumulative (ms)", style="blue", justify="right", format="{:.2f}".format
+        ),
+    )
+    rows = (
+        (timing.module, timing.self_us / 1000, timing.cumulative_us / 1000)
+        for timing in result.imports
+    )
+    get_renderer().table(columns, rows, title=f"Imports: t3 {result.name}")
+
+
+@bench_app.command()
+def pipeline(
+    config_path: Path | None = typer.Option(
+        None,
+        "--config",
+        "-c",
+        help=f"Edge-video config.toml [default: {DEFAULT_CONFIG} if present]",
+    ),
+    protocol: str | None = typer.Option(
+        None, "--protocol", "-p", help="amqp or mqtt [default: from config]"
+    ),
+    broker: str = typer.Option(
+        MOCK_BROKER,
+        "--broker",
+        "-b",
+        help="'mock' for the in-process broker, or an MQTT URL (tcp://host:1883)",
+    ),
+    cameras: int = typer.Option(
+        0, "--cameras", "-n", min=0, help="Simulated cameras [default: from config]"
+    ),
+    fps: float = typer.Option(
+        0, "--fps", min=0, help="Frames per second per camera [default: target_fps]"
+    ),
+    frame_bytes: int = typer.Option(
+        0, "--frame-bytes", min=0, help="Frame payload size [default: JPEG estimate]"
+    ),
+    duration: float = typer.Option(
+        10.0, "--duration", "-d", min=0.1, help="Seconds to publish"
+    ),
+    connections: int = typer.Option(4, "--connections", min=1, help="Connections"),
+    channels: int = typer.Option(
+        1, "--channels", min=1, help="AMQP channels per connection"
+    ),
+    window: int = typer.Option(
+        32, "--window", min=1, help="Unconfirmed publishes allowed per channel"
+    ),
+    metadata: bool | None = typer.Option(
+        None,
+        "--metadata/--no-metadata",
+        help="Publish a metadata event per frame [default: from config]",
+    ),
+    mock_bandwidth: float = typer.Option(
+        125.0, "--mock-bandwidth", min=0.001, help="Mock broker ingress in MB/s"
+    ),
+    mock_latency: float = typer.Option(
+        1.0, "--mock-latency", min=0, help="Mock broker confirm latency in ms"
+    ),
+) -> None:
+    """Publish synthetic camera frames and measure the message pipeline."""
+    renderer = get_renderer()
+    try:
+        config = _pipeline_config(config_path)
+        camera_ids = [str(camera["id"]) for camera in iter_cameras(config)]
+        profile = camera_profile({}, config)
+    except (OSError, ValueError) as e:
+        renderer.message("error", f"Cannot read {config_path}: {e}")
+        raise typer.Exit(1) from e
+
+    protocol = protocol or str(config.get("protocol", "amqp"))
+    if protocol not in PROTOCOLS:
+        renderer.message(
+            "error", f"Unknown protocol '{protocol}' (use {' or '.join(PROTOCOLS)})"
+        )
+        raise typer.Exit(1)
+    if broker != MOCK_BROKER and protocol != "mqtt":
+        renderer.message(
+            "error",
+            "Only MQTT brokers can be benchmarked directly; use --broker mock for AMQP",
+        )
+        raise typer.Exit(1)
+
+    count = cameras or len(camera_ids) or 1
+    camera_ids = [
+        camera_ids[n] if n < len(camera_ids) else f"cam{n + 1}" for n in range(count)
+    ]
+    metadata_config = config.get("metadata") or {}
+    if metadata is None:
+        metadata = bool(metadata_config.get("enabled", True))
+    if protocol == "amqp":
+        amqp = config.get("amqp") or {}
+        prefix = str(amqp.get("routing_key_prefix", "camera."))
+        metadata_topic = str(
+            metadata_config.get("routing_key", "camera.metadata.event")
+        )
+    else:
+        prefix = str((config.get("mqtt") or {}).get("topic_prefix", "camera/"))
+        metadata_topic = f"{prefix}metadata"
+        channels = 1
+
+    load = PipelineLoad(
+        cameras=camera_ids,
+        fps=fps or profile.fps,
+        frame_bytes=frame_bytes
+        or estimate_jpeg_bytes(profile.width, profile.height, profile.quality),
+        duration=duration,
+        connections=connections,
+        channels=channels,
+        window=window,
+        topic_prefix=prefix,
+        metadata_topic=metadata_topic if metadata else None,
+    )
+    if broker == MOCK_BROKER:
+        mock = MockBroker(mock_bandwidth * 1e6, mock_latency / 1000)
+
+        def connect(n: int) -> Any:
+            return mock.connect()
+    else:
+
+        def connect(n: int) -> Any:
+            return MqttPublisher.connect(broker, f"t3-bench-{os.getpid()}-{n}")
+
+    if not renderer.structured:
+        renderer.message(
+            "info",
+            f"Publishing {len(load.cameras)} camera(s) x {load.fps:g} fps of "
+            f"{format_size(load.frame_bytes)} frames over {protocol} to "
+            f"{redact_url(broker)} for {duration:g} s...",
+            icon="⏱️ ",
+            style="cyan",
+        )
+    try:
+        report = asyncio.run(run_pipeline(load, connect))
+    except OSError as e:
+        renderer.message("error", f"Broker error: {e}")
+        raise typer.Exit(1) from e
+
+    if renderer.structured:
+        renderer.record(
+            {"protocol": protocol, "broker": redact_url(broker), **report._asdict()}
+        )
+        return
+    _print_pipeline(report)
+
+
+def _pipeline_config(path: Path | None) -> dict[str, Any]:
+    """Read the given config, or the default one if it exists."""
+    if path is None:
+        if not Path(DEFAULT_CONFIG).is_file():
+            return {}
+        path = Path(DEFAULT_CONFIG)
+    return load_edge_config(path)
+
+
+def _print_pipeline(report: PipelineReport) -> None:
+    """Print throughput, latency and backpressure, warning about drops."""
+    renderer = get_renderer()
+    renderer.record(
+        {
+            "Elapsed": f"{report.elapsed_s:.2f} s",
+            "Frames": f"{report.frames} of {report.offered_frames} offered",
+            "Metadata events": str(report.events),
+            "Throughput": (
+                f"{report.messages_per_second:,.0f} msg/s, "
+                f"{format_size(round(report.bytes_per_second))}/s"
+            ),
+            "Latency p50": f"{report.latency_p50_ms:.2f} ms",
+            "Latency p95": f"{report.latency_p95_ms:.2f} ms",
+            "Latency p99": f"{report.latency_p99_ms:.2f} ms",
+            "Latency max": f"{report.latency_max_ms:.2f} ms",
+            "Backpressure": (
+                f"{report.backpressure_waits} waits, "
+                f"{report.backpressure_ms:,.0f} ms blocked"
+            ),
+        },
+        title="Pipeline Benchmark",
+    )
+    if report.dropped_frames:
+        renderer.message(
+            "warning",
+            f"{report.dropped_frames} frame(s) dropped: the broker did not confirm "
+            "fast enough (try more --connections, --channels or --window)",
+        )
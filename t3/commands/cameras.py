@@ -0,0 +1,92 @@
+"""Camera inventory commands."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from t3.core.edge import DEFAULT_CONFIG, iter_cameras, load_edge_config
+from t3.core.output import Column, get_renderer
+from t3.core.rtsp import DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT, OK, iter_probes
+
+cameras_app = typer.Typer(help="Edge-video camera tools")
+
+
+@cameras_app.command()
+def probe(
+    config_path: Path = typer.Option(
+        Path(DEFAULT_CONFIG), "--config", "-c", help="Edge-video config.toml"
+    ),
+    camera_ids: list[str] | None = typer.Option(
+        None, "--camera", help="Probe only this camera ID (repeatable)"
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_TIMEOUT, "--timeout", "-t", min=0.001, help="Seconds per camera"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_CONCURRENCY, "--concurrency", "-j", min=1, help="Probes in flight"
+    ),
+    describe: bool = typer.Option(
+        True,
+        "--describe/--options-only",
+        help="Also send DESCRIBE, which checks the stream path and credentials",
+    ),
+) -> None:
+    """Check that every camera answers RTSP, probing them concurrently."""
+    renderer = get_renderer()
+    try:
+        config = load_edge_config(config_path)
+        cameras = [
+            (str(camera["id"]), str(camera.get("url", "")))
+            for camera in iter_cameras(config)
+            if not camera_ids or str(camera["id"]) in camera_ids
+        ]
+    except (OSError, ValueError) as e:
+        renderer.message("error", f"Cannot read {config_path}: {e}")
+        raise typer.Exit(1) from e
+    if not cameras:
+        renderer.message("warning", f"No cameras to probe in {config_path}")
+        return
+
+    failed = 0
+
+    def rows() -> Iterator[tuple[Any, ...]]:
+        nonlocal failed
+        for result in iter_probes(cameras, timeout, concurrency, describe):
+            failed += result.status != OK
+            yield (
+                result.id,
+                result.status,
+                result.code,
+                result.connect_ms,
+                result.latency_ms,
+                result.url,
+                result.error,
+            )
+
+    columns = (
+        Column("Camera", key="id", style="cyan"),
+        Column("Status", style="bold"),
+        Column("RTSP", key="code", justify="right", format=_format_optional),
+        Column("Connect (ms)", key="connect_ms", justify="right", format=_format_ms),
+        Column("Latency (ms)", key="latency_ms", justify="right", format=_format_ms),
+        Column("URL", key="url"),
+        Column("Error", style="red", format=_format_optional),
+    )
+    renderer.table(columns, rows(), title="Camera Probe")
+
+    if failed:
+        renderer.message("error", f"{failed} of {len(cameras)} camera(s) failed")
+        raise typer.Exit(1)
+    renderer.message("success", f"All {len(cameras)} camera(s) answered")
+
+
+def _format_optional(value: object) -> str:
+    """Format a value that may be missing."""
+    return "-" if value is None else str(value)
+
+
+def _format_ms(value: float | None) -> str:
+    """Format a duration in milliseconds."""
+    return "-" if value is None else f"{value:.1f}"
@@ -1,112 +1,312 @@
 """Configuration management commands."""
 
-import json
+import sys
+from collections.abc import Iterator
+from fnmatch import fnmatchcase
+from itertools import chain
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from t3.core.config import ConfigConflictError, get_config, parse_value
+from t3.core.layers import resolve_config
+from t3.core.output import Column, format_value, get_renderer
 
 config_app = typer.Typer(help="Configuration management")
 
-CONFIG_FILE = Path.home() / ".t3" / "config.json"
+_MISSING = object()
 
 
 @config_app.command()
-def show() -> None:
+def show(
+    pattern: str = typer.Argument(
+        None, help="Section or glob to show, e.g. 'video' or 'video.*'"
+    ),
+) -> None:
     """Show current configuration."""
-    config_data = _load_config()
+    renderer = get_renderer()
+    rows = _matching_items(pattern)
+    first = next(rows, None)
 
-    if not config_data:
-        console.print("No configuration found", style="yellow")
+    if first is None and not renderer.structured:
+        renderer.message("warning", "No configuration found", icon="")
         return
 
-    table = Table(
-        title="T3 CLI Configuration",
-        show_header=True,
-        header_style="bold magenta",
-    )
-    table.add_column("Key", style="cyan", no_wrap=True)
-    table.add_column("Value", style="green")
-
-    for key, value in config_data.items():
-        table.add_row(key, str(value))
-
-    console.print(table)
+    # Rows are streamed from the document; only the first is peeked at.
+    columns = (Column("Key", style="cyan"), Column("Value", style="green"))
+    rows = chain([first], rows) if first is not None else rows
+    renderer.table(columns, rows, title="T3 CLI Configuration")
 
 
 @config_app.command()
 def set(
-    key: str = typer.Argument(..., help="Configuration key"),
+    key: str = typer.Argument(..., help="Configuration key (dotted path)"),
     value: str = typer.Argument(..., help="Configuration value"),
+    as_string: bool = typer.Option(
+        False, "--string", "-s", help="Store the value as a plain string"
+    ),
 ) -> None:
-    """Set a configuration value."""
-    config_data = _load_config()
-    config_data[key] = value
-    _save_config(config_data)
+    """Set a configuration value (JSON literals are stored typed)."""
+    parsed = value if as_string else parse_value(value)
+    try:
+        get_config().set(key, parsed)
+    except ConfigConflictError as e:
+        _conflict(e)
+    except ValueError as e:
+        get_renderer().message("error", f"{e}")
+        raise typer.Exit(1) from e
 
-    console.print(f"✅ Set {key} = {value}", style="green")
+    get_renderer().message("success", f"Set {key} = {format_value(parsed)}")
 
 
 @config_app.command()
 def get(
-    key: str = typer.Argument(..., help="Configuration key"),
+    key: str = typer.Argument(..., help="Configuration key (dotted path)"),
+    explain: bool = typer.Option(
+        False, "--explain", "-e", help="Show which layer each value comes from"
+    ),
 ) -> None:
-    """Get a configuration value."""
-    config_data = _load_config()
+    """Get a configuration value from the env, project, user and default layers."""
+    renderer = get_renderer()
+    config = resolve_config()
+    value = config.get(key, _MISSING)
 
-    if key in config_data:
-        console.print(f"{key} = {config_data[key]}", style="cyan")
-    else:
-        console.print(f"❌ Key '{key}' not found", style="red")
+    if value is _MISSING:
+        renderer.message("error", f"Key '{key}' not found")
         raise typer.Exit(1)
 
+    if not explain:
+        renderer.record(
+            {"key": key, "value": value},
+            text=f"{key} = {format_value(value)}",
+            style="cyan",
+        )
+        return
+
+    # Sections merge across layers until a plain value shadows the rest.
+    layers = []
+    contributing = True
+    for position, (layer, source, layer_value) in enumerate(config.explain(key)):
+        is_section = isinstance(layer_value, dict)
+        layers.append(
+            (contributing and (is_section or position == 0), layer, source, layer_value)
+        )
+        contributing = contributing and is_section
+
+    if renderer.structured:
+        renderer.record(
+            {
+                "key": key,
+                "value": value,
+                "layers": [
+                    {"used": used, "layer": layer, "source": source, "value": v}
+                    for used, layer, source, v in layers
+                ],
+            }
+        )
+        return
+
+    renderer.record(
+        {"key": key, "value": value},
+        text=f"{key} = {format_value(value)}",
+        style="cyan",
+    )
+    columns = (
+        Column("", key="used", format=lambda used: "✔" if used else ""),
+        Column("Layer", style="cyan"),
+        Column("Source"),
+        Column("Value", style="green"),
+    )
+    renderer.table(columns, layers)
+
 
 @config_app.command()
 def delete(
-    key: str = typer.Argument(..., help="Configuration key"),
+    key: str = typer.Argument(..., help="Configuration key (dotted path)"),
 ) -> None:
-    """Delete a configuration value."""
-    config_data = _load_config()
+    """Delete a configuration value or section."""
+    try:
+        deleted = get_config().delete(key)
+    except ConfigConflictError as e:
+        _conflict(e)
 
-    if key in config_data:
-        del config_data[key]
-        _save_config(config_data)
-        console.print(f"✅ Deleted '{key}'", style="green")
+    if deleted:
+        get_renderer().message("success", f"Deleted '{key}'")
     else:
-        console.print(f"❌ Key '{key}' not found", style="red")
+        get_renderer().message("error", f"Key '{key}' not found")
         raise typer.Exit(1)
 
 
 @config_app.command()
 def reset() -> None:
     """Reset configuration to defaults."""
-    from rich.prompt import Confirm
-
-    if Confirm.ask("Are you sure you want to reset all configuration?"):
-        CONFIG_FILE.unlink(missing_ok=True)
-        console.print("✅ Configuration reset", style="green")
+    renderer = get_renderer()
+    if renderer.confirm("Are you sure you want to reset all configuration?"):
+        get_config().reset()
+        renderer.message("success", "Configuration reset")
     else:
-        console.print("❌ Reset cancelled", style="yellow")
+        renderer.message("warning", "Reset cancelled", icon="❌")
 
 
-def _load_config() -> dict:
-    """Load configuration from file."""
-    if not CONFIG_FILE.exists():
-        return {}
+@config_app.command("import")
+def import_(
+    source: str = typer.Argument("-", help="File to import ('-' for stdin)"),
+    fmt: str = typer.Option(
+        None,
+        "--format",
+        "-f",
+        help="json, ndjson, toml or yaml (default: by extension)",
+    ),
+    strategy: str = typer.Option(
+        "merge", "--strategy", help="replace, merge (deep) or missing (only new keys)"
+    ),
+) -> None:
+    """Import configuration in bulk with a single write."""
+    from t3.core.config_io import (
+        FORMATS,
+        STRATEGIES,
+        detect_format,
+        import_entries,
+        iter_entries,
+    )
+
+    fmt = fmt or detect_format(source)
+    if fmt not in FORMATS:
+        get_renderer().message("error", f"Unsupported format: {fmt}")
+        raise typer.Exit(1)
+    if strategy not in STRATEGIES:
+        get_renderer().message("error", f"Unknown merge strategy: {strategy}")
+        raise typer.Exit(1)
 
     try:
-        with CONFIG_FILE.open("r") as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return {}
+        if source == "-":
+            counts = import_entries(
+                get_config(), iter_entries(sys.stdin, fmt), strategy
+            )
+        else:
+            with Path(source).open("r", encoding="utf-8") as stream:
+                counts = import_entries(
+                    get_config(), iter_entries(stream, fmt), strategy
+                )
+    except ConfigConflictError as e:
+        _conflict(e)
+    except (OSError, ValueError) as e:
+        get_renderer().message("error", f"Import failed: {e}")
+        raise typer.Exit(1) from e
+
+    get_renderer().message(
+        "success",
+        f"Imported {counts['changed']} keys "
+        f"({counts['unchanged']} unchanged, {counts['skipped']} skipped)",
+    )
+
+
+@config_app.command()
+def export(
+    destination: str = typer.Argument("-", help="Output file ('-' for stdout)"),
+    fmt: str = typer.Option(
+        None,
+        "--format",
+        "-f",
+        help="json, ndjson, toml or yaml (default: by extension)",
+    ),
+    prefix: str = typer.Option(None, "--prefix", "-p", help="Only export a section"),
+) -> None:
+    """Export configuration in bulk."""
+    from t3.core.config_io import FORMATS, detect_format, export_config
+
+    fmt = fmt or detect_format(destination)
+    if fmt not in FORMATS:
+        get_renderer().message("error", f"Unsupported format: {fmt}")
+        raise typer.Exit(1)
+
+    config = get_config()
+    try:
+        if destination == "-":
+            export_config(config, sys.stdout, fmt, prefix)
+            return
+
+        with Path(destination).open("w", encoding="utf-8") as stream:
+            count = export_config(config, stream, fmt, prefix)
+    except (OSError, ValueError) as e:
+        get_renderer().message("error", f"Export failed: {e}")
+        raise typer.Exit(1) from e
+
+    get_renderer().message("success", f"Exported {count} keys to {destination}")
+
+
+@config_app.command()
+def watch(
+    paths: list[str] | None = typer.Option(
+        None,
+        "--path",
+        "-p",
+        help="File to watch (repeatable; default: the user and project config)",
+    ),
+    debounce: float = typer.Option(
+        0.2, "--debounce", min=0.0, help="Seconds of quiet before reporting"
+    ),
+    poll: bool = typer.Option(
+        False, "--poll", help="Poll file status instead of using inotify"
+    ),
+    interval: float = typer.Option(
+        1.0, "--interval", min=0.01, help="Seconds between polls"
+    ),
+    max_events: int = typer.Option(
+        0, "--max-events", "-n", min=0, help="Exit after this many events (0: never)"
+    ),
+) -> None:
+    """Stream configuration changes as NDJSON events."""
+    from t3.core.config import default_config_path
+    from t3.core.layers import find_project_config
+    from t3.core.output import NdjsonRenderer
+    from t3.core.watch import ConfigWatcher
+
+    if paths:
+        targets = [Path(path) for path in paths]
+    else:
+        targets = [default_config_path()]
+        project_path = find_project_config(Path.cwd(), targets[0])
+        if project_path is not None:
+            targets.append(project_path)
+
+    # Events are always NDJSON, flushed once per settled burst of writes.
+    events = NdjsonRenderer(sys.stdout)
+    count = 0
+    try:
+        with ConfigWatcher(targets, debounce, interval, poll) as watcher:
+            for changes in watcher:
+                for change in changes:
+                    events.record(change._asdict())
+                    count += 1
+                    if count == max_events:
+                        return
+                events.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        events.flush()
+
+
+def _matching_items(pattern: str | None) -> Iterator[tuple[str, object]]:
+    """
+    Get the leaves selected by a ``show`` pattern.
+
+    ``section`` and ``section.*`` list a subtree through the path index;
+    other glob patterns are matched against every leaf path.
+    """
+    config = get_config()
+    if not pattern:
+        return config.items()
+
+    prefix = pattern.removesuffix(".*")
+    if not any(char in prefix for char in "*?["):
+        return config.items(prefix)
 
+    return ((key, value) for key, value in config.items() if fnmatchcase(key, pattern))
 
-def _save_config(config_data: dict) -> None:
-    """Save configuration to file."""
-    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    with CONFIG_FILE.open("w") as f:
-        json.dump(config_data, f, indent=2)
+def _conflict(error: ConfigConflictError) -> None:
+    """Report a concurrent modification and exit."""
+    get_renderer().message("error", f"{error}; please retry")
+    raise typer.Exit(1) from error
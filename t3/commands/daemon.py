@@ -0,0 +1,103 @@
+"""Daemon management commands."""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import typer
+
+from t3.core.daemon import build_daemon, control, default_socket_path
+from t3.core.output import get_renderer
+
+daemon_app = typer.Typer(help="Persistent background process for fast invocations")
+
+SOCKET_OPTION_HELP = (
+    "Unix socket path (default: $T3_DAEMON_SOCKET or ~/.t3/daemon.sock)"
+)
+
+
+@daemon_app.command()
+def start(
+    socket_path: str = typer.Option(None, "--socket", "-s", help=SOCKET_OPTION_HELP),
+    foreground: bool = typer.Option(
+        False, "--foreground", help="Run in the foreground instead of detaching"
+    ),
+    wait: float = typer.Option(
+        10.0, "--wait", help="Seconds to wait for a detached daemon to come up"
+    ),
+) -> None:
+    """Start the T3 daemon."""
+    path = Path(socket_path).expanduser() if socket_path else default_socket_path()
+
+    if control("ping", path) is not None:
+        get_renderer().message("error", f"Daemon already running on {path}")
+        raise typer.Exit(1)
+
+    if foreground:
+        daemon = build_daemon(path)
+        get_renderer().message("success", f"T3 daemon listening on {path}", icon="🚀")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        get_renderer().message("info", "T3 daemon stopped", icon="👋", style="cyan")
+        return
+
+    subprocess.Popen(
+        [sys.executable, "-m", "t3", "daemon", "start", "--foreground"]
+        + ["--socket", str(path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        info = control("ping", path)
+        if info is not None:
+            renderer = get_renderer()
+            renderer.message(
+                "success", f"T3 daemon started (pid {info['pid']}) on {path}"
+            )
+            renderer.message(
+                "info",
+                "Export T3_USE_DAEMON=1 to route t3 calls through it",
+                icon="💡",
+                style="default",
+            )
+            return
+        time.sleep(0.05)
+
+    get_renderer().message("error", "Daemon did not start in time")
+    raise typer.Exit(1)
+
+
+@daemon_app.command()
+def stop(
+    socket_path: str = typer.Option(None, "--socket", "-s", help=SOCKET_OPTION_HELP),
+) -> None:
+    """Stop the T3 daemon."""
+    path = Path(socket_path).expanduser() if socket_path else default_socket_path()
+
+    if control("shutdown", path) is None:
+        get_renderer().message("error", f"No daemon running on {path}")
+        raise typer.Exit(1)
+
+    get_renderer().message("success", "T3 daemon stopped")
+
+
+@daemon_app.command()
+def status(
+    socket_path: str = typer.Option(None, "--socket", "-s", help=SOCKET_OPTION_HELP),
+) -> None:
+    """Show T3 daemon status."""
+    path = Path(socket_path).expanduser() if socket_path else default_socket_path()
+
+    info = control("ping", path)
+    if info is None:
+        get_renderer().message("error", f"No daemon running on {path}")
+        raise typer.Exit(1)
+
+    get_renderer().record(info, title="T3 Daemon")
@@ -0,0 +1,177 @@
+"""Edge-video planning commands."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from t3.core.edge import (
+    DEFAULT_BURST_SECONDS,
+    DEFAULT_CONFIG,
+    DEFAULT_FRAME_SECONDS,
+    TARGET_UTILIZATION,
+    EdgePlan,
+    ProfileLoad,
+    camera_profile,
+    iter_cameras,
+    load_edge_config,
+    plan_capacity,
+)
+from t3.core.output import Column, get_renderer
+from t3.core.utils import format_size
+
+edge_app = typer.Typer(help="Edge-video deployment tools")
+
+
+@edge_app.command()
+def plan(
+    config_path: Path = typer.Option(
+        Path(DEFAULT_CONFIG), "--config", "-c", help="Edge-video config.toml"
+    ),
+    frame_ms: float = typer.Option(
+        DEFAULT_FRAME_SECONDS * 1000,
+        "--frame-ms",
+        min=0,
+        help="Worker time per frame in milliseconds",
+    ),
+    burst: float = typer.Option(
+        DEFAULT_BURST_SECONDS,
+        "--burst",
+        min=0,
+        help="Seconds of frames the buffer should absorb",
+    ),
+    per_camera: bool = typer.Option(
+        False, "--per-camera", help="List the load of every camera"
+    ),
+) -> None:
+    """Estimate bandwidth, Redis memory and worker load of a camera inventory."""
+    renderer = get_renderer()
+    try:
+        config = load_edge_config(config_path)
+        edge_plan = plan_capacity(config, frame_ms / 1000, burst)
+    except (OSError, ValueError) as e:
+        renderer.message("error", f"Cannot plan {config_path}: {e}")
+        raise typer.Exit(1) from e
+
+    if renderer.structured:
+        report: dict[str, Any] = {
+            key: value
+            for key, value in edge_plan._asdict().items()
+            if key != "profiles"
+        }
+        report["profiles"] = [_profile_fields(load) for load in edge_plan.profiles]
+        if per_camera:
+            report["per_camera"] = [
+                dict(zip(("id", "fps", "jpeg_bytes_per_second"), row, strict=True))
+                for row in _camera_rows(config, edge_plan)
+            ]
+        renderer.record(report)
+        return
+
+    _print_profiles(edge_plan)
+    if per_camera:
+        columns = (
+            Column("Camera", style="cyan"),
+            Column("FPS", justify="right", format="{:g}".format),
+            Column("JPEG/s", justify="right", format=_rate),
+        )
+        renderer.table(columns, _camera_rows(config, edge_plan), title="Cameras")
+    _print_plan(edge_plan)
+
+
+def _rate(value: float) -> str:
+    """Format a byte rate."""
+    return f"{format_size(round(value))}/s"
+
+
+def _profile_fields(load: ProfileLoad) -> dict[str, Any]:
+    """Flatten a profile load for structured output."""
+    fields = load._asdict()
+    profile = fields.pop("profile")
+    return {"resolution": profile.resolution, **profile._asdict(), **fields}
+
+
+def _camera_rows(config: dict[str, Any], edge_plan: EdgePlan) -> Iterator[tuple]:
+    """Yield (id, fps, JPEG bytes/s) for each camera, in inventory order."""
+    loads = {load.profile: load for load in edge_plan.profiles}
+    for camera in iter_cameras(config):
+        load = loads[camera_profile(camera, config)]
+        yield str(camera["id"]), load.profile.fps, load.jpeg_bytes_per_second
+
+
+def _print_profiles(edge_plan: EdgePlan) -> None:
+    """Print the per-camera load of each distinct camera profile."""
+    columns = (
+        Column("Cameras", justify="right"),
+        Column("FPS", justify="right", format="{:g}".format),
+        Column("Resolution", style="cyan"),
+        Column("Quality", justify="right"),
+        Column("Frame", justify="right", format=format_size),
+        Column("Raw/s", justify="right", format=_rate),
+        Column("JPEG/s", style="green", justify="right", format=_rate),
+        Column("Redis", style="yellow", justify="right", format=format_size),
+    )
+    rows = (
+        (
+            load.cameras,
+            load.profile.fps,
+            load.profile.resolution,
+            load.profile.quality,
+            load.jpeg_frame_bytes,
+            load.raw_bytes_per_second,
+            load.jpeg_bytes_per_second,
+            load.redis_bytes,
+        )
+        for load in edge_plan.profiles
+    )
+    get_renderer().table(columns, rows, title="Camera Profiles (per camera)")
+
+
+def _print_plan(edge_plan: EdgePlan) -> None:
+    """Print the totals and recommendations, warning about shortfalls."""
+    renderer = get_renderer()
+    redis = (
+        f"{format_size(edge_plan.redis_bytes)} ({edge_plan.redis_ttl_seconds:g} s TTL)"
+        if edge_plan.redis_enabled
+        else "disabled"
+    )
+    renderer.record(
+        {
+            "Cameras": str(edge_plan.cameras),
+            "Frames/s": f"{edge_plan.fps:g}",
+            "Raw bandwidth": _rate(edge_plan.raw_bytes_per_second),
+            "JPEG bandwidth": _rate(edge_plan.jpeg_bytes_per_second),
+            "Redis memory": redis,
+            "Worker utilization": (
+                f"{edge_plan.worker_utilization:.0%} of {edge_plan.max_workers} workers"
+            ),
+            "Buffer headroom": (
+                f"{edge_plan.buffer_seconds:.1f} s "
+                f"({edge_plan.buffer_size} frames, "
+                f"{format_size(edge_plan.buffer_bytes)})"
+            ),
+            "Recommended max_workers": str(edge_plan.recommended_max_workers),
+            "Recommended buffer_size": str(edge_plan.recommended_buffer_size),
+        },
+        title="Capacity Plan",
+    )
+
+    if edge_plan.worker_utilization > 1:
+        renderer.message(
+            "warning",
+            f"Workers are oversubscribed ({edge_plan.worker_utilization:.0%}); "
+            f"set max_workers to at least {edge_plan.recommended_max_workers}",
+        )
+    elif edge_plan.worker_utilization > TARGET_UTILIZATION:
+        renderer.message(
+            "warning",
+            f"Worker utilization is above {TARGET_UTILIZATION:.0%}; consider "
+            f"max_workers = {edge_plan.recommended_max_workers}",
+        )
+    if edge_plan.buffer_size < edge_plan.recommended_buffer_size:
+        renderer.message(
+            "warning",
+            f"buffer_size holds only {edge_plan.buffer_seconds:.1f} s of frames; "
+            f"consider buffer_size = {edge_plan.recommended_buffer_size}",
+        )
@@ -0,0 +1,286 @@
+"""Redis frame store commands."""
+
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from t3.core.edge import DEFAULT_CONFIG, load_edge_config
+from t3.core.frames import (
+    MGET_BATCH,
+    SCAN_COUNT,
+    CameraStats,
+    FrameRef,
+    FrameStore,
+    collect_frame_stats,
+    fetch_frames,
+    frame_store,
+    parse_duration,
+    select_frames,
+    write_frame_files,
+    write_frame_tar,
+)
+from t3.core.output import Column, get_renderer
+from t3.core.resp import DEFAULT_TIMEOUT, RedisClient, RedisError
+from t3.core.utils import format_size
+
+frames_app = typer.Typer(help="Edge-video Redis frame store tools")
+
+
+def _open_store(
+    config_path: Path, address: str | None, prefix: str | None
+) -> FrameStore:
+    """Get the frame store settings, exiting on errors."""
+    try:
+        config = load_edge_config(config_path) if config_path.is_file() else {}
+        return frame_store(config, address, prefix)
+    except (OSError, ValueError) as e:
+        get_renderer().message("error", f"Cannot read {config_path}: {e}")
+        raise typer.Exit(1) from e
+
+
+def _connect(store: FrameStore, timeout: float) -> RedisClient:
+    """Connect to the frame store, exiting on errors."""
+    try:
+        return RedisClient(store.address, timeout=timeout)
+    except (OSError, RedisError) as e:
+        get_renderer().message(
+            "error",
+            f"Cannot connect to Redis at {store.address.host}:{store.address.port}: "
+            f"{e}",
+        )
+        raise typer.Exit(1) from e
+
+
+@frames_app.command()
+def stats(
+    config_path: Path = typer.Option(
+        Path(DEFAULT_CONFIG), "--config", "-c", help="Edge-video config.toml"
+    ),
+    address: str | None = typer.Option(
+        None, "--address", "-a", help="host:port or redis:// URL [default: config]"
+    ),
+    prefix: str | None = typer.Option(
+        None, "--prefix", help="Frame key prefix [default: config]"
+    ),
+    sample: float = typer.Option(
+        1.0,
+        "--sample",
+        min=0.0001,
+        max=1.0,
+        help="Fraction of keys measured with MEMORY USAGE/TTL; memory is "
+        "extrapolated from them",
+    ),
+    count: int = typer.Option(
+        SCAN_COUNT, "--count", min=1, help="Keys examined per SCAN call"
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_TIMEOUT, "--timeout", min=0.1, help="Seconds per Redis reply"
+    ),
+) -> None:
+    """Show frame keys, memory and expiry per camera, scanning incrementally."""
+    renderer = get_renderer()
+    store = _open_store(config_path, address, prefix)
+    with _connect(store, timeout) as client, renderer.progress() as progress:
+        task = progress.add_task("Scanning frame keys", total=None)
+        try:
+            cameras = collect_frame_stats(
+                client,
+                store,
+                sample,
+                count,
+                on_batch=lambda keys: progress.advance(task, keys),
+            )
+        except (OSError, RedisError) as e:
+            renderer.message("error", f"Redis error: {e}")
+            raise typer.Exit(1) from e
+
+    ordered = sorted(cameras.values(), key=lambda stats: -stats.bytes)
+    columns = (
+        Column("Camera", style="cyan"),
+        Column("Keys", justify="right"),
+        Column(
+            "Memory", key="bytes", style="green", justify="right", format=format_size
+        ),
+        Column("Avg Frame", key="average_bytes", justify="right", format=format_size),
+        Column("TTL Min", key="ttl_min_s", justify="right", format=_seconds),
+        Column("TTL p50", key="ttl_p50_s", justify="right", format=_seconds),
+        Column("TTL Max", key="ttl_max_s", justify="right", format=_seconds),
+        Column("No TTL", key="no_ttl", justify="right"),
+        Column("Oldest", key="oldest_s", justify="right", format=_seconds),
+    )
+    renderer.table(columns, map(_stats_row, ordered), title="Frame Store")
+    if renderer.structured:
+        return
+
+    keys = sum(stats.keys for stats in ordered)
+    memory = sum(stats.bytes for stats in ordered)
+    estimate = "" if sample >= 1 else " (estimated)"
+    renderer.message(
+        "info",
+        f"{keys} frame key(s) from {len(ordered)} camera(s) under "
+        f"'{store.prefix}:', {format_size(memory)}{estimate}",
+        icon="📦",
+    )
+    persistent = sum(stats.persistent for stats in ordered)
+    if persistent:
+        renderer.message(
+            "warning",
+            f"{persistent} measured frame key(s) have no TTL and never expire",
+        )
+
+
+@frames_app.command()
+def dump(
+    camera: str = typer.Option(..., "--camera", help="Camera ID"),
+    since: str = typer.Option(
+        "30s", "--since", help="Maximum frame age, e.g. 500ms, 30s, 5m, 1h"
+    ),
+    directory: Path | None = typer.Option(
+        None, "--dir", "-d", help="Directory for JPEG files [default: ./<camera>]"
+    ),
+    tar: str | None = typer.Option(
+        None, "--tar", help="Write a tar archive instead; '-' for stdout"
+    ),
+    config_path: Path = typer.Option(
+        Path(DEFAULT_CONFIG), "--config", "-c", help="Edge-video config.toml"
+    ),
+    address: str | None = typer.Option(
+        None, "--address", "-a", help="host:port or redis:// URL [default: config]"
+    ),
+    prefix: str | None = typer.Option(
+        None, "--prefix", help="Frame key prefix [default: config]"
+    ),
+    batch: int = typer.Option(MGET_BATCH, "--batch", min=1, help="Frames per MGET"),
+    workers: int = typer.Option(
+        4, "--workers", "-j", min=1, help="Concurrent file writes"
+    ),
+    count: int = typer.Option(
+        SCAN_COUNT, "--count", min=1, help="Keys examined per SCAN call"
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_TIMEOUT, "--timeout", min=0.1, help="Seconds per Redis reply"
+    ),
+) -> None:
+    """Export a camera's recent frames as JPEG files or a tar archive."""
+    renderer = get_renderer()
+    if tar == "-":
+        # stdout carries the archive, so everything else goes to stderr.
+        renderer = type(renderer)(stream=sys.stderr, buffer_size=0)
+    if tar is not None and directory is not None:
+        renderer.message("error", "Use either --dir or --tar, not both")
+        raise typer.Exit(1)
+    try:
+        max_age = parse_duration(since)
+    except ValueError as e:
+        renderer.message("error", str(e))
+        raise typer.Exit(1) from e
+
+    store = _open_store(config_path, address, prefix)
+    started = time.perf_counter()
+    with _connect(store, timeout) as client, renderer.progress() as progress:
+        try:
+            selected = select_frames(client, store, camera, max_age, count)
+            task = progress.add_task(f"Dumping {camera}", total=len(selected))
+            totals = _Totals()
+            fetched = totals.count(
+                fetch_frames(client, selected, batch),
+                on_frame=lambda: progress.advance(task, 1),
+            )
+            if tar is None:
+                destination = str(directory or Path(camera))
+                write_frame_files(fetched, Path(destination), workers)
+            elif tar == "-":
+                destination = "stdout"
+                write_frame_tar(fetched, sys.stdout.buffer)
+                sys.stdout.buffer.flush()
+            else:
+                destination = tar
+                with open(tar, "wb") as stream:
+                    write_frame_tar(fetched, stream)
+        except (OSError, RedisError) as e:
+            renderer.message("error", f"Dump failed: {e}")
+            raise typer.Exit(1) from e
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "camera": camera,
+        "destination": destination,
+        "frames": totals.frames,
+        "expired": totals.expired,
+        "bytes": totals.bytes,
+        "seconds": round(elapsed, 3),
+        "frames_per_second": round(totals.frames / elapsed, 1) if elapsed else None,
+        "megabytes_per_second": (
+            round(totals.bytes / elapsed / 1e6, 2) if elapsed else None
+        ),
+    }
+    if renderer.structured:
+        renderer.record(report)
+        return
+    if not totals.frames:
+        renderer.message(
+            "warning",
+            f"No frames of '{camera}' from the last {since} under '{store.prefix}:'",
+        )
+        return
+    renderer.message(
+        "success",
+        f"Dumped {totals.frames} frame(s), {format_size(totals.bytes)} to "
+        f"{destination} in {elapsed:.2f} s "
+        f"({report['frames_per_second']} frames/s, "
+        f"{report['megabytes_per_second']} MB/s)",
+    )
+    if totals.expired:
+        renderer.message(
+            "warning", f"{totals.expired} frame(s) expired before they were fetched"
+        )
+
+
+class _Totals:
+    """Counts of the frames passing through a dump."""
+
+    def __init__(self) -> None:
+        """Start from zero."""
+        self.frames = 0
+        self.bytes = 0
+        self.expired = 0
+
+    def count(
+        self,
+        frames: Iterable[tuple[FrameRef, bytes | None]],
+        on_frame: Callable[[], None],
+    ) -> Iterator[tuple[FrameRef, bytes]]:
+        """Count frames, dropping the ones that expired."""
+        for ref, data in frames:
+            if data is None:
+                self.expired += 1
+            else:
+                self.frames += 1
+                self.bytes += len(data)
+                yield ref, data
+            on_frame()
+
+
+def _stats_row(stats: CameraStats) -> tuple[Any, ...]:
+    """Get a table row of a camera's statistics."""
+    ttls = sorted(stats.ttls)
+    return (
+        stats.camera,
+        stats.keys,
+        stats.bytes,
+        stats.average_bytes,
+        ttls[0] if ttls else None,
+        stats.ttl_percentile(50),
+        ttls[-1] if ttls else None,
+        stats.persistent,
+        round(stats.oldest, 1) if stats.oldest is not None else None,
+    )
+
+
+def _seconds(value: float | None) -> str:
+    """Format a duration in seconds."""
+    return "-" if value is None else f"{value:g} s"
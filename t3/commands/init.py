@@ -1,331 +1,595 @@
 """Init command for setting up new projects."""
 
 from pathlib import Path
+from typing import Any, NamedTuple
 
 import typer
-from rich.console import Console
-from rich.prompt import Confirm, Prompt
 
-console = Console()
+from t3.core.output import get_renderer
 
 init_app = typer.Typer(help="Initialize new project")
 
+_ERROR_POLICIES = ("continue", "stop")
+
+_DOCKER_DIRECTORIES = ("data", "config", "logs", "recordings")
+
+_DOCKER_CONFIG = {
+    "docker": {
+        "image": "ghcr.io/t3-labs/edge-video:latest",
+        "container_name": "t3-edge-video",
+        "ports": {"web": 8080, "api": 3000, "rtmp": 1935},
+        "volumes": ["./data:/app/data", "./config:/app/config", "./logs:/app/logs"],
+        "environment": {
+            "T3_ENV": "production",
+            "T3_LOG_LEVEL": "INFO",
+            "T3_ENABLE_API": "true",
+            "T3_ENABLE_WEB": "true",
+        },
+    },
+    "video": {
+        "input": {
+            "source": "camera",
+            "resolution": "1920x1080",
+            "fps": 30,
+            "format": "h264",
+        },
+        "processing": {
+            "enable_ai": True,
+            "model": "yolo-v8",
+            "confidence_threshold": 0.5,
+            "batch_size": 4,
+        },
+        "output": {
+            "enable_streaming": True,
+            "enable_recording": False,
+            "output_path": "./recordings",
+            "stream_quality": "high",
+        },
+    },
+    "network": {
+        "api_host": "0.0.0.0",
+        "api_port": 3000,
+        "web_port": 8080,
+        "rtmp_port": 1935,
+        "enable_cors": True,
+    },
+    "storage": {
+        "data_path": "./data",
+        "max_storage_gb": 100,
+        "cleanup_older_than_days": 7,
+    },
+}
+
+_DOCKER_NEXT_STEPS = """
+Next steps:
+1. Review and edit the config.yaml file as needed
+2. Run the container:
+   docker run -d --name t3-edge-video \\
+     -p 8080:8080 -p 3000:3000 -p 1935:1935 \\
+     -v $(pwd)/data:/app/data \\
+     -v $(pwd)/config:/app/config \\
+     -v $(pwd)/logs:/app/logs \\
+     --env-file <(grep -v '^#' config.yaml | grep '=' || true) \\
+     ghcr.io/t3-labs/edge-video:latest
+3. Access the web interface at http://localhost:8080
+4. Use API endpoints at http://localhost:3000"""
+
 
 @init_app.command()
 def project(
     name: str = typer.Option(None, "--name", "-n", help="Project name"),
     template: str = typer.Option("basic", "--template", "-t", help="Project template"),
     force: bool = typer.Option(
-        False, "--force", "-f", help="Force overwrite existing files"
+        False, "--force", "-f", help="Overwrite differing files without asking"
+    ),
+    variables: list[str] | None = typer.Option(
+        None, "--var", "-V", help="Template variable as KEY=VALUE (repeatable)"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show what would change without writing"
     ),
 ) -> None:
-    """Initialize a new project."""
+    """Initialize a new project from a template."""
+    from t3.core.files import UPDATED
+    from t3.core.templates import TemplateError, load_template, scaffold
+
+    renderer = get_renderer()
+    try:
+        values = _parse_variables(variables or [])
+        compiled = load_template(template)
+    except TemplateError as e:
+        renderer.message("error", str(e))
+        raise typer.Exit(1) from e
+
     if not name:
-        name = Prompt.ask("Enter project name")
+        name = renderer.prompt("Enter project name")
 
     project_path = Path.cwd() / name
+    values["name"] = name
 
-    if project_path.exists() and not force:
-        if not Confirm.ask(f"Directory '{name}' already exists. Continue?"):
-            console.print("❌ Project initialization cancelled", style="red")
-            raise typer.Exit(1)
+    try:
+        if project_path.exists() and not force and not dry_run:
+            plan = scaffold(compiled, project_path, values, dry_run=True)
+            differing = sum(action == UPDATED for action, _ in plan)
+            if differing and not renderer.confirm(
+                f"Directory '{name}' already exists and {differing} file(s) "
+                "differ from the template. Overwrite them?"
+            ):
+                renderer.message("error", "Project initialization cancelled")
+                raise typer.Exit(1)
+
+        changes = scaffold(compiled, project_path, values, dry_run=dry_run)
+    except (TemplateError, OSError) as e:
+        renderer.message("error", f"Failed to create project: {e}")
+        raise typer.Exit(1) from e
 
-    # Create project structure
-    project_path.mkdir(exist_ok=True)
+    _report_changes(changes, dry_run)
+    if dry_run:
+        return
 
-    # Create basic files
-    readme_content = f"# {name}\n\nYour new project description here.\n"
-    (project_path / "README.md").write_text(readme_content)
-    (project_path / ".gitignore").write_text(_get_gitignore_content())
+    renderer.message("success", f"Project '{name}' initialized successfully!")
+    renderer.message(
+        "info",
+        f"Project created at: {project_path.absolute()}",
+        icon="📁",
+        style="cyan",
+    )
 
-    if template == "python":
-        _create_python_project(project_path, name)
-    elif template == "web":
-        _create_web_project(project_path, name)
-    else:
-        _create_basic_project(project_path, name)
-
-    console.print(f"✅ Project '{name}' initialized successfully!", style="green")
-    console.print(f"📁 Project created at: {project_path.absolute()}", style="cyan")
-
-
-def _get_gitignore_content() -> str:
-    """Get common .gitignore content."""
-    return """# OS generated files
-.DS_Store
-.DS_Store?
-._*
-.Spotlight-V100
-.Trashes
-ehthumbs.db
-Thumbs.db
-
-# Python
-__pycache__/
-*.py[cod]
-*$py.class
-*.so
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-
-# Virtual environments
-.env
-.venv
-env/
-venv/
-ENV/
-env.bak/
-venv.bak/
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-*~
-
-# Logs
-*.log
-logs/
-
-# Node modules
-node_modules/
-npm-debug.log*
-yarn-debug.log*
-yarn-error.log*
-"""
-
-
-def _create_basic_project(project_path: Path, name: str) -> None:
-    """Create a basic project structure."""
-    (project_path / "src").mkdir(exist_ok=True)
-    (project_path / "docs").mkdir(exist_ok=True)
-    (project_path / "tests").mkdir(exist_ok=True)
-
-    main_py_content = (
-        f'"""Main module for {name}."""\n\n'
-        "def main():\n"
-        f'    print("Hello from {name}!")\n\n'
-        'if __name__ == "__main__":\n'
-        "    main()\n"
+
+@init_app.command()
+def templates() -> None:
+    """List available project templates."""
+    from t3.core.output import Column
+    from t3.core.templates import BUILTIN_TEMPLATES, list_templates
+
+    columns = (
+        Column("Name", style="cyan"),
+        Column("Description"),
+        Column("Source", style="blue"),
+    )
+    rows = (
+        (
+            name,
+            description,
+            "built-in" if path.parent == BUILTIN_TEMPLATES else str(path),
+        )
+        for name, description, path in list_templates()
     )
-    (project_path / "src" / "main.py").write_text(main_py_content)
-
-
-def _create_python_project(project_path: Path, name: str) -> None:
-    """Create a Python project structure."""
-    _create_basic_project(project_path, name)
-
-    # Create pyproject.toml
-    pyproject_content = f"""[project]
-name = "{name}"
-version = "0.1.0"
-description = "Add your description here"
-readme = "README.md"
-requires-python = ">=3.11"
-dependencies = []
-
-[project.optional-dependencies]
-dev = [
-    "pytest>=7.0.0",
-    "ruff>=0.1.0",
-]
-
-[tool.ruff]
-line-length = 88
-target-version = "py311"
-"""
-    (project_path / "pyproject.toml").write_text(pyproject_content)
-
-
-def _create_web_project(project_path: Path, name: str) -> None:
-    """Create a web project structure."""
-    (project_path / "src").mkdir(exist_ok=True)
-    (project_path / "public").mkdir(exist_ok=True)
-    (project_path / "assets").mkdir(exist_ok=True)
-
-    # Create basic HTML file
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{name}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        h1 {{ color: #333; }}
-    </style>
-</head>
-<body>
-    <h1>Welcome to {name}</h1>
-    <p>Your web project is ready!</p>
-</body>
-</html>
-"""
-    (project_path / "public" / "index.html").write_text(html_content)
+    get_renderer().table(columns, rows, title="T3 Project Templates")
+
+
+@init_app.command()
+def many(
+    manifest: Path = typer.Argument(
+        ..., help="Projects manifest (.yaml, .json or .toml)"
+    ),
+    directory: Path = typer.Option(
+        Path("."), "--directory", "-d", help="Directory to create projects in"
+    ),
+    workers: int = typer.Option(
+        0, "--workers", "-w", help="Worker threads (0: one per CPU, plus four)"
+    ),
+    on_error: str = typer.Option(
+        "continue",
+        "--on-error",
+        help="After a failed project: 'continue' with the others or 'stop'",
+    ),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Overwrite files that differ from the template"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show what would change without writing"
+    ),
+) -> None:
+    """Initialize many projects from a manifest, concurrently."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from t3.core.files import CREATED, UNCHANGED, UPDATED
+    from t3.core.output import Column
+    from t3.core.templates import TemplateError, load_template, scaffold_many
+
+    renderer = get_renderer()
+    if on_error not in _ERROR_POLICIES:
+        raise typer.BadParameter(
+            f"must be one of: {', '.join(_ERROR_POLICIES)}", param_hint="--on-error"
+        )
+    try:
+        projects = _read_projects(manifest, directory)
+    except (OSError, ValueError) as e:
+        renderer.message("error", f"Invalid manifest: {e}")
+        raise typer.Exit(1) from e
+
+    # Outcome per project: change counts and an error, if any.
+    outcomes: dict[int, tuple[dict[str, int], str | None]] = {}
+    with ThreadPoolExecutor(max_workers=workers or None) as pool:
+        # Each template is loaded once and shared by its projects.
+        compiled: dict[str, Any] = {}
+        for spec in projects:
+            if spec.template not in compiled:
+                try:
+                    compiled[spec.template] = load_template(
+                        spec.template, executor=pool
+                    )
+                except TemplateError as e:
+                    compiled[spec.template] = e
+
+        jobs = []
+        for index, spec in enumerate(projects):
+            template = compiled[spec.template]
+            if isinstance(template, TemplateError):
+                outcomes[index] = ({}, str(template))
+            else:
+                jobs.append((index, (template, spec.path, spec.variables)))
+
+        if not force and not dry_run:
+            # Non-interactive: projects whose existing files differ are failed
+            # rather than overwritten.
+            existing = [job for job in jobs if job[1][1].exists()]
+            for result in scaffold_many(
+                [job for _, job in existing], pool, dry_run=True
+            ):
+                differing = sum(action == UPDATED for action, _ in result.changes)
+                if result.error is not None or differing:
+                    reason = result.error or (
+                        f"{differing} existing file(s) differ (use --force)"
+                    )
+                    outcomes[existing[result.index][0]] = ({}, str(reason))
+            jobs = [job for job in jobs if job[0] not in outcomes]
+
+        if outcomes and on_error == "stop":
+            jobs = []
+
+        with renderer.progress() as progress:
+            task = progress.add_task("Scaffolding projects", total=len(projects))
+            progress.advance(task, len(outcomes))
+            results = scaffold_many([job for _, job in jobs], pool, dry_run=dry_run)
+            try:
+                for result in results:
+                    index = jobs[result.index][0]
+                    counts = dict.fromkeys((CREATED, UPDATED, UNCHANGED), 0)
+                    for action, _ in result.changes:
+                        counts[action] += 1
+                    error = None if result.error is None else str(result.error)
+                    outcomes[index] = (counts, error)
+                    progress.advance(task)
+                    if error is not None and on_error == "stop":
+                        break
+            finally:
+                results.close()
+
+    columns = (
+        Column("Project", style="cyan"),
+        Column("Template"),
+        Column(CREATED.title(), key=CREATED, justify="right"),
+        Column(UPDATED.title(), key=UPDATED, justify="right"),
+        Column(UNCHANGED.title(), key=UNCHANGED, justify="right"),
+        Column("Status"),
+    )
+    failed = 0
+    rows = []
+    for index, spec in enumerate(projects):
+        counts, error = outcomes.get(index, ({}, "skipped"))
+        failed += error is not None
+        rows.append(
+            (
+                spec.name,
+                spec.template,
+                *(counts.get(action, 0) for action in (CREATED, UPDATED, UNCHANGED)),
+                "ok" if error is None else error,
+            )
+        )
+    title = "Planned Projects (dry run)" if dry_run else "Projects"
+    renderer.table(columns, rows, title=title)
+
+    if failed:
+        renderer.message("error", f"{failed} of {len(projects)} project(s) failed")
+        raise typer.Exit(1)
+    renderer.message("success", f"{len(projects)} project(s) initialized")
+
+
+def _report_changes(changes: list[tuple[str, Path]], dry_run: bool) -> None:
+    """Print the created/updated/unchanged summary, and the plan if dry."""
+    from t3.core.files import CREATED, UNCHANGED, UPDATED
+    from t3.core.output import Column
+
+    renderer = get_renderer()
+    if dry_run:
+        cwd = Path.cwd()
+        rows = (
+            (action, str(path.relative_to(cwd) if path.is_relative_to(cwd) else path))
+            for action, path in changes
+        )
+        columns = (Column("Action", style="cyan"), Column("Path"))
+        renderer.table(columns, rows, title="Planned Changes")
+
+    counts = dict.fromkeys((CREATED, UPDATED, UNCHANGED), 0)
+    for action, _ in changes:
+        counts[action] += 1
+    summary = ", ".join(f"{count} {action}" for action, count in counts.items())
+    if dry_run:
+        summary = f"Dry run, nothing written: {summary}"
+    renderer.record(counts, text=summary, style="bold")
+
+
+class _ProjectSpec(NamedTuple):
+    """A project listed in an ``init many`` manifest."""
+
+    name: str
+    template: str
+    path: Path
+    variables: dict[str, Any]
+
+
+def _read_projects(manifest: Path, directory: Path) -> list[_ProjectSpec]:
+    """
+    Read an ``init many`` manifest.
+
+    Top-level ``template`` and ``variables`` are defaults for every entry of
+    ``projects``, a list of tables with ``name`` and optionally ``template``,
+    ``path`` (relative to ``directory``; defaults to the name) and
+    ``variables``. ``projects`` may also be a table keyed by name.
+    """
+    from t3.core.config_io import detect_format, load_document
+
+    with manifest.open("r", encoding="utf-8") as stream:
+        document = load_document(stream, detect_format(str(manifest)))
+
+    entries = document.get("projects")
+    if isinstance(entries, dict):
+        entries = [{"name": name, **(spec or {})} for name, spec in entries.items()]
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("'projects' must be a non-empty list or table")
+
+    default_template = str(document.get("template", "basic"))
+    defaults = document.get("variables", {})
+    projects = []
+    seen: set[Path] = set()
+    for number, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not entry.get("name"):
+            raise ValueError(f"project {number} must be a table with a 'name'")
+        variables = entry.get("variables", {})
+        if not isinstance(variables, dict) or not isinstance(defaults, dict):
+            raise ValueError(f"'variables' of project {number} must be a table")
+
+        name = str(entry["name"])
+        path = (directory / str(entry.get("path", name))).absolute()
+        if path in seen:
+            raise ValueError(f"project {number} ('{name}') reuses the path {path}")
+        seen.add(path)
+        projects.append(
+            _ProjectSpec(
+                name=name,
+                template=str(entry.get("template", default_template)),
+                path=path,
+                variables={**defaults, **variables, "name": name},
+            )
+        )
+    return projects
+
+
+def _parse_variables(assignments: list[str]) -> dict[str, str]:
+    """Parse ``KEY=VALUE`` template variables."""
+    from t3.core.templates import TemplateError
+
+    values = {}
+    for assignment in assignments:
+        key, sep, value = assignment.partition("=")
+        if not sep or not key.isidentifier():
+            raise TemplateError(f"Invalid variable '{assignment}' (expected KEY=VALUE)")
+        values[key] = value
+    return values
 
 
 @init_app.command()
 def docker(
     force: bool = typer.Option(
-        False, "--force", "-f", help="Force pull image even if exists"
+        False,
+        "--force",
+        "-f",
+        help="Force pull image even if exists and overwrite a differing config",
     ),
     config_path: str = typer.Option(
         "./config.yaml", "--config", "-c", help="Config file path"
     ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show what would change without writing"
+    ),
+    pull: str | None = typer.Option(
+        None,
+        "--pull",
+        help="Pull policy: always, missing or never (default: pull when missing "
+        "or not checked within T3_CACHE_TTL)",
+        show_default=False,
+    ),
 ) -> None:
     """Initialize Docker environment with T3 Edge Video."""
-    import subprocess
+    import asyncio
 
     import yaml
 
-    console.print("🐳 Initializing Docker environment...", style="bold blue")
+    from t3.core.cache import get_cache
+    from t3.core.docker import (
+        CACHE_NAMESPACE,
+        DEFAULT_IMAGE,
+        PULL_POLICIES,
+        inspect_image,
+        pull_decision,
+        record_pull,
+    )
+    from t3.core.files import CREATED, UNCHANGED, UPDATED, file_action
 
-    # Pull Docker image
-    try:
-        console.print("📥 Pulling Docker image ghcr.io/t3-labs/edge-video:latest...")
-        result = subprocess.run(
-            ["docker", "pull", "ghcr.io/t3-labs/edge-video:latest"],
-            capture_output=True,
-            text=True,
-            check=True,
+    if pull is not None and pull not in PULL_POLICIES:
+        raise typer.BadParameter(
+            f"must be one of: {', '.join(PULL_POLICIES)}", param_hint="--pull"
         )
-        console.print("✅ Docker image pulled successfully!", style="green")
-
-        # Show image info
-        if result.stdout:
-            console.print(result.stdout)
 
-    except subprocess.CalledProcessError as e:
-        console.print(
-            f"⚠️ Warning: Failed to pull Docker image: {e.stderr}", style="yellow"
-        )
-        console.print("💡 Continuing with configuration setup...", style="blue")
-    except FileNotFoundError:
-        console.print(
-            "⚠️ Warning: Docker not found. Continuing with configuration setup...",
-            style="yellow",
-        )
+    renderer = get_renderer()
+    renderer.message(
+        "info", "Initializing Docker environment...", icon="🐳", style="bold blue"
+    )
 
-    # Create config.yaml
     config_file_path = Path(config_path)
+    data = yaml.dump(_DOCKER_CONFIG, default_flow_style=False, indent=2).encode()
 
-    if config_file_path.exists() and not force:
-        if not Confirm.ask(f"Config file '{config_path}' already exists. Overwrite?"):
-            console.print("❌ Config creation cancelled", style="yellow")
+    # Ask before the pull starts: a prompt cannot share the terminal with
+    # the progress display.
+    try:
+        overwrite = file_action(config_file_path, data) == UPDATED
+    except OSError as e:
+        renderer.message("error", f"Failed to read config file: {e}")
+        raise typer.Exit(1) from e
+    if overwrite and not force and not dry_run:
+        if not renderer.confirm(
+            f"Config file '{config_path}' already exists and differs. Overwrite?"
+        ):
+            renderer.message("warning", "Config creation cancelled", icon="❌")
             return
 
-    # Default configuration
-    config_data = {
-        "docker": {
-            "image": "ghcr.io/t3-labs/edge-video:latest",
-            "container_name": "t3-edge-video",
-            "ports": {"web": 8080, "api": 3000, "rtmp": 1935},
-            "volumes": ["./data:/app/data", "./config:/app/config", "./logs:/app/logs"],
-            "environment": {
-                "T3_ENV": "production",
-                "T3_LOG_LEVEL": "INFO",
-                "T3_ENABLE_API": "true",
-                "T3_ENABLE_WEB": "true",
-            },
-        },
-        "video": {
-            "input": {
-                "source": "camera",
-                "resolution": "1920x1080",
-                "fps": 30,
-                "format": "h264",
-            },
-            "processing": {
-                "enable_ai": True,
-                "model": "yolo-v8",
-                "confidence_threshold": 0.5,
-                "batch_size": 4,
-            },
-            "output": {
-                "enable_streaming": True,
-                "enable_recording": False,
-                "output_path": "./recordings",
-                "stream_quality": "high",
-            },
-        },
-        "network": {
-            "api_host": "0.0.0.0",
-            "api_port": 3000,
-            "web_port": 8080,
-            "rtmp_port": 1935,
-            "enable_cors": True,
-        },
-        "storage": {
-            "data_path": "./data",
-            "max_storage_gb": 100,
-            "cleanup_older_than_days": 7,
-        },
-    }
+    # An explicit --pull wins over --force.
+    policy = pull or ("always" if force else None)
+    cache = get_cache(CACHE_NAMESPACE)
+    try:
+        local = inspect_image(DEFAULT_IMAGE)
+        should_pull, reason = pull_decision(DEFAULT_IMAGE, policy, local, cache)
+    except FileNotFoundError:
+        should_pull, reason = False, ""
+        renderer.message(
+            "warning", "Docker not found. Continuing with configuration setup..."
+        )
 
     try:
-        with config_file_path.open("w") as f:
-            yaml.dump(config_data, f, default_flow_style=False, indent=2)
+        if dry_run:
+            action = "pull" if should_pull else "skip pulling"
+            renderer.message(
+                "info",
+                f"Dry run: would {action} {DEFAULT_IMAGE} ({reason or 'no docker'})",
+                icon="📥",
+                style="default",
+            )
+            changes = _write_docker_files(config_file_path, data, dry_run=True)
+        elif should_pull:
+            renderer.message(
+                "info",
+                f"Pulling Docker image {DEFAULT_IMAGE} ({reason})...",
+                icon="📥",
+                style="default",
+            )
+            changes, pulled = asyncio.run(_pull_and_write(config_file_path, data))
+            if pulled:
+                local = inspect_image(DEFAULT_IMAGE)
+                if local is not None:
+                    record_pull(DEFAULT_IMAGE, local, cache)
+        else:
+            if reason:
+                renderer.message(
+                    "info",
+                    f"Skipping docker pull: {reason}",
+                    icon="📥",
+                    style="default",
+                )
+            changes = _write_docker_files(config_file_path, data)
+    except OSError as e:
+        renderer.message("error", f"Failed to create config file: {e}")
+        raise typer.Exit(1) from e
 
-        console.print(
-            f"✅ Configuration file created: {config_file_path.absolute()}",
-            style="green",
-        )
+    if not dry_run:
+        for action, path in changes:
+            if path == config_file_path and action != UNCHANGED:
+                renderer.message(
+                    "success", f"Configuration file {action}: {path.absolute()}"
+                )
+            elif path != config_file_path and action == CREATED:
+                renderer.message(
+                    "info", f"Created directory: {path}", icon="📁", style="cyan"
+                )
+
+    _report_changes(changes, dry_run)
+    if dry_run:
+        return
+
+    # Show usage instructions
+    renderer.message(
+        "success",
+        "\n🚀 Docker environment initialized successfully!",
+        icon="",
+        style="bold green",
+    )
+    renderer.message("info", _DOCKER_NEXT_STEPS, icon="", style="default")
 
-        # Create necessary directories
-        directories = ["data", "config", "logs", "recordings"]
-        for directory in directories:
-            dir_path = Path(directory)
-            dir_path.mkdir(exist_ok=True)
-            console.print(f"📁 Created directory: {dir_path}", style="cyan")
 
-        # Show usage instructions
-        console.print(
-            "\n🚀 Docker environment initialized successfully!", style="bold green"
-        )
-        console.print("\nNext steps:", style="bold")
-        console.print("1. Review and edit the config.yaml file as needed")
-        console.print("2. Run the container:")
-        console.print("   docker run -d --name t3-edge-video \\")
-        console.print("     -p 8080:8080 -p 3000:3000 -p 1935:1935 \\")
-        console.print("     -v $(pwd)/data:/app/data \\")
-        console.print("     -v $(pwd)/config:/app/config \\")
-        console.print("     -v $(pwd)/logs:/app/logs \\")
-        console.print(
-            "     --env-file <(grep -v '^#' config.yaml | grep '=' || true) \\"
-        )
-        console.print("     ghcr.io/t3-labs/edge-video:latest")
-        console.print("3. Access the web interface at http://localhost:8080")
-        console.print("4. Use API endpoints at http://localhost:3000")
+async def _pull_and_write(
+    config_file_path: Path, data: bytes
+) -> tuple[list[tuple[str, Path]], bool]:
+    """
+    Pull the image while the config and directories are written.
+
+    Returns the file changes and whether the pull succeeded.
+    """
+    import asyncio
+
+    from t3.core.docker import DEFAULT_IMAGE, PullProgress, pull_image
 
-    except ImportError:
-        console.print("❌ PyYAML not found. Installing PyYAML...", style="yellow")
+    renderer = get_renderer()
+    tracker = PullProgress()
+    with renderer.progress() as progress:
+        task = progress.add_task("Pulling image", total=None)
+
+        def on_line(line: str) -> None:
+            if tracker.feed(line):
+                progress.update(
+                    task,
+                    description=f"Pulling image ({line[:40]})",
+                    total=tracker.total,
+                    completed=tracker.completed,
+                )
+
+        pull = asyncio.create_task(pull_image(DEFAULT_IMAGE, on_line))
         try:
-            subprocess.run(["pip", "install", "pyyaml"], check=True)
-            console.print("✅ PyYAML installed successfully!", style="green")
-            # Retry creating config file
-            docker(force, config_path)
-        except subprocess.CalledProcessError:
-            console.print(
-                "❌ Failed to install PyYAML. "
-                "Please install manually: pip install pyyaml",
-                style="red",
+            changes = await asyncio.to_thread(
+                _write_docker_files, config_file_path, data
             )
-            raise typer.Exit(1) from None
-    except Exception as e:
-        console.print(f"❌ Failed to create config file: {e}", style="red")
-        raise typer.Exit(1) from e
+        except BaseException:
+            pull.cancel()
+            await asyncio.gather(pull, return_exceptions=True)
+            raise
+
+        try:
+            result = await pull
+        except FileNotFoundError:
+            result = None
+        if result is not None and result.returncode == 0:
+            layers = tracker.total or 1
+            progress.update(
+                task, description="Pulled image", total=layers, completed=layers
+            )
+
+    if result is None:
+        renderer.message(
+            "warning", "Docker not found. Continuing with configuration setup..."
+        )
+    elif result.returncode != 0:
+        details = "\n".join(result.tail)
+        renderer.message("warning", f"Failed to pull Docker image: {details}")
+        renderer.message("info", "Continuing with configuration setup...", icon="💡")
+    else:
+        digest = f" ({result.digest})" if result.digest else ""
+        renderer.message("success", f"Docker image pulled successfully!{digest}")
+    return changes, result is not None and result.returncode == 0
+
+
+def _write_docker_files(
+    config_file_path: Path, data: bytes, dry_run: bool = False
+) -> list[tuple[str, Path]]:
+    """Sync config.yaml and create the data directories."""
+    from t3.core.files import CREATED, UNCHANGED, sync_file
+
+    changes = [(sync_file(config_file_path, data, dry_run=dry_run), config_file_path)]
+    for directory in _DOCKER_DIRECTORIES:
+        dir_path = Path(directory)
+        if dir_path.is_dir():
+            changes.append((UNCHANGED, dir_path))
+            continue
+        changes.append((CREATED, dir_path))
+        if not dry_run:
+            dir_path.mkdir(exist_ok=True)
+    return changes
@@ -0,0 +1,160 @@
+"""Recording and data storage commands."""
+
+from pathlib import Path
+
+import typer
+
+from t3.core.output import get_renderer
+from t3.core.storage import (
+    DAY,
+    DEFAULT_CONFIG,
+    DEFAULT_WORKERS,
+    GIGABYTE,
+    GcReport,
+    StoragePolicy,
+    collect_garbage,
+    storage_policy,
+)
+from t3.core.utils import format_size
+
+storage_app = typer.Typer(help="Recording and data storage tools")
+
+# Unreadable or undeletable files listed before the rest are summarized.
+_MAX_ERRORS_SHOWN = 5
+
+
+@storage_app.command()
+def gc(
+    config_path: Path = typer.Option(
+        Path(DEFAULT_CONFIG), "--config", "-c", help="Config written by t3 init docker"
+    ),
+    paths: list[Path] | None = typer.Option(
+        None, "--path", "-p", help="Directory to clean instead of the configured ones"
+    ),
+    max_gb: float | None = typer.Option(
+        None, "--max-gb", help="Quota in GB [default: max_storage_gb]"
+    ),
+    older_than_days: float | None = typer.Option(
+        None,
+        "--older-than-days",
+        help="Age cutoff [default: cleanup_older_than_days]",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show what would be deleted without deleting"
+    ),
+    workers: int = typer.Option(
+        DEFAULT_WORKERS, "--workers", "-j", min=1, help="Directories scanned at once"
+    ),
+) -> None:
+    """Delete old files, then the oldest ones until storage fits its quota."""
+    for value, hint in ((max_gb, "--max-gb"), (older_than_days, "--older-than-days")):
+        if value is not None and value <= 0:
+            raise typer.BadParameter("must be a positive number", param_hint=hint)
+
+    renderer = get_renderer()
+    policy = _load_policy(config_path, paths)
+    if max_gb is not None:
+        policy = policy._replace(max_bytes=round(max_gb * GIGABYTE))
+    if older_than_days is not None:
+        policy = policy._replace(max_age=older_than_days * DAY)
+    existing = tuple(path for path in policy.paths if path.is_dir())
+    for path in policy.paths:
+        if path not in existing:
+            renderer.message("warning", f"Skipping {path}: not a directory")
+    if policy.max_bytes is None and policy.max_age is None:
+        renderer.message(
+            "error", "No limits: set max_storage_gb or cleanup_older_than_days"
+        )
+        raise typer.Exit(1)
+
+    with renderer.progress() as progress:
+        task = progress.add_task("Scanning files", total=None)
+        report = collect_garbage(
+            policy._replace(paths=existing),
+            dry_run,
+            workers,
+            on_batch=lambda files: progress.advance(task, files),
+        )
+
+    _print_report(policy, report, dry_run)
+    over_quota = (
+        policy.max_bytes is not None and report.remaining_bytes > policy.max_bytes
+    )
+    if report.errors or (over_quota and not dry_run):
+        raise typer.Exit(1)
+
+
+def _load_policy(config_path: Path, paths: list[Path] | None) -> StoragePolicy:
+    """Get the configured policy, with ``--path`` replacing its directories."""
+    renderer = get_renderer()
+    if not config_path.is_file():
+        if not paths:
+            renderer.message(
+                "error", f"{config_path} not found; run t3 init docker or use --path"
+            )
+            raise typer.Exit(1)
+        return StoragePolicy(tuple(paths), None, None)
+
+    from t3.core.config_io import detect_format, load_document
+
+    try:
+        with open(config_path, encoding="utf-8") as stream:
+            config = load_document(stream, detect_format(str(config_path), "yaml"))
+        policy = storage_policy(config, config_path.parent)
+    except (OSError, ValueError) as e:
+        renderer.message("error", f"Cannot read {config_path}: {e}")
+        raise typer.Exit(1) from e
+    return policy._replace(paths=tuple(paths)) if paths else policy
+
+
+def _print_report(policy: StoragePolicy, report: GcReport, dry_run: bool) -> None:
+    """Print what was (or would be) deleted and any failures."""
+    renderer = get_renderer()
+    if renderer.structured:
+        renderer.record(
+            {
+                "paths": [str(path) for path in policy.paths],
+                "dry_run": dry_run,
+                "max_bytes": policy.max_bytes,
+                "max_age_days": (
+                    policy.max_age / DAY if policy.max_age is not None else None
+                ),
+                "files": report.files,
+                "bytes": report.bytes,
+                "expired_files": report.expired_files,
+                "expired_bytes": report.expired_bytes,
+                "evicted_files": report.evicted_files,
+                "evicted_bytes": report.evicted_bytes,
+                "remaining_bytes": report.remaining_bytes,
+                "errors": [str(error) for error in report.errors],
+            }
+        )
+        return
+
+    verb = "Would delete" if dry_run else "Deleted"
+    quota = format_size(policy.max_bytes) if policy.max_bytes is not None else "none"
+    cutoff = f"{policy.max_age / DAY:g} days" if policy.max_age is not None else "none"
+    renderer.record(
+        {
+            "Scanned": f"{report.files} file(s), {format_size(report.bytes)}",
+            f"{verb} (older than {cutoff})": (
+                f"{report.expired_files} file(s), {format_size(report.expired_bytes)}"
+            ),
+            f"{verb} (over {quota} quota)": (
+                f"{report.evicted_files} file(s), {format_size(report.evicted_bytes)}"
+            ),
+            "Remaining": format_size(report.remaining_bytes),
+        },
+        title="Storage Cleanup (dry run)" if dry_run else "Storage Cleanup",
+    )
+    for error in report.errors[:_MAX_ERRORS_SHOWN]:
+        renderer.message("warning", str(error))
+    if len(report.errors) > _MAX_ERRORS_SHOWN:
+        renderer.message(
+            "warning", f"... and {len(report.errors) - _MAX_ERRORS_SHOWN} more error(s)"
+        )
+    if policy.max_bytes is not None and report.remaining_bytes > policy.max_bytes:
+        renderer.message(
+            "error",
+            f"Still {format_size(report.remaining_bytes)}, over the {quota} quota",
+        )
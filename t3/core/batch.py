@@ -0,0 +1,50 @@
+"""Batch command parsing for T3 CLI."""
+
+import json
+import shlex
+
+
+def parse_batch(text: str) -> list[list[str]]:
+    """
+    Parse batch input into argument vectors.
+
+    Input is either a JSON array, whose items are command strings or argument
+    lists, or newline-delimited command lines where blank lines and ``#``
+    comments are ignored. A leading ``t3`` token is optional.
+
+    Args:
+        text (str): The batch input.
+
+    Returns:
+        list[list[str]]: One argument vector per command.
+
+    Raises:
+        ValueError: If the input cannot be parsed.
+    """
+    if text.lstrip().startswith("["):
+        try:
+            items = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON batch: {e}") from e
+        commands = [_json_item_to_argv(item, index) for index, item in enumerate(items)]
+    else:
+        commands = []
+        for line_number, line in enumerate(text.splitlines(), start=1):
+            try:
+                argv = shlex.split(line, comments=True)
+            except ValueError as e:
+                raise ValueError(f"Line {line_number}: {e}") from e
+            if argv:
+                commands.append(argv)
+
+    commands = [argv[1:] if argv[:1] == ["t3"] else argv for argv in commands]
+    return [argv for argv in commands if argv]
+
+
+def _json_item_to_argv(item: object, index: int) -> list[str]:
+    """Convert a JSON batch item into an argument vector."""
+    if isinstance(item, str):
+        return shlex.split(item)
+    if isinstance(item, list) and all(isinstance(arg, str) for arg in item):
+        return list(item)
+    raise ValueError(f"Item {index}: expected a string or a list of strings")
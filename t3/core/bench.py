@@ -0,0 +1,204 @@
+"""Startup benchmarking helpers for T3 CLI."""
+
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+DEFAULT_STARTUP_COMMANDS: dict[str, list[str]] = {
+    "--version": ["--version"],
+    "status": ["status"],
+    "config get": ["config", "get", "bench.probe"],
+    "init project --help": ["init", "project", "--help"],
+}
+
+
+@dataclass
+class ImportTiming:
+    """Aggregated import time for a single module, in microseconds."""
+
+    module: str
+    self_us: float
+    cumulative_us: float
+
+
+@dataclass
+class StartupResult:
+    """Wall-time and import statistics for one benchmarked command."""
+
+    name: str
+    argv: list[str]
+    runs: int
+    exit_code: int
+    p50_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+    imports: list[ImportTiming] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the result to a JSON-serializable dictionary.
+
+        Returns:
+            dict[str, Any]: The result data.
+        """
+        return asdict(self)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Compute a percentile using linear interpolation between closest ranks.
+
+    Args:
+        values (list[float]): Sample values; must not be empty.
+        pct (float): Percentile in the range 0-100.
+
+    Returns:
+        float: The interpolated percentile.
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def parse_importtime(output: str) -> dict[str, tuple[int, int]]:
+    """
+    Parse ``python -X importtime`` output.
+
+    Args:
+        output (str): The stderr of an interpreter run with ``-X importtime``.
+
+    Returns:
+        dict[str, tuple[int, int]]: Module name to (self, cumulative) microseconds.
+    """
+    timings: dict[str, tuple[int, int]] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+
+        module = fields[2].strip()
+        timings[module] = (int(fields[0]), int(fields[1]))
+    return timings
+
+
+def aggregate_imports(
+    samples: Iterable[dict[str, tuple[int, int]]], top: int | None = None
+) -> list[ImportTiming]:
+    """
+    Average import timings over several runs, slowest self time first.
+
+    Args:
+        samples (Iterable[dict[str, tuple[int, int]]]): Parsed importtime runs.
+        top (int | None): Keep only the slowest ``top`` modules.
+
+    Returns:
+        list[ImportTiming]: Aggregated timings sorted by self time.
+    """
+    totals: dict[str, list[int]] = {}
+    run_count = 0
+    for sample in samples:
+        run_count += 1
+        for module, (self_us, cumulative_us) in sample.items():
+            entry = totals.setdefault(module, [0, 0])
+            entry[0] += self_us
+            entry[1] += cumulative_us
+
+    if not run_count:
+        return []
+
+    timings = [
+        ImportTiming(module, self_total / run_count, cumulative_total / run_count)
+        for module, (self_total, cumulative_total) in totals.items()
+    ]
+    timings.sort(key=lambda timing: timing.self_us, reverse=True)
+    return timings[:top] if top else timings
+
+
+def _launch(argv: list[str], import_profile: bool) -> tuple[float, int, str]:
+    """
+    Run the CLI in a fresh interpreter.
+
+    Args:
+        argv (list[str]): Arguments passed to ``t3``.
+        import_profile (bool): Whether to enable ``-X importtime``.
+
+    Returns:
+        tuple[float, int, str]: Wall time in ms, exit code and stderr.
+    """
+    command = [sys.executable]
+    if import_profile:
+        command += ["-X", "importtime"]
+    command += ["-m", "t3", *argv]
+
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    started = time.perf_counter()
+    completed = subprocess.run(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE if import_profile else subprocess.DEVNULL,
+        text=True,
+        env=env,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return elapsed_ms, completed.returncode, completed.stderr or ""
+
+
+def benchmark_startup(
+    name: str,
+    argv: list[str],
+    runs: int = 10,
+    import_runs: int = 3,
+    top: int | None = 15,
+) -> StartupResult:
+    """
+    Benchmark fresh interpreter launches of a single ``t3`` invocation.
+
+    Wall time is measured on plain launches; the import breakdown comes from
+    separate ``-X importtime`` launches so profiling does not skew timings.
+
+    Args:
+        name (str): Label for the benchmarked command.
+        argv (list[str]): Arguments passed to ``t3``.
+        runs (int): Number of timed launches.
+        import_runs (int): Number of ``-X importtime`` launches.
+        top (int | None): Number of modules kept in the import breakdown.
+
+    Returns:
+        StartupResult: The aggregated statistics; ``exit_code`` is that of
+            the first failed launch, or 0 if all succeeded.
+    """
+    wall_times: list[float] = []
+    exit_code = 0
+    for _ in range(runs):
+        elapsed_ms, code, _stderr = _launch(argv, import_profile=False)
+        wall_times.append(elapsed_ms)
+        # Report the first failure, not whatever the last launch returned.
+        exit_code = exit_code or code
+
+    import_samples = [
+        parse_importtime(_launch(argv, import_profile=True)[2])
+        for _ in range(import_runs)
+    ]
+
+    return StartupResult(
+        name=name,
+        argv=argv,
+        runs=runs,
+        exit_code=exit_code,
+        p50_ms=round(percentile(wall_times, 50), 2),
+        p95_ms=round(percentile(wall_times, 95), 2),
+        min_ms=round(min(wall_times), 2),
+        max_ms=round(max(wall_times), 2),
+        imports=aggregate_imports(import_samples, top),
+    )
@@ -0,0 +1,208 @@
+"""On-disk cache for derived data in ``T3_CACHE_DIR``.
+
+Entries are files named ``<namespace>-<key>.marshal`` holding a small
+header with their creation time, then a marshalled value. An entry older
+than ``T3_CACHE_TTL`` seconds is a miss; a hit refreshes the file's
+modification time, so that when the cache directory grows past
+``T3_CACHE_MAX_MB`` the least recently used entries are evicted first.
+``T3_CACHE_ENABLED`` set to ``false``, ``0``, ``no`` or ``off`` disables
+caching.
+
+Everything stored here can be recomputed, so entries are written without
+fsync and unreadable entries are treated as misses.
+"""
+
+import marshal
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any
+
+from t3.core.files import atomic_write_bytes
+
+CACHE_SUFFIX = ".marshal"
+
+# Identifies the entry layout; entries written with another one are misses.
+_FORMAT = 1
+
+# Entry header: layout version and creation time (seconds since the epoch).
+_HEADER = struct.Struct("<Id")
+
+
+class DiskCache:
+    """A namespace of entries in the cache directory."""
+
+    def __init__(
+        self,
+        namespace: str,
+        directory: Path,
+        ttl: float = 3600,
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            namespace (str): Prefix of this cache's entry files.
+            directory (Path): The cache directory; created on first write.
+            ttl (float): Seconds an entry stays valid; 0 or less for no
+                expiry.
+            max_bytes (int): Size the whole directory is trimmed to after a
+                write; 0 or less for no limit.
+        """
+        self.namespace = namespace
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    def path(self, key: str) -> Path:
+        """
+        Get the file of an entry.
+
+        Args:
+            key (str): The entry key, usable in a file name (e.g. a digest).
+
+        Returns:
+            Path: The entry file.
+        """
+        return self.directory / f"{self.namespace}-{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Any:
+        """
+        Read an entry.
+
+        Args:
+            key (str): The entry key.
+
+        Returns:
+            Any: The stored value, or None if it is missing, expired or
+                unreadable.
+        """
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+            version, created = _HEADER.unpack_from(data)
+            if version != _FORMAT:
+                return None
+            if self.ttl > 0 and time.time() - created > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            # One read and loads(): marshal.load() on a file reads it in
+            # many small pieces.
+            value = marshal.loads(memoryview(data)[_HEADER.size :])
+            os.utime(path)
+        except (OSError, ValueError, EOFError, TypeError, struct.error):
+            return None
+        return value
+
+    def age(self, key: str) -> float | None:
+        """
+        Get how long ago an entry was stored.
+
+        Args:
+            key (str): The entry key.
+
+        Returns:
+            float | None: Seconds since the entry was written, or None if it
+                is missing or unreadable. Expiry is not applied.
+        """
+        try:
+            with self.path(key).open("rb") as stream:
+                version, created = _HEADER.unpack(stream.read(_HEADER.size))
+        except (OSError, struct.error):
+            return None
+        return None if version != _FORMAT else time.time() - created
+
+    def put(self, key: str, value: Any) -> bool:
+        """
+        Store an entry, then trim the directory to its size limit.
+
+        Args:
+            key (str): The entry key.
+            value (Any): A marshal-serializable value (plain tuples, lists,
+                dicts, strings, bytes and numbers).
+
+        Returns:
+            bool: True if the entry was stored; failures are not errors.
+        """
+        try:
+            data = _HEADER.pack(_FORMAT, time.time()) + marshal.dumps(value)
+            atomic_write_bytes(self.path(key), data, mode=0o600, durable=False)
+        except (OSError, ValueError):
+            return False
+        if self.max_bytes > 0:
+            self.evict()
+        return True
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry if it exists.
+
+        Args:
+            key (str): The entry key.
+        """
+        self.path(key).unlink(missing_ok=True)
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the directory fits.
+
+        Every namespace shares the size limit, so entries of other caches
+        in the directory may be removed too.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if not entry.name.endswith(CACHE_SUFFIX):
+                        continue
+                    try:
+                        stat_result = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append((stat_result.st_mtime_ns, entry.path))
+                    total += stat_result.st_size
+        except OSError:
+            return 0
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for _, path in sorted(entries):
+            try:
+                total -= os.stat(path).st_size
+                os.unlink(path)
+            except OSError:
+                continue
+            removed += 1
+            if total <= self.max_bytes:
+                break
+        return removed
+
+
+def get_cache(namespace: str) -> DiskCache | None:
+    """
+    Open a cache namespace with the effective cache settings.
+
+    Args:
+        namespace (str): Prefix of the cache's entry files.
+
+    Returns:
+        DiskCache | None: The cache, or None if caching is disabled.
+    """
+    from t3.core.config import parse_bool
+    from t3.core.layers import get_setting
+
+    if not parse_bool(get_setting("cache_enabled", True), default=True):
+        return None
+    return DiskCache(
+        namespace,
+        Path(str(get_setting("cache_dir", "~/.t3/cache"))).expanduser(),
+        ttl=float(get_setting("cache_ttl", 3600)),
+        max_bytes=int(float(get_setting("cache_max_mb", 256)) * 1024 * 1024),
+    )
@@ -1,13 +1,237 @@
 """Configuration handler for T3 CLI."""
 
 import json
+import os
+import stat
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+from t3.core.files import atomic_write_text
+from t3.core.journal import (
+    Operation,
+    append_journal,
+    config_lock,
+    encode_operations,
+    journal_path,
+    read_journal,
+    remove_journal,
+    should_compact,
+)
+from t3.core.snapshot import read_snapshot, remove_snapshot, write_snapshot
+
+FileSignature = tuple[int, int, int]
+
+# (config file signature, journal signature, replayed journal bytes).
+LoadedState = tuple[FileSignature, FileSignature | None, int]
+
+# Loaded documents shared by every ConfigManager in the process, keyed by
+# path and validated against the (st_mtime_ns, st_size, st_ino) signatures
+# of the file and its journal.
+_document_cache: dict[Path, tuple[LoadedState, dict[str, Any]]] = {}
+
+_TRUE_WORDS = frozenset({"1", "true", "yes", "on"})
+
+_FALSE_WORDS = frozenset({"0", "false", "no", "off"})
+
+# Process-wide managers handed out by get_config(), keyed by path.
+_managers: dict[Path, "ConfigManager"] = {}
+
+
+class ConfigConflictError(RuntimeError):
+    """Raised when changes cannot be applied on top of another process's."""
+
+
+def file_signature(path: Path) -> FileSignature | None:
+    """
+    Get a cheap change signature for a file.
+
+    Args:
+        path (Path): The file to inspect.
+
+    Returns:
+        FileSignature | None: ``(st_mtime_ns, st_size, st_ino)``, or None if
+            the file does not exist or cannot be inspected.
+    """
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+
+
+def same_value(old: Any, new: Any) -> bool:
+    """
+    Check whether two configuration values are the same, including types.
+
+    Unlike ``==``, ``1``, ``1.0`` and ``true`` are different values, in
+    sections and lists too.
+
+    Args:
+        old (Any): The first value.
+        new (Any): The second value.
+
+    Returns:
+        bool: True if both have the same type and content.
+    """
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(
+            same_value(value, new[key]) for key, value in old.items()
+        )
+    if isinstance(old, list):
+        return len(old) == len(new) and all(
+            same_value(a, b) for a, b in zip(old, new, strict=True)
+        )
+    return old == new
+
+
+def get_config(config_path: str | None = None) -> "ConfigManager":
+    """
+    Get the process-wide configuration manager for a path.
+
+    The manager is created on first use and revalidated against the file's
+    signature on every later call, so long-lived processes see changes made
+    by others without re-parsing an unchanged file.
+
+    Args:
+        config_path (str | None): Path to the configuration file.
+                                 If None, uses default location.
+
+    Returns:
+        ConfigManager: The shared configuration manager.
+    """
+    path = Path(config_path) if config_path else default_config_path()
+    manager = _managers.get(path)
+    if manager is None:
+        manager = _managers[path] = ConfigManager(str(path))
+    else:
+        manager.refresh()
+    return manager
+
+
+def cached_manager(config_path: str | Path | None = None) -> "ConfigManager | None":
+    """
+    Get the process-wide manager for a path if one was created.
+
+    Unlike :func:`get_config`, nothing is loaded or revalidated.
+
+    Args:
+        config_path (str | Path | None): Path to the configuration file.
+                                        If None, uses default location.
+
+    Returns:
+        ConfigManager | None: The manager, or None if the path has not
+            been opened through :func:`get_config`.
+    """
+    return _managers.get(Path(config_path) if config_path else default_config_path())
+
+
+def parse_value(text: str) -> Any:
+    """
+    Parse a command-line value into a typed configuration value.
+
+    JSON literals (numbers, ``true``/``false``/``null``, lists, objects and
+    quoted strings) are decoded; anything else is kept as a plain string, so
+    ``8080`` becomes an int while ``007`` and ``hello`` stay strings.
+
+    Args:
+        text (str): The raw value.
+
+    Returns:
+        Any: The parsed value.
+    """
+    lowered = text.strip().lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+
+    try:
+        return json.loads(text, parse_constant=_reject_constant)
+    except ValueError:
+        return text
+
+
+def parse_bool(value: Any, default: bool = False) -> bool:
+    """
+    Interpret a setting as a boolean flag.
+
+    Strings from the environment or ``config set`` are matched
+    case-insensitively: ``1``, ``true``, ``yes`` and ``on`` are true;
+    ``0``, ``false``, ``no`` and ``off`` are false.
+
+    Args:
+        value (Any): A bool, number, string or None.
+        default (bool): The result for None, an empty string or an
+            unrecognized value.
+
+    Returns:
+        bool: The flag.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int | float):
+        return value != 0
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_WORDS:
+            return True
+        if lowered in _FALSE_WORDS:
+            return False
+    return default
+
+
+def _reject_constant(name: str) -> Any:
+    """Refuse ``NaN``/``Infinity`` so they are kept as strings."""
+    raise ValueError(f"Unsupported constant: {name}")
+
+
+def _copy_tree(value: Any) -> Any:
+    """Copy nested dicts and lists, sharing the immutable leaves."""
+    if isinstance(value, dict):
+        return {key: _copy_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(item) for item in value]
+    return value
+
+
+def _iter_tree(path: str, value: Any) -> Iterator[tuple[str, Any]]:
+    """Yield ``(path, value)`` for a node and every node below it."""
+    yield path, value
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _iter_tree(f"{path}.{key}" if path else key, item)
+
+
+def default_config_path() -> Path:
+    """
+    Get the default configuration file path for the current user.
+
+    Returns:
+        Path: ``T3_CONFIG_PATH`` if set, otherwise ``~/.t3/config.json``.
+    """
+    configured = os.environ.get("T3_CONFIG_PATH")
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".t3" / "config.json"
+
 
 class ConfigManager:
     """
     A class to handle configuration management for T3 CLI.
+
+    Keys are dotted paths into a nested document: ``video.processing.fps``
+    addresses ``{"video": {"processing": {"fps": ...}}}``. A flat index maps
+    every path to the dict holding it, so lookups are O(1) and listing a
+    subtree costs O(k) in its size; the index is built lazily and updated
+    incrementally on every change.
+
+    Changes are recorded as operations and committed under an inter-process
+    lock: if another process changed the file meanwhile, it is reloaded and
+    the operations are re-applied, so concurrent writers do not lose each
+    other's updates. Large files get the operations appended to a journal
+    instead of being rewritten (see ``t3.core.journal``).
     """
 
     def __init__(self, config_path: str | None = None) -> None:
@@ -18,81 +242,501 @@ class ConfigManager:
             config_path (str | None): Path to the configuration file.
                                      If None, uses default location.
         """
-        self.config_path = (
-            Path(config_path) if config_path else Path.home() / ".t3" / "config.json"
-        )
-        self._config_data: dict[str, Any] = {}
+        self.config_path = Path(config_path) if config_path else default_config_path()
+        self._document: dict[str, Any] = {}
+        self._index: dict[str, tuple[dict[str, Any], str]] | None = None
+        self._owned = True
+        self._owned_sections: set[int] = set()
+        self._signature: FileSignature | None = None
+        self._journal_signature: FileSignature | None = None
+        self._journal_offset = 0
+        self._pending: list[Operation] = []
+        self._dirty = False
+        self._transaction_depth = 0
         self.load_config()
 
+    @property
+    def dirty(self) -> bool:
+        """bool: Whether there are changes not yet written to disk."""
+        return self._dirty
+
+    @property
+    def document(self) -> dict[str, Any]:
+        """dict[str, Any]: The loaded document; it may be shared, never modify it."""
+        return self._document
+
+    @property
+    def _config_data(self) -> dict[str, Any]:
+        """dict[str, Any]: The configuration document."""
+        return self._document
+
+    @_config_data.setter
+    def _config_data(self, document: dict[str, Any]) -> None:
+        self._document = document
+        self._index = None
+        self._owned = True
+
+    def _share(self, document: dict[str, Any]) -> None:
+        """Adopt a document that is shared with the process-wide cache."""
+        self._document = document
+        self._index = None
+        self._disown()
+
+    def _disown(self) -> None:
+        """Treat every section as shared, so changes copy before writing."""
+        self._owned = False
+        self._owned_sections = set()
+
     def load_config(self) -> None:
-        """Load configuration from file."""
+        """
+        Load configuration from file, reusing a cached parse if unchanged.
+
+        A parse is reused from the process-wide cache or, for large files,
+        from the compiled snapshot next to the file; otherwise the JSON is
+        parsed and the snapshot refreshed. Journaled changes are replayed on
+        top. Pending changes are discarded.
+        """
+        with config_lock(self.config_path, exclusive=False):
+            self._load_unlocked()
+
+    def _load_unlocked(self) -> None:
+        """Load the file and its journal; the caller holds the lock."""
+        self._dirty = False
+        self._pending = []
+        self._signature = None
+        self._journal_signature = None
+        self._journal_offset = 0
         if not self.config_path.exists():
             self._config_data = {}
             return
 
-        try:
-            with self.config_path.open("r") as config_file:
-                self._config_data = json.load(config_file)
-        except (json.JSONDecodeError, OSError):
-            self._config_data = {}
+        signature = file_signature(self.config_path)
+        journal_signature = file_signature(journal_path(self.config_path))
+        cached = _document_cache.get(self.config_path)
+        if (
+            signature is not None
+            and cached is not None
+            and cached[0][:2] == (signature, journal_signature)
+        ):
+            self._share(cached[1])
+            self._signature, self._journal_signature, self._journal_offset = cached[0]
+            return
+
+        document = None
+        if signature is not None:
+            document = read_snapshot(self.config_path, signature)
+
+        if document is None:
+            try:
+                with self.config_path.open("r") as config_file:
+                    document = json.load(config_file)
+            except (json.JSONDecodeError, OSError):
+                self._config_data = {}
+                return
+            if not isinstance(document, dict):
+                document = {}
+
+            # Only trust the signature if the file did not change while reading.
+            if signature is None or file_signature(self.config_path) != signature:
+                self._config_data = document
+                return
+            write_snapshot(self.config_path, signature, document)
+
+        self._config_data = document
+        if journal_signature is not None:
+            operations, self._journal_offset = read_journal(self.config_path)
+            for operation in operations:
+                try:
+                    self._apply(operation)
+                except ValueError:
+                    continue
+
+        self._signature = signature
+        self._journal_signature = journal_signature
+        self._cache()
+
+    def _cache(self) -> None:
+        """Share the current document through the process-wide cache."""
+        if self._signature is None:
+            return
+        state = (self._signature, self._journal_signature, self._journal_offset)
+        _document_cache[self.config_path] = (state, self._document)
+        self._disown()
+
+    def _disk_state(self) -> tuple[FileSignature | None, FileSignature | None]:
+        """Get the current signatures of the file and its journal."""
+        return (
+            file_signature(self.config_path),
+            file_signature(journal_path(self.config_path)),
+        )
+
+    def refresh(self) -> None:
+        """
+        Reload the configuration if the file changed since it was loaded.
+
+        Pending changes inside a transaction are kept. Outside a transaction,
+        a dirty state can only come from a failed write and is discarded.
+        """
+        if self._transaction_depth:
+            return
+        if self._dirty or self._disk_state() != (
+            self._signature,
+            self._journal_signature,
+        ):
+            self.load_config()
 
     def save_config(self) -> None:
-        """Save configuration to file."""
+        """
+        Write pending changes to disk.
+
+        Runs under an exclusive lock. If another process changed the file
+        since it was loaded, it is reloaded and the pending operations are
+        re-applied on top. Small files are then rewritten atomically; large
+        ones get the operations appended to the journal, which is folded
+        back into the file once it grows past a fraction of its size.
+
+        Raises:
+            ConfigConflictError: If the pending changes no longer apply to
+                the file as another process left it.
+        """
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        with config_lock(self.config_path, exclusive=True):
+            if self._disk_state() != (self._signature, self._journal_signature):
+                self._rebase()
+
+            base_size = self._signature[1] if self._signature else 0
+            journal_size = self._journal_signature[1] if self._journal_signature else 0
+            data = b""
+            if self._pending and not should_compact(base_size, journal_size):
+                data = encode_operations(self._pending)
+
+            if not data or should_compact(base_size, journal_size + len(data)):
+                self._write_base()
+            else:
+                mode = stat.S_IMODE(self.config_path.stat().st_mode)
+                append_journal(self.config_path, data, mode)
+                self._journal_signature = file_signature(journal_path(self.config_path))
+                if self._journal_signature is not None:
+                    self._journal_offset = self._journal_signature[1]
+
+        self._pending = []
+        self._dirty = False
+        self._cache()
+
+    def _rebase(self) -> None:
+        """Reload the file and re-apply pending operations on top of it."""
+        pending = self._pending
+        if not pending:
+            raise ConfigConflictError(
+                f"{self.config_path} was modified by another process"
+            )
+
+        self._load_unlocked()
+        self._dirty = True
+        try:
+            for operation in pending:
+                self._apply(operation)
+        except ValueError as e:
+            raise ConfigConflictError(
+                f"{self.config_path} was modified by another process: {e}"
+            ) from e
+        self._pending = pending
+
+    def _write_base(self) -> None:
+        """Rewrite the file with the whole document and drop the journal."""
+        atomic_write_text(self.config_path, json.dumps(self._document, indent=2))
+        remove_journal(self.config_path)
+        self._signature = file_signature(self.config_path)
+        self._journal_signature = None
+        self._journal_offset = 0
+        if self._signature is not None:
+            write_snapshot(self.config_path, self._signature, self._document)
+
+    @contextmanager
+    def transaction(self) -> Iterator["ConfigManager"]:
+        """
+        Group several changes into a single write.
+
+        Changes made inside the block are written once when the outermost
+        transaction exits, and only if something actually changed. If the
+        block raises, the in-memory configuration is rolled back.
+
+        Yields:
+            ConfigManager: This configuration manager.
+        """
+        if self._transaction_depth == 0:
+            # Changes inside the block copy the sections they touch, so the
+            # snapshot stays untouched for a rollback.
+            snapshot = (self._document, self._dirty, len(self._pending))
+            self._disown()
+
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                document, self._dirty, pending_count = snapshot
+                del self._pending[pending_count:]
+                self._share(document)
+            raise
+
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0 and self._dirty:
+            self.save_config()
+
+    def _commit(self, operation: Operation) -> None:
+        """Record a change and write it unless a transaction defers it."""
+        self._pending.append(operation)
+        self._dirty = True
+        if self._transaction_depth == 0:
+            self.save_config()
+
+    def _apply(self, operation: Operation) -> None:
+        """Apply a recorded operation to the document."""
+        if operation[0] == "set":
+            self._apply_set(operation[1], operation[2])
+        elif operation[0] == "delete":
+            self._apply_delete(operation[1])
+        elif operation[0] == "clear":
+            self._config_data = {}
+
+    def _path_index(self) -> dict[str, tuple[dict[str, Any], str]]:
+        """Get the path index, building it on first use."""
+        if self._index is None:
+            self._index = {}
+            self._index_subtree("", self._document)
+        return self._index
+
+    def _index_subtree(self, prefix: str, container: dict[str, Any]) -> None:
+        """Add every path below a container to the index."""
+        assert self._index is not None
+        for key, value in container.items():
+            path = f"{prefix}.{key}" if prefix else key
+            self._index[path] = (container, key)
+            if isinstance(value, dict):
+                self._index_subtree(path, value)
+
+    def _unindex_subtree(self, path: str, value: Any) -> None:
+        """Remove a path and every path below it from the index."""
+        assert self._index is not None
+        for subpath, _ in _iter_tree(path, value):
+            self._index.pop(subpath, None)
+
+    def _make_owned(self, key: str) -> None:
+        """
+        Copy the shared sections leading to a path before changing it.
+
+        Only the sections along the path are copied (path copying), so the
+        first change to a large shared document costs the width of those
+        sections rather than the size of the whole document.
+        """
+        if self._owned:
+            return
+
+        index = self._path_index()
+        parent: dict[str, Any] | None = None
+        container = self._document
+        prefix = ""
+        for part in [None, *key.split(".")[:-1]]:
+            if part is not None:
+                prefix = f"{prefix}.{part}" if prefix else part
+                parent, container = container, container.get(part)
+                if not isinstance(container, dict):
+                    return
 
-        with self.config_path.open("w") as config_file:
-            json.dump(self._config_data, config_file, indent=2)
+            if id(container) not in self._owned_sections:
+                container = dict(container)
+                self._owned_sections.add(id(container))
+                if parent is None:
+                    self._document = container
+                else:
+                    parent[part] = container
+                for name in container:
+                    index[f"{prefix}.{name}" if prefix else name] = (container, name)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value.
 
         Args:
-            key (str): The configuration key.
+            key (str): The configuration key, as a dotted path.
             default (Any): Default value if key not found.
 
         Returns:
             Any: The configuration value or default.
         """
-        return self._config_data.get(key, default)
+        entry = self._path_index().get(key)
+        if entry is None:
+            return default
+        container, name = entry
+        return container[name]
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Check whether a configuration key exists.
+
+        Args:
+            key (str): The configuration key, as a dotted path.
+
+        Returns:
+            bool: True if the key exists.
+        """
+        return key in self._path_index()
 
     def set(self, key: str, value: Any) -> None:
         """
         Set a configuration value.
 
+        Missing intermediate sections of a dotted path are created.
+
         Args:
-            key (str): The configuration key.
+            key (str): The configuration key, as a dotted path.
             value (Any): The value to set.
+
+        Raises:
+            ValueError: If a parent of the path holds a non-mapping value.
+        """
+        # Pending operations are replayed on reload, so they keep their own
+        # copy of the caller's dicts and lists.
+        value = _copy_tree(value)
+        if self._apply_set(key, value):
+            self._commit(("set", key, value))
+
+    def _apply_set(self, key: str, value: Any) -> bool:
+        """Set a value in the document; return whether anything changed."""
+        entry = self._path_index().get(key)
+        if entry is not None and same_value(entry[0][entry[1]], value):
+            return False
+
+        self._make_owned(key)
+        index = self._path_index()
+        entry = index.get(key)
+
+        if entry is None:
+            container, name = self._create_parents(key)
+        else:
+            container, name = entry
+            self._unindex_subtree(key, container[name])
+
+        # An operation may be applied again, so the document gets its own copy.
+        value = _copy_tree(value)
+        container[name] = value
+        index[key] = (container, name)
+        if isinstance(value, dict):
+            self._index_subtree(key, value)
+        return True
+
+    def _create_parents(self, key: str) -> tuple[dict[str, Any], str]:
+        """Create the sections leading to a new path."""
+        index = self._path_index()
+        container = self._document
+        parts = key.split(".")
+        prefix = ""
+
+        for part in parts[:-1]:
+            prefix = f"{prefix}.{part}" if prefix else part
+            entry = index.get(prefix)
+            if entry is None:
+                child: Any = {}
+                container[part] = child
+                index[prefix] = (container, part)
+                self._owned_sections.add(id(child))
+            else:
+                child = entry[0][entry[1]]
+                if not isinstance(child, dict):
+                    raise ValueError(f"Cannot set '{key}': '{prefix}' is not a section")
+            container = child
+
+        return container, parts[-1]
+
+    def update(self, values: Mapping[str, Any]) -> None:
+        """
+        Set several configuration values with a single write.
+
+        Args:
+            values (Mapping[str, Any]): Keys and values to set.
         """
-        self._config_data[key] = value
-        self.save_config()
+        with self.transaction():
+            for key, value in values.items():
+                self.set(key, value)
 
     def delete(self, key: str) -> bool:
         """
-        Delete a configuration value.
+        Delete a configuration value or section.
 
         Args:
-            key (str): The configuration key to delete.
+            key (str): The configuration key to delete, as a dotted path.
 
         Returns:
             bool: True if key was deleted, False if key didn't exist.
         """
-        if key in self._config_data:
-            del self._config_data[key]
-            self.save_config()
-            return True
-        return False
+        if not self._apply_delete(key):
+            return False
+
+        self._commit(("delete", key))
+        return True
+
+    def _apply_delete(self, key: str) -> bool:
+        """Delete a path from the document; return whether it existed."""
+        if key not in self._path_index():
+            return False
+
+        self._make_owned(key)
+        container, name = self._path_index()[key]
+        self._unindex_subtree(key, container.pop(name))
+        return True
+
+    def clear(self) -> None:
+        """Remove every configuration value."""
+        if not self._document:
+            return
+
+        self._config_data = {}
+        self._commit(("clear",))
+
+    def items(self, prefix: str | None = None) -> Iterator[tuple[str, Any]]:
+        """
+        Iterate over leaf values as flattened dotted paths.
+
+        Args:
+            prefix (str | None): Only list the subtree at this path.
+
+        Yields:
+            tuple[str, Any]: Dotted path and value of each leaf; empty
+                sections are reported as ``{}``.
+        """
+        if prefix:
+            entry = self._path_index().get(prefix)
+            if entry is None:
+                return
+            root_path, root = prefix, entry[0][entry[1]]
+        else:
+            root_path, root = "", self._document
+
+        for path, value in _iter_tree(root_path, root):
+            if path and (not isinstance(value, dict) or not value):
+                yield path, value
 
     def get_all(self) -> dict[str, Any]:
         """
         Get all configuration values.
 
         Returns:
-            Dict[str, Any]: All configuration data.
+            Dict[str, Any]: A copy of all configuration data.
         """
-        return self._config_data.copy()
+        return _copy_tree(self._document)
 
     def reset(self) -> None:
         """Reset all configuration data."""
-        self._config_data = {}
-        self.config_path.unlink(missing_ok=True)
+        with config_lock(self.config_path, exclusive=True):
+            self._config_data = {}
+            self._dirty = False
+            self._pending = []
+            self._signature = None
+            self._journal_signature = None
+            self._journal_offset = 0
+            _document_cache.pop(self.config_path, None)
+            remove_snapshot(self.config_path)
+            remove_journal(self.config_path)
+            self.config_path.unlink(missing_ok=True)
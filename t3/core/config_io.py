@@ -0,0 +1,349 @@
+"""Bulk configuration import and export for T3 CLI."""
+
+import datetime
+import json
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+from t3.core.config import ConfigManager, same_value
+
+FORMATS = ("json", "ndjson", "toml", "yaml")
+STRATEGIES = ("replace", "merge", "missing")
+
+_EXTENSIONS = {
+    ".json": "json",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".toml": "toml",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+
+_BARE_KEY = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def detect_format(path: str | None, default: str = "json") -> str:
+    """
+    Guess a file format from its extension.
+
+    Args:
+        path (str | None): File path, or None/'-' for stdin/stdout.
+        default (str): Format used when nothing can be inferred.
+
+    Returns:
+        str: One of ``FORMATS``.
+    """
+    if not path or path == "-":
+        return default
+    return _EXTENSIONS.get(Path(path).suffix.lower(), default)
+
+
+def iter_entries(stream: TextIO, fmt: str) -> Iterator[tuple[str, Any]]:
+    """
+    Read ``(dotted path, value)`` leaf entries from an input stream.
+
+    NDJSON is consumed line by line, so arbitrarily large dumps are read in
+    bounded memory. Each line is either ``{"key": ..., "value": ...}`` or an
+    object whose (possibly nested) members are imported as paths. Other
+    formats are parsed as a whole document and flattened.
+
+    Args:
+        stream (TextIO): The input stream.
+        fmt (str): One of ``FORMATS``.
+
+    Yields:
+        tuple[str, Any]: Dotted path and value of each leaf.
+
+    Raises:
+        ValueError: If the input is malformed.
+    """
+    if fmt == "ndjson":
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Line {line_number}: {e}") from e
+            if not isinstance(record, dict):
+                raise ValueError(f"Line {line_number}: expected a JSON object")
+
+            if record.keys() == {"key", "value"}:
+                yield str(record["key"]), record["value"]
+            else:
+                yield from flatten(record)
+        return
+
+    yield from flatten(load_document(stream, fmt))
+
+
+def load_document(stream: TextIO, fmt: str) -> dict[str, Any]:
+    """
+    Parse a whole JSON, TOML or YAML document.
+
+    Args:
+        stream (TextIO): The input stream.
+        fmt (str): One of ``json``, ``toml`` or ``yaml``.
+
+    Returns:
+        dict[str, Any]: The parsed document.
+
+    Raises:
+        ValueError: If the input is malformed or not a mapping.
+    """
+    try:
+        if fmt == "toml":
+            import tomllib
+
+            document = tomllib.loads(stream.read())
+        elif fmt == "yaml":
+            import yaml
+
+            document = yaml.safe_load(stream) or {}
+        else:
+            document = json.load(stream)
+    except ValueError as e:
+        raise ValueError(f"Invalid {fmt.upper()} input: {e}") from e
+    except Exception as e:
+        # yaml.YAMLError does not derive from ValueError.
+        if type(e).__module__.startswith("yaml"):
+            raise ValueError(f"Invalid YAML input: {e}") from e
+        raise
+
+    if not isinstance(document, dict):
+        raise ValueError(f"{fmt.upper()} input must be a mapping at the top level")
+    return document
+
+
+def flatten(document: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """
+    Flatten a nested mapping into ``(dotted path, value)`` leaves.
+
+    Dates and times (from TOML or YAML) become ISO 8601 strings so the result
+    stays JSON-serializable. Empty mappings are kept as leaves.
+
+    Args:
+        document (dict[str, Any]): The nested mapping.
+        prefix (str): Path prefix for every key.
+
+    Yields:
+        tuple[str, Any]: Dotted path and value of each leaf.
+    """
+    for key, value in document.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict) and value:
+            yield from flatten(value, path)
+        else:
+            yield path, to_json_value(value)
+
+
+def to_json_value(value: Any) -> Any:
+    """
+    Convert TOML/YAML-only types into JSON-compatible values.
+
+    Dates and times become ISO 8601 strings and mapping keys strings.
+
+    Args:
+        value (Any): A parsed value, possibly nested.
+
+    Returns:
+        Any: The value with only JSON types.
+    """
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [to_json_value(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): to_json_value(item) for key, item in value.items()}
+    return value
+
+
+def import_entries(
+    config: ConfigManager, entries: Iterable[tuple[str, Any]], strategy: str
+) -> dict[str, int]:
+    """
+    Apply imported entries to a configuration with a single write.
+
+    Args:
+        config (ConfigManager): The configuration to update.
+        entries (Iterable[tuple[str, Any]]): Leaf entries to import.
+        strategy (str): ``replace`` discards the current configuration first,
+            ``merge`` overrides existing leaves and ``missing`` only adds
+            paths that do not exist yet.
+
+    Returns:
+        dict[str, int]: Counts of ``changed``, ``unchanged`` and ``skipped``
+            entries.
+
+    Raises:
+        ValueError: If the strategy is unknown or an entry cannot be set; the
+            configuration is left untouched in that case.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown merge strategy: {strategy}")
+
+    counts = {"changed": 0, "unchanged": 0, "skipped": 0}
+    with config.transaction():
+        if strategy == "replace":
+            config.clear()
+
+        for path, value in entries:
+            if strategy == "missing" and _exists_or_blocked(config, path):
+                counts["skipped"] += 1
+                continue
+
+            if path in config and same_value(config.get(path), value):
+                counts["unchanged"] += 1
+                continue
+
+            config.set(path, value)
+            counts["changed"] += 1
+
+    return counts
+
+
+def _exists_or_blocked(config: ConfigManager, path: str) -> bool:
+    """Check whether a path, or a non-section parent of it, already exists."""
+    if path in config:
+        return True
+
+    parts = path.split(".")
+    for end in range(len(parts) - 1, 0, -1):
+        parent = ".".join(parts[:end])
+        if parent in config:
+            return not isinstance(config.get(parent), dict)
+    return False
+
+
+def export_config(
+    config: ConfigManager, stream: TextIO, fmt: str, prefix: str | None = None
+) -> int:
+    """
+    Write the configuration, or one section of it, to a stream.
+
+    NDJSON is written one ``{"key": ..., "value": ...}`` line per leaf
+    without building an intermediate document.
+
+    Args:
+        config (ConfigManager): The configuration to export.
+        stream (TextIO): The output stream.
+        fmt (str): One of ``FORMATS``.
+        prefix (str | None): Only export the section at this path.
+
+    Returns:
+        int: The number of exported leaves.
+
+    Raises:
+        ValueError: If the format cannot represent a value.
+    """
+    if fmt == "ndjson":
+        count = 0
+        for path, value in config.items(prefix):
+            stream.write(json.dumps({"key": path, "value": value}) + "\n")
+            count += 1
+        return count
+
+    document = config.get(prefix, {}) if prefix else config.get_all()
+    if not isinstance(document, dict):
+        document = {prefix.rsplit(".", 1)[-1]: document}
+
+    if fmt == "toml":
+        stream.write(dump_toml(document))
+    elif fmt == "yaml":
+        import yaml
+
+        yaml.safe_dump(document, stream, default_flow_style=False, sort_keys=False)
+    else:
+        json.dump(document, stream, indent=2)
+        stream.write("\n")
+
+    return sum(1 for _ in config.items(prefix))
+
+
+def dump_toml(document: dict[str, Any]) -> str:
+    """
+    Serialize a mapping as TOML.
+
+    Lists of mappings become arrays of tables (``[[cameras]]``), as in the
+    edge ``config.toml``.
+
+    Args:
+        document (dict[str, Any]): The mapping to serialize.
+
+    Returns:
+        str: The TOML document.
+
+    Raises:
+        ValueError: If the document contains ``None``, which TOML cannot
+            represent.
+    """
+    lines: list[str] = []
+    _write_toml_table(lines, [], document, array=False)
+    return "\n".join(lines).lstrip("\n") + "\n"
+
+
+def _write_toml_table(
+    lines: list[str], path: list[str], table: dict[str, Any], array: bool
+) -> None:
+    """Append a table, its values and its sub-tables to ``lines``."""
+    values = []
+    tables = []
+    arrays = []
+    for key, value in table.items():
+        if isinstance(value, dict):
+            tables.append((key, value))
+        elif _is_table_array(value):
+            arrays.append((key, value))
+        else:
+            values.append((key, value))
+
+    header = ".".join(_toml_key(part) for part in path)
+    if array:
+        lines.extend(["", f"[[{header}]]"])
+    elif path and (values or not (tables or arrays)):
+        lines.extend(["", f"[{header}]"])
+
+    for key, value in values:
+        lines.append(f"{_toml_key(key)} = {_toml_value(value, [*path, key])}")
+    for key, value in tables:
+        _write_toml_table(lines, [*path, key], value, array=False)
+    for key, items in arrays:
+        for item in items:
+            _write_toml_table(lines, [*path, key], item, array=True)
+
+
+def _is_table_array(value: Any) -> bool:
+    """Check whether a value is a non-empty list of mappings."""
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and all(isinstance(item, dict) for item in value)
+    )
+
+
+def _toml_key(key: str) -> str:
+    """Quote a key unless it is a valid bare key."""
+    return key if _BARE_KEY.fullmatch(key) else json.dumps(key)
+
+
+def _toml_value(value: Any, path: list[str]) -> str:
+    """Serialize an inline TOML value."""
+    if value is None:
+        raise ValueError(f"TOML cannot represent null at '{'.'.join(path)}'")
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int | float):
+        return repr(value)
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, list):
+        return "[" + ", ".join(_toml_value(item, path) for item in value) + "]"
+    if isinstance(value, dict):
+        members = ", ".join(
+            f"{_toml_key(key)} = {_toml_value(item, [*path, key])}"
+            for key, item in value.items()
+        )
+        return "{ " + members + " }" if members else "{}"
+    return json.dumps(str(value))
@@ -0,0 +1,461 @@
+"""Persistent daemon and thin client for T3 CLI.
+
+Frames are a one-byte kind, a four-byte big-endian length and a payload.
+Structured payloads use ``marshal`` since client and daemon always come from
+the same installation. Module-level imports are kept minimal so the client
+path stays cheap to start.
+"""
+
+import io
+import marshal
+import os
+import socket
+import struct
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+REQUEST = b"R"
+REPLY = b"J"
+STDOUT = b"O"
+STDERR = b"E"
+STDIN_REQUEST = b"I"
+STDIN_DATA = b"D"
+EXIT = b"X"
+
+# Bytes of stdin read and forwarded at a time.
+STDIN_CHUNK = 65536
+
+_HEADER = struct.Struct(">cI")
+
+
+def default_socket_path() -> Path:
+    """
+    Get the daemon socket path.
+
+    Returns:
+        Path: ``T3_DAEMON_SOCKET`` if set, otherwise ``~/.t3/daemon.sock``.
+    """
+    configured = os.environ.get("T3_DAEMON_SOCKET")
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".t3" / "daemon.sock"
+
+
+def daemon_enabled() -> bool:
+    """
+    Check whether invocations should be forwarded to the daemon.
+
+    Returns:
+        bool: True if ``T3_USE_DAEMON`` is set to a truthy value.
+    """
+    return os.environ.get("T3_USE_DAEMON", "").lower() in ("1", "true", "yes")
+
+
+def send_frame(conn: socket.socket, kind: bytes, payload: bytes = b"") -> None:
+    """
+    Send a single frame.
+
+    Args:
+        conn (socket.socket): Connected socket.
+        kind (bytes): One-byte frame kind.
+        payload (bytes): Frame payload.
+    """
+    conn.sendall(_HEADER.pack(kind, len(payload)) + payload)
+
+
+def recv_frame(conn: socket.socket) -> tuple[bytes, bytes]:
+    """
+    Receive a single frame.
+
+    Args:
+        conn (socket.socket): Connected socket.
+
+    Returns:
+        tuple[bytes, bytes]: The frame kind and payload.
+
+    Raises:
+        ConnectionError: If the peer closed the connection mid-frame.
+    """
+    kind, length = _HEADER.unpack(_recv_exactly(conn, _HEADER.size))
+    return kind, _recv_exactly(conn, length)
+
+
+def _recv_exactly(conn: socket.socket, size: int) -> bytes:
+    """Read exactly ``size`` bytes from the socket."""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = conn.recv(min(remaining, 1 << 16))
+        if not chunk:
+            raise ConnectionError("Connection closed by peer")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+class _FrameWriter(io.RawIOBase):
+    """Raw stream that forwards every write as a frame of a given kind."""
+
+    def __init__(self, conn: socket.socket, kind: bytes) -> None:
+        self._conn = conn
+        self._kind = kind
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        payload = bytes(data)
+        if payload:
+            send_frame(self._conn, self._kind, payload)
+        return len(payload)
+
+
+class _StdinReader(io.RawIOBase):
+    """Raw stream that pulls stdin from the client on demand."""
+
+    def __init__(self, conn: socket.socket) -> None:
+        self._conn = conn
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        if self._eof:
+            return 0
+
+        send_frame(self._conn, STDIN_REQUEST, struct.pack(">I", len(buffer)))
+        kind, payload = recv_frame(self._conn)
+        if kind != STDIN_DATA or not payload:
+            self._eof = True
+            return 0
+
+        buffer[: len(payload)] = payload
+        return len(payload)
+
+
+def _text_stream(raw: io.RawIOBase, *, writable: bool) -> io.TextIOWrapper:
+    """Wrap a raw frame stream as a UTF-8 text stream."""
+    if writable:
+        buffered: io.BufferedIOBase = io.BufferedWriter(raw)
+    else:
+        buffered = io.BufferedReader(raw, buffer_size=STDIN_CHUNK)
+    return io.TextIOWrapper(buffered, encoding="utf-8", line_buffering=writable)
+
+
+def _exit_code(code: object) -> int:
+    """Translate a ``SystemExit`` code into a process exit status."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _decode_request(payload: bytes) -> dict[str, Any]:
+    """
+    Decode and validate a request frame.
+
+    Args:
+        payload (bytes): The frame payload.
+
+    Returns:
+        dict[str, Any]: The request.
+
+    Raises:
+        ValueError: If the payload is not a well-formed request.
+    """
+    try:
+        request = marshal.loads(payload)
+    except (EOFError, TypeError, ValueError) as e:
+        raise ValueError(f"malformed request: {e}") from e
+    if not isinstance(request, dict):
+        raise ValueError("malformed request: not a mapping")
+
+    expected = {"control": str, "argv": list, "env": dict, "cwd": str}
+    for key, kind in expected.items():
+        if key in request and not isinstance(request[key], kind):
+            raise ValueError(f"malformed request: '{key}' is not a {kind.__name__}")
+    if not all(isinstance(arg, str) for arg in request.get("argv", [])):
+        raise ValueError("malformed request: 'argv' holds non-strings")
+    env = request.get("env", {})
+    if not all(isinstance(k, str) and isinstance(v, str) for k, v in env.items()):
+        raise ValueError("malformed request: 'env' holds non-strings")
+    return request
+
+
+class T3Daemon:
+    """
+    A warm T3 CLI process serving forwarded invocations over a Unix socket.
+
+    Requests are handled one at a time because each one temporarily owns the
+    process-wide ``sys.stdin``/``sys.stdout``/``sys.stderr``, environment and
+    working directory.
+    """
+
+    def __init__(self, socket_path: Path, command: Callable[..., object]) -> None:
+        """
+        Initialize the daemon.
+
+        Args:
+            socket_path (Path): Path of the Unix socket to listen on.
+            command (Callable[..., object]): The click command built from the app.
+        """
+        self.socket_path = socket_path
+        self.command = command
+        self.started_at = time.time()
+        self.requests_served = 0
+        self._running = False
+
+    def serve_forever(self) -> None:
+        """Listen on the socket until a shutdown request arrives."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            old_umask = os.umask(0o177)
+            try:
+                server.bind(str(self.socket_path))
+            finally:
+                os.umask(old_umask)
+            server.listen()
+
+            self._running = True
+            try:
+                while self._running:
+                    conn, _ = server.accept()
+                    with conn:
+                        try:
+                            self.handle(conn)
+                        except (ConnectionError, OSError):
+                            continue
+            finally:
+                self.socket_path.unlink(missing_ok=True)
+
+    def handle(self, conn: socket.socket) -> None:
+        """
+        Handle a single client connection.
+
+        Args:
+            conn (socket.socket): The accepted connection.
+        """
+        kind, payload = recv_frame(conn)
+        if kind != REQUEST:
+            return
+
+        try:
+            request = _decode_request(payload)
+        except ValueError as e:
+            send_frame(conn, STDERR, f"t3 daemon: {e}\n".encode())
+            send_frame(conn, EXIT, marshal.dumps({"exit_code": 2}))
+            return
+
+        control = request.get("control")
+        if control == "ping":
+            send_frame(conn, REPLY, marshal.dumps(self.status()))
+        elif control == "shutdown":
+            self._running = False
+            send_frame(conn, REPLY, marshal.dumps({"stopping": True}))
+        else:
+            exit_code = self.run(conn, request)
+            self.requests_served += 1
+            send_frame(conn, EXIT, marshal.dumps({"exit_code": exit_code}))
+
+    def status(self) -> dict[str, object]:
+        """
+        Get daemon status information.
+
+        Returns:
+            dict[str, object]: Process id, uptime and served request count.
+        """
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "requests_served": self.requests_served,
+            "socket": str(self.socket_path),
+        }
+
+    def run(self, conn: socket.socket, request: dict[str, object]) -> int:
+        """
+        Execute one forwarded invocation with the client's stdio, env and cwd.
+
+        Args:
+            conn (socket.socket): The client connection.
+            request (dict[str, object]): The decoded request.
+
+        Returns:
+            int: The command's exit status.
+        """
+        saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+        saved_environ = os.environ.copy()
+        saved_cwd = os.getcwd()
+
+        stdout = _text_stream(_FrameWriter(conn, STDOUT), writable=True)
+        stderr = _text_stream(_FrameWriter(conn, STDERR), writable=True)
+        stdin = _text_stream(_StdinReader(conn), writable=False)
+
+        try:
+            os.environ.clear()
+            os.environ.update(request.get("env", {}))
+            os.chdir(request.get("cwd", saved_cwd))
+            sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+
+            try:
+                self.command.main(
+                    args=request.get("argv", []), prog_name="t3", standalone_mode=True
+                )
+                exit_code = 0
+            except SystemExit as exc:
+                exit_code = _exit_code(exc.code)
+            except Exception:
+                import traceback
+
+                traceback.print_exc()
+                exit_code = 1
+        finally:
+            for stream in (stdout, stderr):
+                try:
+                    stream.flush()
+                except (ConnectionError, OSError):
+                    pass
+            sys.stdin, sys.stdout, sys.stderr = saved_streams
+            os.environ.clear()
+            os.environ.update(saved_environ)
+            os.chdir(saved_cwd)
+
+        return exit_code
+
+
+def build_daemon(socket_path: Path) -> T3Daemon:
+    """
+    Build a daemon with every subcommand imported and the config loaded.
+
+    Args:
+        socket_path (Path): Path of the Unix socket to listen on.
+
+    Returns:
+        T3Daemon: The ready-to-serve daemon.
+    """
+    import typer
+
+    from t3.core.config import get_config
+    from t3.main import app
+
+    command = typer.main.get_command(app)
+    context = typer.Context(command, info_name="t3")
+    for name in command.list_commands(context):
+        command.get_command(context, name)
+    get_config()
+
+    return T3Daemon(socket_path, command)
+
+
+def _connect(socket_path: Path, timeout: float | None = None) -> socket.socket | None:
+    """Connect to the daemon, returning None if it is not reachable."""
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(timeout)
+    try:
+        conn.connect(str(socket_path))
+    except OSError:
+        conn.close()
+        return None
+    return conn
+
+
+def control(
+    action: str, socket_path: Path | None = None, timeout: float = 5.0
+) -> dict[str, object] | None:
+    """
+    Send a control request (``ping`` or ``shutdown``) to the daemon.
+
+    Args:
+        action (str): The control action.
+        socket_path (Path | None): Socket path; defaults to the standard one.
+        timeout (float): Socket timeout in seconds.
+
+    Returns:
+        dict[str, object] | None: The daemon's reply, or None if unreachable.
+    """
+    conn = _connect(socket_path or default_socket_path(), timeout)
+    if conn is None:
+        return None
+
+    with conn:
+        try:
+            send_frame(conn, REQUEST, marshal.dumps({"control": action}))
+            kind, payload = recv_frame(conn)
+        except (ConnectionError, OSError):
+            return None
+    return marshal.loads(payload) if kind == REPLY else None
+
+
+def _read_stdin(limit: int, surplus: bytearray) -> bytes:
+    """
+    Read up to ``limit`` bytes of the real stdin for the daemon.
+
+    Whatever is available is read with one ``os.read`` of up to
+    :data:`STDIN_CHUNK` bytes; the part beyond ``limit`` is kept in
+    ``surplus`` and answers the next request without a syscall.
+    """
+    if not surplus:
+        try:
+            descriptor = sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            return b""
+        surplus += os.read(descriptor, max(limit, STDIN_CHUNK))
+
+    data = bytes(surplus[:limit])
+    del surplus[:limit]
+    return data
+
+
+def run_remote(argv: list[str], socket_path: Path | None = None) -> int | None:
+    """
+    Forward an invocation to the daemon and relay its output.
+
+    Args:
+        argv (list[str]): Arguments passed to ``t3``.
+        socket_path (Path | None): Socket path; defaults to the standard one.
+
+    Returns:
+        int | None: The exit status, or None if the daemon is not reachable
+            and the caller should run the command in-process instead.
+    """
+    conn = _connect(socket_path or default_socket_path())
+    if conn is None:
+        return None
+
+    request = {"argv": argv, "env": dict(os.environ), "cwd": os.getcwd()}
+    stdout = sys.stdout.buffer
+    stderr = sys.stderr.buffer
+    stdin_surplus = bytearray()
+
+    with conn:
+        try:
+            send_frame(conn, REQUEST, marshal.dumps(request))
+        except OSError:
+            return None
+
+        while True:
+            try:
+                kind, payload = recv_frame(conn)
+            except (ConnectionError, OSError):
+                stderr.write(b"t3: lost connection to daemon\n")
+                stderr.flush()
+                return 1
+
+            if kind == STDOUT:
+                stdout.write(payload)
+                stdout.flush()
+            elif kind == STDERR:
+                stderr.write(payload)
+                stderr.flush()
+            elif kind == STDIN_REQUEST:
+                (limit,) = struct.unpack(">I", payload)
+                send_frame(conn, STDIN_DATA, _read_stdin(limit, stdin_surplus))
+            elif kind == EXIT:
+                return int(marshal.loads(payload)["exit_code"])
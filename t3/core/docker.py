@@ -0,0 +1,239 @@
+"""Docker helpers for ``t3 init docker``.
+
+``docker pull`` is run as an asyncio subprocess and its output is consumed
+line by line as it arrives, so callers can show per-layer progress and do
+other work while the image downloads. Only the last lines are kept, for
+error reports.
+
+Pulls are skipped when the local image is known to be current: after each
+pull the image ID and digests are recorded in the ``docker`` cache
+namespace, and until that record expires (``T3_CACHE_TTL``) a local image
+with the same ID is not pulled again.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import subprocess
+from collections import deque
+from collections.abc import Callable
+from typing import NamedTuple
+
+from t3.core.cache import DiskCache
+
+DEFAULT_IMAGE = "ghcr.io/t3-labs/edge-video:latest"
+
+PULL_POLICIES = ("always", "missing", "never")
+
+CACHE_NAMESPACE = "docker"
+
+# Lines of pull output kept for error messages.
+_TAIL_LINES = 20
+
+# "<layer id>: <status>", as printed by docker pull without a terminal.
+_LAYER_LINE = re.compile(r"^([0-9a-f]{12,64}): (.+)$")
+
+_LAYER_DONE = ("Pull complete", "Already exists")
+
+
+class ImageInfo(NamedTuple):
+    """A local image, as reported by ``docker image inspect``."""
+
+    id: str
+    digests: list[str]
+
+
+class PullResult(NamedTuple):
+    """The outcome of ``docker pull``."""
+
+    returncode: int
+    digest: str | None
+    tail: list[str]
+
+
+class PullProgress:
+    """Tracks layer states from ``docker pull`` output lines."""
+
+    def __init__(self) -> None:
+        """Initialize with no layers."""
+        self.layers: dict[str, str] = {}
+        self.digest: str | None = None
+        self.status: str | None = None
+
+    @property
+    def total(self) -> int:
+        """int: Layers seen so far."""
+        return len(self.layers)
+
+    @property
+    def completed(self) -> int:
+        """int: Layers extracted or already present."""
+        return sum(status in _LAYER_DONE for status in self.layers.values())
+
+    def feed(self, line: str) -> bool:
+        """
+        Update the state from an output line.
+
+        Args:
+            line (str): A line of ``docker pull`` output.
+
+        Returns:
+            bool: Whether the line changed a layer's state.
+        """
+        match = _LAYER_LINE.match(line)
+        if match:
+            layer, status = match.groups()
+            # Download progress details follow the status on some versions.
+            status = status.split("  ", 1)[0].strip()
+            if self.layers.get(layer) == status:
+                return False
+            self.layers[layer] = status
+            return True
+        if line.startswith("Digest: "):
+            self.digest = line.removeprefix("Digest: ").strip()
+        elif line.startswith("Status: "):
+            self.status = line.removeprefix("Status: ").strip()
+        return False
+
+
+async def pull_image(
+    image: str = DEFAULT_IMAGE,
+    on_line: Callable[[str], None] | None = None,
+    docker: str = "docker",
+) -> PullResult:
+    """
+    Pull an image, streaming its output.
+
+    Args:
+        image (str): The image reference.
+        on_line (Callable[[str], None] | None): Called with each output line
+            (stdout and stderr) as it arrives.
+        docker (str): The docker executable.
+
+    Returns:
+        PullResult: Exit status, pulled digest if reported, and the last
+            output lines.
+
+    Raises:
+        FileNotFoundError: If the docker executable is not found.
+    """
+    process = await asyncio.create_subprocess_exec(
+        docker,
+        "pull",
+        image,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    assert process.stdout is not None
+    tail: deque[str] = deque(maxlen=_TAIL_LINES)
+    digest = None
+    try:
+        while raw := await process.stdout.readline():
+            line = raw.decode("utf-8", "replace").rstrip()
+            if not line:
+                continue
+            tail.append(line)
+            if line.startswith("Digest: "):
+                digest = line.removeprefix("Digest: ").strip()
+            if on_line is not None:
+                on_line(line)
+        returncode = await process.wait()
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    return PullResult(returncode, digest, list(tail))
+
+
+def inspect_image(
+    image: str = DEFAULT_IMAGE, docker: str = "docker"
+) -> ImageInfo | None:
+    """
+    Look up an image in the local image store.
+
+    Args:
+        image (str): The image reference.
+        docker (str): The docker executable.
+
+    Returns:
+        ImageInfo | None: The image's ID and repository digests, or None if
+            it is not present (or docker cannot tell).
+
+    Raises:
+        FileNotFoundError: If the docker executable is not found.
+    """
+    result = subprocess.run(
+        [docker, "image", "inspect", image],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    try:
+        details = json.loads(result.stdout)[0]
+        return ImageInfo(str(details["Id"]), list(details.get("RepoDigests") or []))
+    except (ValueError, LookupError, TypeError):
+        return None
+
+
+def pull_decision(
+    image: str,
+    policy: str | None,
+    local: ImageInfo | None,
+    cache: DiskCache | None,
+) -> tuple[bool, str]:
+    """
+    Decide whether an image needs pulling.
+
+    Args:
+        image (str): The image reference.
+        policy (str | None): One of ``PULL_POLICIES``, or None to pull when
+            the image is missing or its last recorded pull has expired.
+        local (ImageInfo | None): The local image, if present.
+        cache (DiskCache | None): The ``docker`` cache, or None if caching
+            is disabled (the image is then always considered stale).
+
+    Returns:
+        tuple[bool, str]: Whether to pull, and why.
+    """
+    if policy == "always":
+        return True, "pull policy is 'always'"
+    if local is None:
+        if policy == "never":
+            return False, "image is not present locally and pull policy is 'never'"
+        return True, "image is not present locally"
+    if policy is not None:
+        return False, f"image is present locally and pull policy is '{policy}'"
+
+    key = _cache_key(image)
+    record = cache.get(key) if cache is not None else None
+    if record is None or record.get("id") != local.id:
+        return True, "image has not been checked recently"
+    age = cache.age(key) if cache is not None else None
+    minutes = int((age or 0) // 60)
+    return False, f"image is up to date (checked {minutes} min ago)"
+
+
+def record_pull(image: str, local: ImageInfo, cache: DiskCache | None) -> None:
+    """
+    Remember that an image was just pulled.
+
+    Args:
+        image (str): The image reference.
+        local (ImageInfo): The image after the pull.
+        cache (DiskCache | None): The ``docker`` cache; nothing is recorded
+            if it is None.
+    """
+    if cache is not None:
+        cache.put(
+            _cache_key(image),
+            {"image": image, "id": local.id, "digests": local.digests},
+        )
+
+
+def _cache_key(image: str) -> str:
+    """Get the cache key of an image reference."""
+    return hashlib.sha256(image.encode()).hexdigest()[:32]
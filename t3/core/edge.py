@@ -0,0 +1,291 @@
+"""Edge-video configuration and capacity planning.
+
+The edge-video service reads a ``config.toml`` with a global
+``target_fps``, an ``[optimization]`` section (``max_workers``,
+``buffer_size``, ``frame_quality``, ``frame_resolution``), a ``[redis]``
+frame store with ``ttl_seconds`` and a ``[[cameras]]`` list. A camera may
+override ``target_fps``, ``frame_quality`` and ``frame_resolution``.
+
+Planning groups cameras by their distinct (fps, resolution, quality)
+profile and computes each profile once, so inventories with thousands of
+mostly identical cameras cost one pass over the list plus a handful of
+calculations.
+"""
+
+import math
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+DEFAULT_CONFIG = "config.toml"
+
+# Worker time spent on one frame (decode, JPEG encode, publish) when the
+# caller does not measure it.
+DEFAULT_FRAME_SECONDS = 0.010
+
+# Seconds of stalled consumers the frame buffer should absorb.
+DEFAULT_BURST_SECONDS = 2.0
+
+# Recommended worker counts keep utilization at or below this.
+TARGET_UTILIZATION = 0.7
+
+# Redis bookkeeping per stored frame (key, dict entry, expiry).
+REDIS_KEY_OVERHEAD = 96
+
+# Defaults of edge-video when a setting is absent.
+_DEFAULTS = {
+    "target_fps": 30,
+    "max_workers": 20,
+    "buffer_size": 200,
+    "frame_quality": 5,
+    "frame_resolution": "1280x720",
+    "ttl_seconds": 60,
+}
+
+
+class CameraProfile(NamedTuple):
+    """Capture settings shared by a group of cameras."""
+
+    fps: float
+    width: int
+    height: int
+    quality: int
+
+    @property
+    def resolution(self) -> str:
+        """str: The resolution as ``WIDTHxHEIGHT``."""
+        return f"{self.width}x{self.height}"
+
+
+class ProfileLoad(NamedTuple):
+    """Per-camera load of a profile and the number of cameras using it."""
+
+    profile: CameraProfile
+    cameras: int
+    raw_frame_bytes: int
+    jpeg_frame_bytes: int
+    raw_bytes_per_second: float
+    jpeg_bytes_per_second: float
+    redis_bytes: int
+
+
+class EdgePlan(NamedTuple):
+    """Totals, utilization and recommendations for a camera inventory."""
+
+    cameras: int
+    fps: float
+    raw_bytes_per_second: float
+    jpeg_bytes_per_second: float
+    redis_enabled: bool
+    redis_ttl_seconds: float
+    redis_bytes: int
+    max_workers: int
+    worker_demand: float
+    worker_utilization: float
+    buffer_size: int
+    buffer_seconds: float
+    buffer_bytes: int
+    recommended_max_workers: int
+    recommended_buffer_size: int
+    profiles: list[ProfileLoad]
+
+
+def load_edge_config(path: str | Path = DEFAULT_CONFIG) -> dict[str, Any]:
+    """
+    Read an edge-video configuration file.
+
+    Args:
+        path (str | Path): The file; its format follows the extension (TOML
+            unless it is ``.json`` or ``.yaml``).
+
+    Returns:
+        dict[str, Any]: The parsed configuration.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is malformed.
+    """
+    from t3.core.config_io import detect_format, load_document
+
+    with open(path, encoding="utf-8") as stream:
+        return load_document(stream, detect_format(str(path), default="toml"))
+
+
+def iter_cameras(config: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """
+    Iterate over the ``[[cameras]]`` entries of a configuration.
+
+    Args:
+        config (dict[str, Any]): The parsed configuration.
+
+    Yields:
+        dict[str, Any]: Each camera; ``id`` defaults to ``cam<position>``.
+
+    Raises:
+        ValueError: If ``cameras`` is not a list of tables.
+    """
+    cameras = config.get("cameras") or []
+    if not isinstance(cameras, list):
+        raise ValueError("'cameras' must be a list of tables")
+    for position, camera in enumerate(cameras, start=1):
+        if not isinstance(camera, dict):
+            raise ValueError(f"Camera {position} must be a table")
+        if "id" not in camera:
+            camera = {"id": f"cam{position}", **camera}
+        yield camera
+
+
+def parse_resolution(value: str) -> tuple[int, int]:
+    """
+    Parse a ``WIDTHxHEIGHT`` resolution.
+
+    Args:
+        value (str): The resolution, e.g. ``1280x720``.
+
+    Returns:
+        tuple[int, int]: Width and height in pixels.
+
+    Raises:
+        ValueError: If the value is not two positive integers.
+    """
+    width, separator, height = str(value).lower().partition("x")
+    try:
+        if separator and int(width) > 0 and int(height) > 0:
+            return int(width), int(height)
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid resolution '{value}' (expected WIDTHxHEIGHT)")
+
+
+def estimate_jpeg_bytes(width: int, height: int, quality: int) -> int:
+    """
+    Estimate the size of a JPEG frame encoded by FFmpeg.
+
+    ``quality`` is FFmpeg's ``-q:v`` scale, 2 (best) to 31 (worst). Bits
+    per pixel fall roughly as a power of it; this gives about 1 bit per
+    pixel at the default quality 5, in line with typical surveillance
+    footage. Treat the result as an order of magnitude.
+
+    Args:
+        width (int): Frame width in pixels.
+        height (int): Frame height in pixels.
+        quality (int): FFmpeg ``-q:v`` value.
+
+    Returns:
+        int: The estimated frame size in bytes.
+    """
+    bits_per_pixel = 4.0 / max(2, min(31, quality)) ** 0.85
+    return math.ceil(width * height * bits_per_pixel / 8)
+
+
+def camera_profile(camera: dict[str, Any], config: dict[str, Any]) -> CameraProfile:
+    """
+    Get a camera's capture settings, falling back to the global ones.
+
+    Args:
+        camera (dict[str, Any]): The ``[[cameras]]`` entry.
+        config (dict[str, Any]): The whole configuration.
+
+    Returns:
+        CameraProfile: The camera's settings.
+
+    Raises:
+        ValueError: If a setting is invalid.
+    """
+    optimization = config.get("optimization") or {}
+    fps = camera.get("target_fps", config.get("target_fps", _DEFAULTS["target_fps"]))
+    quality = camera.get(
+        "frame_quality",
+        optimization.get("frame_quality", _DEFAULTS["frame_quality"]),
+    )
+    resolution = camera.get(
+        "frame_resolution",
+        optimization.get("frame_resolution", _DEFAULTS["frame_resolution"]),
+    )
+    try:
+        fps = float(fps)
+        quality = int(quality)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Camera '{camera.get('id')}': {e}") from e
+    if fps <= 0:
+        raise ValueError(f"Camera '{camera.get('id')}': target_fps must be positive")
+    return CameraProfile(fps, *parse_resolution(resolution), quality)
+
+
+def plan_capacity(
+    config: dict[str, Any],
+    frame_seconds: float = DEFAULT_FRAME_SECONDS,
+    burst_seconds: float = DEFAULT_BURST_SECONDS,
+) -> EdgePlan:
+    """
+    Compute the load a camera inventory puts on an edge-video node.
+
+    Args:
+        config (dict[str, Any]): The parsed configuration.
+        frame_seconds (float): Worker time per frame.
+        burst_seconds (float): Seconds of frames the buffer should hold.
+
+    Returns:
+        EdgePlan: The plan; profiles are ordered by descending load. With
+            no cameras every rate is zero.
+
+    Raises:
+        ValueError: If a setting is invalid.
+    """
+    optimization = config.get("optimization") or {}
+    redis = config.get("redis") or {}
+    redis_enabled = bool(redis.get("enabled", True))
+    ttl = float(redis.get("ttl_seconds", _DEFAULTS["ttl_seconds"]))
+    max_workers = int(optimization.get("max_workers", _DEFAULTS["max_workers"]))
+    buffer_size = int(optimization.get("buffer_size", _DEFAULTS["buffer_size"]))
+    if max_workers < 1 or buffer_size < 1:
+        raise ValueError("max_workers and buffer_size must be at least 1")
+
+    counts = Counter(camera_profile(c, config) for c in iter_cameras(config))
+    profiles = [
+        _profile_load(profile, count, ttl if redis_enabled else 0)
+        for profile, count in counts.items()
+    ]
+    profiles.sort(key=lambda load: -load.jpeg_bytes_per_second * load.cameras)
+
+    fps = sum(load.profile.fps * load.cameras for load in profiles)
+    demand = fps * frame_seconds
+    # The buffer holds encoded frames; size it with the average frame.
+    jpeg_rate = sum(load.jpeg_bytes_per_second * load.cameras for load in profiles)
+    average_frame = jpeg_rate / fps if fps else 0
+    return EdgePlan(
+        cameras=sum(counts.values()),
+        fps=fps,
+        raw_bytes_per_second=sum(
+            load.raw_bytes_per_second * load.cameras for load in profiles
+        ),
+        jpeg_bytes_per_second=jpeg_rate,
+        redis_enabled=redis_enabled,
+        redis_ttl_seconds=ttl,
+        redis_bytes=sum(load.redis_bytes * load.cameras for load in profiles),
+        max_workers=max_workers,
+        worker_demand=demand,
+        worker_utilization=demand / max_workers,
+        buffer_size=buffer_size,
+        buffer_seconds=buffer_size / fps if fps else 0.0,
+        buffer_bytes=math.ceil(buffer_size * average_frame),
+        recommended_max_workers=max(1, math.ceil(demand / TARGET_UTILIZATION)),
+        recommended_buffer_size=max(1, math.ceil(fps * burst_seconds)),
+        profiles=profiles,
+    )
+
+
+def _profile_load(profile: CameraProfile, cameras: int, ttl: float) -> ProfileLoad:
+    """Compute the per-camera load of a profile."""
+    raw_frame = profile.width * profile.height * 3
+    jpeg_frame = estimate_jpeg_bytes(profile.width, profile.height, profile.quality)
+    return ProfileLoad(
+        profile=profile,
+        cameras=cameras,
+        raw_frame_bytes=raw_frame,
+        jpeg_frame_bytes=jpeg_frame,
+        raw_bytes_per_second=raw_frame * profile.fps,
+        jpeg_bytes_per_second=jpeg_frame * profile.fps,
+        redis_bytes=math.ceil(profile.fps * ttl * (jpeg_frame + REDIS_KEY_OVERHEAD)),
+    )
@@ -0,0 +1,158 @@
+"""File helpers for T3 CLI."""
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+
+def _umask() -> int:
+    """Get the process umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import: os.umask() cannot be queried without setting it,
+# which would race with worker threads writing files.
+_UMASK = _umask()
+
+# Modes a newly created regular or executable file would have.
+DEFAULT_FILE_MODE = 0o666 & ~_UMASK
+DEFAULT_EXECUTABLE_MODE = 0o777 & ~_UMASK
+
+# Outcomes of sync_file().
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+
+_COMPARE_CHUNK = 64 * 1024
+
+
+def atomic_write_text(path: Path, content: str, encoding: str = "utf-8") -> None:
+    """
+    Write text to a file atomically.
+
+    The content is written to a temporary file in the same directory, flushed
+    to disk and moved over the destination with ``os.replace``, so readers
+    and crashes never observe a partially written file. An existing file's
+    permissions are preserved; new files get the usual umask-based mode.
+
+    Args:
+        path (Path): Destination file.
+        content (str): Text to write.
+        encoding (str): Text encoding (default: utf-8).
+    """
+    atomic_write_bytes(path, content.encode(encoding))
+
+
+def atomic_write_bytes(
+    path: Path, data: bytes, mode: int | None = None, durable: bool = True
+) -> None:
+    """
+    Write bytes to a file atomically.
+
+    Args:
+        path (Path): Destination file.
+        data (bytes): Content to write.
+        mode (int | None): Permission bits for the file. If None, an existing
+            file's permissions are preserved and new files get the usual
+            umask-based mode.
+        durable (bool): Whether to fsync before the rename. Derived files
+            that are validated on read (caches) can skip it.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if mode is None:
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = DEFAULT_FILE_MODE
+
+    descriptor, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as temp_file:
+            temp_file.write(data)
+            if durable:
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+        os.chmod(temp_name, mode)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def file_action(path: Path, data: bytes, executable: bool | None = None) -> str:
+    """
+    Determine what writing content to a file would change.
+
+    Sizes are compared first; only files of the right size are read, in
+    chunks, and compared with the content, stopping at the first difference.
+
+    Args:
+        path (Path): The file.
+        data (bytes): The intended content.
+        executable (bool | None): Whether the file should be executable;
+            None to ignore permissions.
+
+    Returns:
+        str: ``created`` if the file does not exist, ``unchanged`` if it
+            already has the content (and executable bit), else ``updated``.
+    """
+    try:
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        return CREATED
+    if not stat.S_ISREG(stat_result.st_mode) or stat_result.st_size != len(data):
+        return UPDATED
+    if executable is not None and executable != bool(stat_result.st_mode & 0o111):
+        return UPDATED
+
+    view = memoryview(data)
+    with open(path, "rb") as existing:
+        for offset in range(0, len(data), _COMPARE_CHUNK):
+            chunk = existing.read(_COMPARE_CHUNK)
+            if chunk != view[offset : offset + _COMPARE_CHUNK]:
+                return UPDATED
+    return UNCHANGED
+
+
+def sync_file(
+    path: Path, data: bytes, executable: bool | None = None, dry_run: bool = False
+) -> str:
+    """
+    Write content to a file only if it differs.
+
+    Unchanged files are not touched, so their modification times survive;
+    others are written atomically with :func:`atomic_write_bytes`, without
+    fsync.
+
+    Args:
+        path (Path): The file.
+        data (bytes): The intended content.
+        executable (bool | None): Whether the file should be executable;
+            None to keep existing permissions (new files get the default).
+        dry_run (bool): Only determine the outcome.
+
+    Returns:
+        str: ``created``, ``updated`` or ``unchanged``, as determined by
+            :func:`file_action`.
+    """
+    action = file_action(path, data, executable)
+    if action == UNCHANGED or dry_run:
+        return action
+
+    mode = None
+    if executable is not None and action == CREATED:
+        mode = DEFAULT_EXECUTABLE_MODE if executable else DEFAULT_FILE_MODE
+    elif executable is not None:
+        current = stat.S_IMODE(os.stat(path).st_mode)
+        if executable:
+            mode = current | ((current & 0o444) >> 2)
+        else:
+            mode = current & ~0o111
+    atomic_write_bytes(path, data, mode=mode, durable=False)
+    return action
@@ -0,0 +1,470 @@
+"""Inspection of the edge-video Redis frame store.
+
+edge-video stores each frame under ``<prefix>:<camera>:<timestamp>`` with
+the ``[redis] ttl_seconds`` expiry. Keys are walked with ``SCAN``, which
+never blocks the server, and every ``SCAN`` batch is measured with one
+pipelined round trip. ``SCAN`` may return a key twice while the server
+resizes its tables, so counts are exact only for a stable keyspace.
+
+Dumps fetch frames with ``MGET`` in fixed-size batches and hand them to a
+bounded number of writes at a time, so memory use does not grow with the
+number of frames.
+"""
+
+import hashlib
+import io
+import math
+import random
+import re
+import tarfile
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+from t3.core.resp import RedisAddress, RedisClient, RedisError, parse_address
+
+DEFAULT_PREFIX = "frames"
+
+DEFAULT_ADDRESS = "localhost:6379"
+
+# Keys the server examines per SCAN call.
+SCAN_COUNT = 1000
+
+# Frames fetched per MGET.
+MGET_BATCH = 64
+
+_GLOB_SPECIAL = re.compile(r"([*?\[\]\\])")
+
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d*)?|\.\d+)\s*(ms|s|m|h|d)?\s*$")
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+class FrameKey(NamedTuple):
+    """The parts of a frame key."""
+
+    camera: str
+    timestamp: float | None
+
+
+class FrameStore(NamedTuple):
+    """Where frames are stored, from the ``[redis]`` section."""
+
+    address: RedisAddress
+    prefix: str
+    ttl_seconds: float | None
+
+
+def frame_store(
+    config: dict[str, Any],
+    address: str | None = None,
+    prefix: str | None = None,
+) -> FrameStore:
+    """
+    Get the frame store settings of an edge-video configuration.
+
+    Args:
+        config (dict[str, Any]): The parsed configuration.
+        address (str | None): Overrides ``[redis] address``.
+        prefix (str | None): Overrides ``[redis] prefix``.
+
+    Returns:
+        FrameStore: The settings.
+
+    Raises:
+        ValueError: If the address is malformed.
+    """
+    redis = config.get("redis") or {}
+    ttl = redis.get("ttl_seconds")
+    return FrameStore(
+        parse_address(address or str(redis.get("address", DEFAULT_ADDRESS))),
+        prefix or str(redis.get("prefix", DEFAULT_PREFIX)),
+        float(ttl) if ttl is not None else None,
+    )
+
+
+def key_pattern(prefix: str, camera: str | None = None) -> str:
+    """
+    Get the ``SCAN MATCH`` pattern of frame keys.
+
+    Args:
+        prefix (str): The key prefix.
+        camera (str | None): Only this camera's frames.
+
+    Returns:
+        str: The glob pattern, with special characters escaped.
+    """
+    escaped = _GLOB_SPECIAL.sub(r"\\\1", prefix)
+    if camera is not None:
+        escaped += ":" + _GLOB_SPECIAL.sub(r"\\\1", camera)
+    return f"{escaped}:*"
+
+
+def parse_timestamp(text: str) -> float | None:
+    """
+    Parse a Unix timestamp, telling its unit apart by magnitude.
+
+    Seconds, milliseconds, microseconds and nanoseconds are recognized.
+
+    Args:
+        text (str): The timestamp, e.g. the last segment of a frame key.
+
+    Returns:
+        float | None: Seconds since the epoch, or None if not a timestamp.
+    """
+    try:
+        value = float(text)
+    except ValueError:
+        return None
+    if not math.isfinite(value):
+        return None
+    while value > 1e11:
+        value /= 1000
+    # Anything before 1973 is a sequence number, not a time.
+    return value if value >= 1e8 else None
+
+
+def parse_frame_key(key: bytes, prefix: str) -> FrameKey | None:
+    """
+    Split a frame key into camera and timestamp.
+
+    Args:
+        key (bytes): The key.
+        prefix (str): The key prefix.
+
+    Returns:
+        FrameKey | None: The parts, with no timestamp if the last segment
+            is not one; None if the key is not under the prefix.
+    """
+    head, separator, rest = key.decode(errors="replace").partition(prefix + ":")
+    if head or not separator or not rest:
+        return None
+    camera, _, tail = rest.partition(":")
+    return FrameKey(camera, parse_timestamp(tail.rpartition(":")[2]) if tail else None)
+
+
+def frame_age(
+    frame_key: FrameKey,
+    ttl_ms: int | None,
+    ttl_seconds: float | None,
+    now: float,
+) -> float | None:
+    """
+    Get how long ago a frame was stored.
+
+    Args:
+        frame_key (FrameKey): The parsed key.
+        ttl_ms (int | None): The key's remaining time to live from
+            ``PTTL``, if known.
+        ttl_seconds (float | None): The expiry frames are stored with.
+        now (float): The current Unix time.
+
+    Returns:
+        float | None: Seconds, from the key's timestamp or else from how
+            much of its TTL has elapsed; None if neither is known.
+    """
+    if frame_key.timestamp is not None:
+        return max(0.0, now - frame_key.timestamp)
+    if ttl_ms is not None and ttl_ms >= 0 and ttl_seconds is not None:
+        return max(0.0, ttl_seconds - ttl_ms / 1000)
+    return None
+
+
+class CameraStats:
+    """Frame keys, memory and expiry of one camera."""
+
+    def __init__(self, camera: str) -> None:
+        """Initialize with no keys."""
+        self.camera = camera
+        self.keys = 0
+        self.measured = 0
+        self.measured_bytes = 0
+        self.persistent = 0
+        # Remaining TTL in whole seconds -> keys; bounded by ttl_seconds.
+        self.ttls: Counter[int] = Counter()
+        self.oldest: float | None = None
+
+    @property
+    def bytes(self) -> int:
+        """int: Memory of all keys, extrapolated from the measured ones."""
+        if not self.measured:
+            return 0
+        return round(self.measured_bytes * self.keys / self.measured)
+
+    @property
+    def average_bytes(self) -> int:
+        """int: Mean memory per measured key."""
+        return round(self.measured_bytes / self.measured) if self.measured else 0
+
+    def ttl_percentile(self, pct: float) -> int | None:
+        """
+        Get a percentile of the remaining TTLs of measured keys.
+
+        Args:
+            pct (float): Percentile in the range 0-100.
+
+        Returns:
+            int | None: Seconds, or None if no measured key expires.
+        """
+        total = sum(self.ttls.values())
+        if not total:
+            return None
+        rank = math.ceil(total * pct / 100) or 1
+        seen = 0
+        for seconds, count in sorted(self.ttls.items()):
+            seen += count
+            if seen >= rank:
+                return seconds
+        return None
+
+    def add_age(self, age: float | None) -> None:
+        """Record a frame's age, keeping the oldest."""
+        if age is not None and (self.oldest is None or age > self.oldest):
+            self.oldest = age
+
+
+def collect_frame_stats(
+    client: RedisClient,
+    store: FrameStore,
+    sample: float = 1.0,
+    count: int = SCAN_COUNT,
+    on_batch: Callable[[int], None] | None = None,
+    rng: random.Random | None = None,
+) -> dict[str, CameraStats]:
+    """
+    Aggregate the frame keys of every camera.
+
+    Every key is counted, but only a ``sample`` fraction of them is
+    measured with ``MEMORY USAGE`` and ``PTTL``; memory is extrapolated
+    per camera from the measured keys.
+
+    Args:
+        client (RedisClient): The connection.
+        store (FrameStore): Frame store settings.
+        sample (float): Fraction of keys to measure, in (0, 1].
+        count (int): ``SCAN COUNT`` hint.
+        on_batch (Callable[[int], None] | None): Called with the number of
+            keys in each ``SCAN`` batch.
+        rng (random.Random | None): Chooses the measured keys.
+
+    Returns:
+        dict[str, CameraStats]: Statistics by camera.
+    """
+    rng = rng or random.Random()
+    cameras: dict[str, CameraStats] = {}
+    now = time.time()
+    for keys in client.scan_iter(key_pattern(store.prefix), count):
+        measured = []
+        for key in keys:
+            frame_key = parse_frame_key(key, store.prefix)
+            if frame_key is None:
+                continue
+            stats = cameras.get(frame_key.camera)
+            if stats is None:
+                stats = cameras[frame_key.camera] = CameraStats(frame_key.camera)
+            stats.keys += 1
+            if frame_key.timestamp is not None:
+                stats.add_age(now - frame_key.timestamp)
+            if sample >= 1 or rng.random() < sample:
+                measured.append((stats, frame_key, key))
+
+        replies = client.pipeline(
+            command
+            for _, _, key in measured
+            for command in (("MEMORY", "USAGE", key), ("PTTL", key))
+        )
+        for (stats, frame_key, _), usage, ttl_ms in zip(
+            measured, replies[::2], replies[1::2], strict=True
+        ):
+            if isinstance(usage, RedisError) or isinstance(ttl_ms, RedisError):
+                continue
+            if usage is None or ttl_ms == -2:
+                # Expired since it was scanned.
+                stats.keys -= 1
+                continue
+            stats.measured += 1
+            stats.measured_bytes += usage
+            if ttl_ms == -1:
+                stats.persistent += 1
+            else:
+                stats.ttls[math.ceil(ttl_ms / 1000)] += 1
+                if frame_key.timestamp is None:
+                    stats.add_age(frame_age(frame_key, ttl_ms, store.ttl_seconds, now))
+        if on_batch is not None:
+            on_batch(len(keys))
+    return {camera: stats for camera, stats in cameras.items() if stats.keys}
+
+
+class FrameRef(NamedTuple):
+    """A stored frame selected for dumping."""
+
+    key: bytes
+    time: float
+    name: str
+
+
+def parse_duration(text: str) -> float:
+    """
+    Parse a duration such as ``30s``, ``5m``, ``1.5h`` or ``250ms``.
+
+    Args:
+        text (str): The duration; a bare number is in seconds.
+
+    Returns:
+        float: Seconds.
+
+    Raises:
+        ValueError: If the text is not a duration.
+    """
+    match = _DURATION.match(text.lower())
+    if not match:
+        raise ValueError(f"Invalid duration '{text}' (e.g. 30s, 5m, 1h)")
+    return float(match[1]) * _DURATION_UNITS[match[2] or "s"]
+
+
+def select_frames(
+    client: RedisClient,
+    store: FrameStore,
+    camera: str,
+    since: float,
+    count: int = SCAN_COUNT,
+    now: float | None = None,
+) -> list[FrameRef]:
+    """
+    Find a camera's frames stored in the last ``since`` seconds.
+
+    Frame times come from the key's timestamp; keys without one are dated
+    from their remaining TTL with a pipelined ``PTTL`` per ``SCAN`` batch.
+
+    Args:
+        client (RedisClient): The connection.
+        store (FrameStore): Frame store settings.
+        camera (str): The camera ID.
+        since (float): Maximum frame age in seconds.
+        count (int): ``SCAN COUNT`` hint.
+        now (float | None): The current Unix time.
+
+    Returns:
+        list[FrameRef]: The frames, oldest first. Only keys are held, not
+            frame data.
+    """
+    now = time.time() if now is None else now
+    selected: dict[bytes, FrameRef] = {}
+    for keys in client.scan_iter(key_pattern(store.prefix, camera), count):
+        undated = []
+        for key in keys:
+            frame_key = parse_frame_key(key, store.prefix)
+            if frame_key is None or frame_key.camera != camera:
+                continue
+            if frame_key.timestamp is None:
+                undated.append((key, frame_key))
+            elif now - frame_key.timestamp <= since:
+                selected[key] = _frame_ref(key, store.prefix, frame_key.timestamp)
+
+        ttls = client.pipeline(("PTTL", key) for key, _ in undated)
+        for (key, frame_key), ttl_ms in zip(undated, ttls, strict=True):
+            if isinstance(ttl_ms, RedisError):
+                continue
+            age = frame_age(frame_key, ttl_ms, store.ttl_seconds, now)
+            if age is not None and age <= since:
+                selected[key] = _frame_ref(key, store.prefix, now - age)
+    return sorted(selected.values(), key=lambda ref: (ref.time, ref.key))
+
+
+def _frame_ref(key: bytes, prefix: str, stored: float) -> FrameRef:
+    """
+    Describe a selected frame, naming its file after the key.
+
+    Characters unsafe in file names become ``_``, so different keys could
+    share a name; a short hash of the key keeps each file apart.
+    """
+    name = key.decode(errors="replace").removeprefix(f"{prefix}:")
+    safe = _UNSAFE_NAME.sub("_", name).strip("._")
+    return FrameRef(key, stored, f"{safe}-{hashlib.sha1(key).hexdigest()[:8]}.jpg")
+
+
+def fetch_frames(
+    client: RedisClient, frames: Iterable[FrameRef], batch: int = MGET_BATCH
+) -> Iterator[tuple[FrameRef, bytes | None]]:
+    """
+    Fetch frame data with one ``MGET`` per batch.
+
+    Args:
+        client (RedisClient): The connection.
+        frames (Iterable[FrameRef]): The frames.
+        batch (int): Frames per ``MGET``.
+
+    Yields:
+        tuple[FrameRef, bytes | None]: Each frame and its data, or None if
+            it expired before it was fetched.
+    """
+    remaining = iter(frames)
+    while chunk := list(islice(remaining, batch)):
+        data = client.execute("MGET", *(ref.key for ref in chunk))
+        yield from zip(chunk, data, strict=True)
+
+
+def write_frame_files(
+    frames: Iterable[tuple[FrameRef, bytes]],
+    directory: Path,
+    workers: int = 4,
+) -> None:
+    """
+    Write frames as files through a thread pool.
+
+    At most twice ``workers`` frames are queued, so a slow disk holds back
+    fetching instead of filling memory.
+
+    Args:
+        frames (Iterable[tuple[FrameRef, bytes]]): Frames and their data.
+        directory (Path): Destination; created if needed.
+        workers (int): Concurrent writes.
+
+    Raises:
+        OSError: If a file cannot be written.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    slots = threading.BoundedSemaphore(workers * 2)
+    failures: list[BaseException] = []
+
+    def done(future: Future[int]) -> None:
+        slots.release()
+        if future.exception() is not None:
+            failures.append(future.exception())
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for ref, data in frames:
+            slots.acquire()
+            if failures:
+                slots.release()
+                break
+            pool.submit((directory / ref.name).write_bytes, data).add_done_callback(
+                done
+            )
+    if failures:
+        raise failures[0]
+
+
+def write_frame_tar(frames: Iterable[tuple[FrameRef, bytes]], stream: BinaryIO) -> None:
+    """
+    Write frames to a tar stream, one member per frame.
+
+    Args:
+        frames (Iterable[tuple[FrameRef, bytes]]): Frames and their data.
+        stream (BinaryIO): Destination; written sequentially, so it may be
+            a pipe.
+    """
+    with tarfile.open(fileobj=stream, mode="w|") as archive:
+        for ref, data in frames:
+            info = tarfile.TarInfo(ref.name)
+            info.size = len(data)
+            info.mtime = int(ref.time)
+            info.mode = 0o644
+            archive.addfile(info, io.BytesIO(data))
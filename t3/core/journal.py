@@ -0,0 +1,195 @@
+"""Change journal and inter-process locking for the T3 CLI configuration.
+
+Large configurations are not rewritten on every change. Each commit appends
+its operations to ``config.json.journal`` as JSON lines instead, and readers
+replay them on top of ``config.json``. Once the journal grows past a
+fraction of the base file it is folded back in (compaction). Writers hold an
+exclusive ``flock`` on the configuration directory, readers a shared one, so
+a reader never combines a compacted base with the journal it already
+contains.
+"""
+
+import json
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None  # type: ignore[assignment]
+
+# Base files smaller than this are cheaper to rewrite than to journal.
+JOURNAL_MIN_BASE_BYTES = 64 * 1024
+
+# Compact once the journal reaches this fraction of the base file's size,
+# which keeps the amortized cost of a change proportional to its own size.
+JOURNAL_COMPACT_RATIO = 0.25
+
+Operation = tuple[Any, ...]
+
+
+def journal_path(source: Path) -> Path:
+    """
+    Get the journal path for a configuration file.
+
+    Args:
+        source (Path): The JSON configuration file.
+
+    Returns:
+        Path: ``<source>.journal`` in the same directory.
+    """
+    return source.with_name(f"{source.name}.journal")
+
+
+@contextmanager
+def config_lock(source: Path, exclusive: bool) -> Iterator[None]:
+    """
+    Hold an advisory lock on the directory of a configuration file.
+
+    Locking the directory rather than a dedicated file leaves nothing behind
+    next to the configuration. Where locking is unsupported (no ``fcntl``,
+    missing directory, filesystems without ``flock``), the block runs
+    unlocked. The lock is not reentrant: never nest it for the same file.
+
+    Args:
+        source (Path): The JSON configuration file.
+        exclusive (bool): True for writers, False for readers.
+
+    Yields:
+        None
+    """
+    descriptor = None
+    if fcntl is not None:
+        try:
+            descriptor = os.open(source.parent, os.O_RDONLY)
+            fcntl.flock(descriptor, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        except OSError:
+            if descriptor is not None:
+                os.close(descriptor)
+            descriptor = None
+
+    try:
+        yield
+    finally:
+        if descriptor is not None:
+            os.close(descriptor)
+
+
+def encode_operations(operations: list[Operation]) -> bytes:
+    """
+    Serialize operations as journal lines.
+
+    Args:
+        operations (list[Operation]): ``("set", key, value)``,
+            ``("delete", key)`` or ``("clear",)`` tuples.
+
+    Returns:
+        bytes: One JSON line per operation.
+    """
+    lines = []
+    for operation in operations:
+        record: dict[str, Any] = {"op": operation[0]}
+        if len(operation) > 1:
+            record["key"] = operation[1]
+        if len(operation) > 2:
+            record["value"] = operation[2]
+        lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+    return "".join(lines).encode("utf-8")
+
+
+def read_journal(source: Path, offset: int = 0) -> tuple[list[Operation], int]:
+    """
+    Read journal operations starting at a byte offset.
+
+    A trailing line without a newline is an append still in progress (or
+    interrupted by a crash) and is left for a later read. Malformed lines are
+    skipped.
+
+    Args:
+        source (Path): The JSON configuration file.
+        offset (int): Byte offset to start reading from.
+
+    Returns:
+        tuple[list[Operation], int]: The operations and the offset just past
+            the last complete line.
+    """
+    try:
+        with journal_path(source).open("rb") as journal_file:
+            journal_file.seek(offset)
+            data = journal_file.read()
+    except OSError:
+        return [], offset
+
+    end = data.rfind(b"\n") + 1
+    operations = []
+    for line in data[:end].splitlines():
+        try:
+            record = json.loads(line)
+            operation = record["op"]
+            if operation == "set":
+                operations.append(("set", str(record["key"]), record["value"]))
+            elif operation == "delete":
+                operations.append(("delete", str(record["key"])))
+            elif operation == "clear":
+                operations.append(("clear",))
+        except (ValueError, TypeError, KeyError):
+            continue
+    return operations, offset + end
+
+
+def append_journal(source: Path, data: bytes, mode: int) -> None:
+    """
+    Append encoded operations to the journal with a single write.
+
+    Must be called with the exclusive lock held.
+
+    Args:
+        source (Path): The JSON configuration file.
+        data (bytes): Output of :func:`encode_operations`.
+        mode (int): Permission bits for a newly created journal.
+    """
+    descriptor = os.open(
+        journal_path(source), os.O_RDWR | os.O_APPEND | os.O_CREAT, mode
+    )
+    try:
+        # Terminate a line left incomplete by an interrupted writer.
+        size = os.fstat(descriptor).st_size
+        if size and os.pread(descriptor, 1, size - 1) != b"\n":
+            data = b"\n" + data
+        view = memoryview(data)
+        while view:
+            view = view[os.write(descriptor, view) :]
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def remove_journal(source: Path) -> None:
+    """
+    Delete the journal of a configuration file, if any.
+
+    Args:
+        source (Path): The JSON configuration file.
+    """
+    path = journal_path(source)
+    if path.exists():
+        path.unlink()
+
+
+def should_compact(base_size: int, journal_size: int) -> bool:
+    """
+    Decide whether changes should be folded into the base file.
+
+    Args:
+        base_size (int): Size of the base file in bytes (0 if missing).
+        journal_size (int): Journal size in bytes after the pending append.
+
+    Returns:
+        bool: True to rewrite the base file instead of appending.
+    """
+    if base_size < JOURNAL_MIN_BASE_BYTES:
+        return True
+    return journal_size >= base_size * JOURNAL_COMPACT_RATIO
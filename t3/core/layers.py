@@ -0,0 +1,461 @@
+"""Layered configuration resolution for T3 CLI.
+
+A setting is looked up, from highest to lowest precedence, in:
+
+1. ``T3_*`` environment variables (``T3_LOG_LEVEL`` is ``log_level``,
+   ``T3_VIDEO__FPS`` is ``video.fps``);
+2. the project file ``.t3/config.{json,toml,yaml,yml}`` found by walking up
+   from the working directory;
+3. the user file (``T3_CONFIG_PATH`` or ``~/.t3/config.json``);
+4. built-in defaults.
+
+Sections are merged deeply. The merge of the file layers is memoized per
+process and, when a project file takes part, cached on disk keyed by the
+layer files' signatures, so later invocations neither re-parse the project
+file nor re-merge.
+"""
+
+import hashlib
+import marshal
+import os
+import zlib
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+from t3.core.config import (
+    cached_manager,
+    default_config_path,
+    file_signature,
+    get_config,
+    parse_bool,
+    parse_value,
+)
+from t3.core.files import atomic_write_bytes
+from t3.core.journal import journal_path
+
+ENV_PREFIX = "T3_"
+
+PROJECT_CONFIG_NAMES = ("config.json", "config.toml", "config.yaml", "config.yml")
+
+DEFAULTS: dict[str, Any] = {
+    "debug": False,
+    "log_level": "INFO",
+    "templates_path": "~/.t3/templates",
+    "cache_dir": "~/.t3/cache",
+    "cache_enabled": True,
+    "cache_ttl": 3600,
+    "cache_max_mb": 256,
+    "config_snapshot": True,
+    "use_daemon": False,
+    "daemon_socket": "~/.t3/daemon.sock",
+    "dev_mode": False,
+    "verbose": False,
+    "no_color": False,
+    "force_color": False,
+    "theme": "auto",
+}
+
+# Identifies DEFAULTS in cache keys, so changing them invalidates the cache.
+_DEFAULTS_CRC = zlib.crc32(marshal.dumps(DEFAULTS))
+
+_MISSING = object()
+
+LayerSignature = tuple[Any, ...]
+
+# File layers and their merge per (project file, user file), with the
+# signature they were loaded for.
+_resolved: dict[
+    tuple[Path | None, Path],
+    tuple[LayerSignature, list["Layer"], dict[str, Any]],
+] = {}
+
+
+class Layer:
+    """A named source of configuration values whose document loads lazily."""
+
+    def __init__(
+        self, name: str, source: str, load: Callable[[], dict[str, Any]]
+    ) -> None:
+        """
+        Initialize the layer.
+
+        Args:
+            name (str): Layer name: ``env``, ``project``, ``user`` or
+                ``default``.
+            source (str): Where the values come from, for display.
+            load (Callable[[], dict[str, Any]]): Returns the layer's document.
+        """
+        self.name = name
+        self.source = source
+        self._load = load
+        self._document: dict[str, Any] | None = None
+
+    @property
+    def document(self) -> dict[str, Any]:
+        """dict[str, Any]: The layer's values as a nested document."""
+        if self._document is None:
+            self._document = self._load()
+        return self._document
+
+
+class LayeredConfig:
+    """The merged view of several configuration layers, with provenance."""
+
+    def __init__(self, layers: list[Layer], merged: dict[str, Any]) -> None:
+        """
+        Initialize the view.
+
+        Args:
+            layers (list[Layer]): Layers from highest to lowest precedence.
+            merged (dict[str, Any]): The merge of every layer.
+        """
+        self.layers = layers
+        self.merged = merged
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get the effective value of a setting.
+
+        Args:
+            key (str): The setting, as a dotted path.
+            default (Any): Returned if no layer defines the setting.
+
+        Returns:
+            Any: The value from the highest layer defining it; sections are
+                merged across layers.
+        """
+        return lookup(self.merged, key, default)
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Check whether any layer defines a setting.
+
+        Args:
+            key (str): The setting, as a dotted path.
+
+        Returns:
+            bool: True if the setting is defined.
+        """
+        return lookup(self.merged, key, _MISSING) is not _MISSING
+
+    def explain(self, key: str) -> list[tuple[str, str, Any]]:
+        """
+        List every layer that defines a setting.
+
+        Args:
+            key (str): The setting, as a dotted path.
+
+        Returns:
+            list[tuple[str, str, Any]]: Layer name, source (the variable name
+                for the environment) and value, from highest to lowest
+                precedence; the first one wins.
+        """
+        found = []
+        for layer in self.layers:
+            value = lookup(layer.document, key, _MISSING)
+            if value is not _MISSING:
+                source = layer.source
+                if layer.name == "env":
+                    source = env_variable(key)
+                    if isinstance(value, dict):
+                        source += "__*"
+                found.append((layer.name, source, value))
+        return found
+
+
+def lookup(document: dict[str, Any], key: str, default: Any = None) -> Any:
+    """
+    Look up a dotted path in a nested document.
+
+    Args:
+        document (dict[str, Any]): The document.
+        key (str): The dotted path.
+        default (Any): Returned if the path does not exist.
+
+    Returns:
+        Any: The value at the path, or ``default``.
+    """
+    node: Any = document
+    for part in key.split("."):
+        if not isinstance(node, dict) or part not in node:
+            return default
+        node = node[part]
+    return node
+
+
+def merge_documents(lower: dict[str, Any], higher: dict[str, Any]) -> dict[str, Any]:
+    """
+    Deep-merge two documents without modifying either.
+
+    Subtrees present in only one document are shared with the result rather
+    than copied, so the cost is proportional to the overlap.
+
+    Args:
+        lower (dict[str, Any]): The lower-precedence document.
+        higher (dict[str, Any]): The higher-precedence document.
+
+    Returns:
+        dict[str, Any]: The merged document.
+    """
+    if not higher:
+        return lower
+    if not lower:
+        return higher
+
+    merged = dict(lower)
+    for key, value in higher.items():
+        current = merged.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merged[key] = merge_documents(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def env_variable(key: str) -> str:
+    """
+    Get the environment variable that overrides a setting.
+
+    Args:
+        key (str): The setting, as a dotted path.
+
+    Returns:
+        str: E.g. ``T3_VIDEO__FPS`` for ``video.fps``.
+    """
+    return ENV_PREFIX + key.upper().replace(".", "__")
+
+
+def env_document(environ: Mapping[str, str]) -> dict[str, Any]:
+    """
+    Build a document from ``T3_*`` environment variables.
+
+    Args:
+        environ (Mapping[str, str]): The environment.
+
+    Returns:
+        dict[str, Any]: Settings keyed by lower-cased names, with ``__``
+            separating sections and values parsed like ``config set``.
+    """
+    document: dict[str, Any] = {}
+    for name, raw in environ.items():
+        if not name.startswith(ENV_PREFIX) or len(name) == len(ENV_PREFIX):
+            continue
+
+        parts = name[len(ENV_PREFIX) :].lower().split("__")
+        if not all(parts):
+            continue
+
+        node = document
+        for part in parts[:-1]:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = node[part] = {}
+            node = child
+        if not isinstance(node.get(parts[-1]), dict):
+            node[parts[-1]] = parse_value(raw)
+    return document
+
+
+def find_project_config(start: Path, user_path: Path | None = None) -> Path | None:
+    """
+    Find the nearest project configuration file.
+
+    Walks up from ``start`` looking for ``.t3/config.*``, checking a single
+    ``.t3`` entry per directory. The home directory's ``.t3`` holds the user
+    file and is not a project.
+
+    Args:
+        start (Path): The directory to start from.
+        user_path (Path | None): The user file, never treated as a project.
+
+    Returns:
+        Path | None: The project file, or None if there is none.
+    """
+    home = Path.home()
+    for directory in (start, *start.parents):
+        if directory == home:
+            continue
+
+        config_dir = directory / ".t3"
+        if not config_dir.is_dir():
+            continue
+
+        for name in PROJECT_CONFIG_NAMES:
+            candidate = config_dir / name
+            if candidate != user_path and candidate.is_file():
+                return candidate
+    return None
+
+
+def load_project_document(path: Path) -> dict[str, Any]:
+    """
+    Parse a project configuration file.
+
+    Args:
+        path (Path): A JSON, TOML or YAML file.
+
+    Returns:
+        dict[str, Any]: The document, or ``{}`` if it cannot be read.
+    """
+    from t3.core.config_io import detect_format, load_document, to_json_value
+
+    try:
+        with path.open("r", encoding="utf-8") as stream:
+            return to_json_value(load_document(stream, detect_format(str(path))))
+    except (OSError, ValueError):
+        return {}
+
+
+def resolve_config(
+    cwd: Path | None = None, environ: Mapping[str, str] | None = None
+) -> LayeredConfig:
+    """
+    Resolve the layered configuration for a working directory.
+
+    Args:
+        cwd (Path | None): Directory to search for a project file from;
+            defaults to the current directory.
+        environ (Mapping[str, str] | None): Environment to read ``T3_*``
+            variables from; defaults to ``os.environ``.
+
+    Returns:
+        LayeredConfig: The merged view of every layer.
+    """
+    environ = os.environ if environ is None else environ
+    user_path = default_config_path()
+    project_path = find_project_config(cwd or Path.cwd(), user_path)
+
+    signature = _layer_signature(project_path, user_path)
+    pending = _pending_user_document(user_path)
+    if pending is not None:
+        # Changes held back by a transaction (e.g. in ``t3 batch``) are not
+        # on disk, so the file signatures cannot tell they were made.
+        file_layers, file_merged = _load_file_layers(
+            project_path, user_path, signature, environ, pending
+        )
+    else:
+        entry = _resolved.get((project_path, user_path))
+        if entry is None or entry[0] != signature:
+            layers, merged = _load_file_layers(
+                project_path, user_path, signature, environ
+            )
+            entry = _resolved[(project_path, user_path)] = (signature, layers, merged)
+        _, file_layers, file_merged = entry
+
+    env = env_document(environ)
+    env_layer = Layer("env", f"{ENV_PREFIX}* environment", lambda: env)
+    return LayeredConfig([env_layer, *file_layers], merge_documents(file_merged, env))
+
+
+def get_setting(key: str, default: Any = None) -> Any:
+    """
+    Get the effective value of a setting for the current directory.
+
+    Args:
+        key (str): The setting, as a dotted path.
+        default (Any): Returned if no layer defines the setting.
+
+    Returns:
+        Any: The resolved value.
+    """
+    return resolve_config().get(key, default)
+
+
+def _layer_signature(project_path: Path | None, user_path: Path) -> LayerSignature:
+    """Identify the current state of every file layer."""
+    return (
+        str(project_path) if project_path else None,
+        file_signature(project_path) if project_path else None,
+        file_signature(user_path),
+        file_signature(journal_path(user_path)),
+        _DEFAULTS_CRC,
+    )
+
+
+def _pending_user_document(user_path: Path) -> dict[str, Any] | None:
+    """Get the user document if its manager holds unwritten changes."""
+    manager = cached_manager(user_path)
+    return manager.document if manager is not None and manager.dirty else None
+
+
+def _load_file_layers(
+    project_path: Path | None,
+    user_path: Path,
+    signature: LayerSignature,
+    environ: Mapping[str, str],
+    user_document: dict[str, Any] | None = None,
+) -> tuple[list[Layer], dict[str, Any]]:
+    """
+    Build the project, user and default layers and their merge.
+
+    A ``user_document`` with unwritten changes replaces the user file and
+    bypasses the on-disk cache, whose key only covers the files.
+    """
+
+    def load_user() -> dict[str, Any]:
+        if user_document is not None:
+            return user_document
+        return get_config(str(user_path)).document
+
+    user = Layer("user", str(user_path), load_user)
+    default = Layer("default", "built-in", lambda: DEFAULTS)
+    if project_path is None:
+        return [user, default], merge_documents(DEFAULTS, user.document)
+
+    cache_file = None
+    if user_document is None:
+        cache_file = _cache_file(project_path, user_path, environ)
+    cached = _read_cache(cache_file, signature) if cache_file else None
+    if cached is not None:
+        project_document, merged = cached
+    else:
+        project_document = load_project_document(project_path)
+        merged = merge_documents(
+            merge_documents(DEFAULTS, user.document), project_document
+        )
+        if cache_file:
+            _write_cache(cache_file, signature, project_document, merged)
+
+    project = Layer("project", str(project_path), lambda: project_document)
+    return [project, user, default], merged
+
+
+def _cache_file(
+    project_path: Path, user_path: Path, environ: Mapping[str, str]
+) -> Path | None:
+    """Get the on-disk cache file for a pair of layer files, if enabled."""
+    if not parse_bool(environ.get("T3_CACHE_ENABLED"), default=True):
+        return None
+
+    cache_dir = Path(environ.get("T3_CACHE_DIR") or DEFAULTS["cache_dir"])
+    digest = hashlib.sha1(f"{project_path}\0{user_path}".encode()).hexdigest()
+    return cache_dir.expanduser() / f"layers-{digest[:16]}.marshal"
+
+
+def _read_cache(
+    cache_file: Path, signature: LayerSignature
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
+    """Read a cached merge if it was made for the same layer signature."""
+    try:
+        with cache_file.open("rb") as stream:
+            if marshal.load(stream) != signature:
+                return None
+            project_document, merged = marshal.load(stream)
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    return project_document, merged
+
+
+def _write_cache(
+    cache_file: Path,
+    signature: LayerSignature,
+    project_document: dict[str, Any],
+    merged: dict[str, Any],
+) -> None:
+    """Store a merge for later invocations; failures are ignored."""
+    try:
+        data = marshal.dumps(signature) + marshal.dumps((project_document, merged))
+        atomic_write_bytes(cache_file, data, mode=0o600, durable=False)
+    except (OSError, ValueError):
+        pass
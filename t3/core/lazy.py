@@ -0,0 +1,78 @@
+"""Lazy subcommand loading for the T3 CLI."""
+
+from importlib import import_module
+from typing import Any
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    A Typer group that imports its subcommand modules on demand.
+
+    Subclasses declare ``lazy_subcommands`` as a mapping of command name to
+    an import path of the form ``"package.module:attribute"``, where the
+    attribute is either a Typer app (registered as a group, like
+    ``add_typer``) or an already built click command. The module is
+    only imported when that subcommand is resolved, so invocations such as
+    ``t3 --version`` or ``t3 status`` never pay for the imports of unrelated
+    command groups.
+    """
+
+    lazy_subcommands: dict[str, str] = {}
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        """
+        List eagerly registered and lazy subcommands.
+
+        Args:
+            ctx (Any): The current click context.
+
+        Returns:
+            list[str]: All subcommand names, in registration order.
+        """
+        names = list(super().list_commands(ctx))
+        names.extend(name for name in self.lazy_subcommands if name not in names)
+        return names
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        """
+        Resolve a subcommand, importing its module on first use.
+
+        Args:
+            ctx (Any): The current click context.
+            cmd_name (str): The subcommand name.
+
+        Returns:
+            Any: The resolved click command, or None if unknown.
+        """
+        if cmd_name in self.commands or cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
+
+        command = _load_command(self.lazy_subcommands[cmd_name], cmd_name)
+        self.add_command(command, cmd_name)
+        return command
+
+
+def _load_command(import_path: str, cmd_name: str) -> Any:
+    """
+    Import a Typer app or click command from ``"module:attribute"``.
+
+    Args:
+        import_path (str): Import path of the Typer app or command.
+        cmd_name (str): Name the command is registered under.
+
+    Returns:
+        Any: The click command; Typer apps are built into a group, as
+            ``add_typer`` would have registered them.
+    """
+    module_name, attribute = import_path.split(":", 1)
+    target = getattr(import_module(module_name), attribute)
+
+    if isinstance(target, typer.Typer):
+        command = typer.main.get_group(target)
+    else:
+        command = target
+    command.name = cmd_name
+    return command
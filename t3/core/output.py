@@ -0,0 +1,598 @@
+"""Output rendering for T3 CLI.
+
+Commands report through the active :class:`Renderer` instead of printing
+directly, so the global ``--output`` option decides the format:
+
+- ``rich``: styled tables and panels for terminals (the default);
+- ``plain``: undecorated text, tab-separated tables;
+- ``json``: one JSON document per command;
+- ``ndjson``: one JSON object per line, table rows included.
+
+Only the rich renderer imports Rich. The others write data through a single
+buffered stream on stdout and send messages to stderr, so stdout stays
+machine-readable. Tables are consumed row by row and never materialized.
+"""
+
+import json
+import os
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any, NamedTuple, TextIO
+
+OUTPUT_MODES = ("rich", "plain", "json", "ndjson")
+
+LEVELS = ("info", "success", "warning", "error")
+
+_LEVEL_ICONS = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}
+_LEVEL_STYLES = {
+    "info": "blue",
+    "success": "green",
+    "warning": "yellow",
+    "error": "red",
+}
+_LEVEL_TITLES = {
+    "info": "Info",
+    "success": "Success",
+    "warning": "Warning",
+    "error": "Error",
+}
+
+# Buffered output is handed to the underlying stream in chunks of this size.
+_FLUSH_BYTES = 64 * 1024
+
+# Renderers of the invocations in progress; nested ones (``t3 batch``)
+# restore the outer renderer when they finish.
+_renderers: list["Renderer"] = []
+
+
+class Column(NamedTuple):
+    """A table column."""
+
+    title: str
+    key: str | None = None
+    style: str | None = None
+    justify: str = "left"
+    format: Callable[[Any], str] | None = None
+
+    @property
+    def field(self) -> str:
+        """str: The field name used in JSON output."""
+        return self.key or self.title.lower().replace(" ", "_")
+
+    def render(self, value: Any) -> str:
+        """Format a cell for human-readable output."""
+        if self.format is not None:
+            return self.format(value)
+        return format_value(value)
+
+
+def format_value(value: Any) -> str:
+    """
+    Render a value for humans; strings stay bare, everything else as JSON.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        str: The rendered value.
+    """
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def _encode(value: Any, indent: int | None = None) -> str:
+    """Serialize a value for JSON output; unknown types become strings."""
+    return json.dumps(value, indent=indent, default=str, ensure_ascii=False)
+
+
+class NullProgress:
+    """Progress display that shows nothing, for non-terminal output.
+
+    It implements the subset of ``rich.progress.Progress`` used by commands,
+    so callers handle every output mode the same way.
+    """
+
+    def __enter__(self) -> "NullProgress":
+        """Start the display."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the display."""
+
+    def add_task(
+        self, description: str, total: float | None = None, **fields: Any
+    ) -> int:
+        """
+        Add a task.
+
+        Args:
+            description (str): Task description.
+            total (float | None): Total amount of work, if known.
+            **fields (Any): Extra fields for custom columns.
+
+        Returns:
+            int: The task ID.
+        """
+        return 0
+
+    def update(self, task_id: int, **changes: Any) -> None:
+        """
+        Update a task (``advance``, ``completed``, ``total``, ...).
+
+        Args:
+            task_id (int): The task ID.
+            **changes (Any): The changes.
+        """
+
+    def advance(self, task_id: int, advance: float = 1) -> None:
+        """
+        Advance a task.
+
+        Args:
+            task_id (int): The task ID.
+            advance (float): Amount of work done.
+        """
+
+
+class Renderer(ABC):
+    """Base class for output renderers."""
+
+    mode = ""
+
+    #: Whether stdout carries only data (JSON), not human-readable messages.
+    structured = False
+
+    def __init__(
+        self, stream: TextIO | None = None, buffer_size: int = _FLUSH_BYTES
+    ) -> None:
+        """
+        Initialize the renderer.
+
+        Args:
+            stream (TextIO | None): Destination for data; defaults to stdout.
+            buffer_size (int): Output is handed to the stream once this many
+                characters are buffered; 0 writes through immediately.
+        """
+        self.stream = stream or sys.stdout
+        self.buffer_size = buffer_size
+        self._buffer: list[str] = []
+        self._buffered = 0
+
+    def write(self, text: str) -> None:
+        """
+        Write text to the buffered output stream.
+
+        Args:
+            text (str): The text to write.
+        """
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand buffered output to the underlying stream."""
+        if self._buffer:
+            self.stream.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        self.stream.flush()
+
+    def close(self) -> None:
+        """Flush pending output and stop being the active renderer."""
+        self.flush()
+        if self in _renderers:
+            _renderers.remove(self)
+
+    @abstractmethod
+    def message(
+        self,
+        level: str,
+        text: str,
+        icon: str | None = None,
+        panel: bool = False,
+        style: str | None = None,
+    ) -> None:
+        """
+        Report a status message.
+
+        Args:
+            level (str): One of ``LEVELS``.
+            text (str): The message.
+            icon (str | None): Icon shown by the rich renderer instead of the
+                level's default; ``""`` for none.
+            panel (bool): Whether the rich renderer frames it in a panel.
+            style (str | None): Rich style instead of the level's colour.
+        """
+
+    @abstractmethod
+    def table(
+        self,
+        columns: Sequence[Column],
+        rows: Iterable[Sequence[Any]],
+        title: str | None = None,
+    ) -> int:
+        """
+        Output a table, consuming the rows lazily.
+
+        Args:
+            columns (Sequence[Column]): The columns.
+            rows (Iterable[Sequence[Any]]): Raw cell values, one sequence per
+                row.
+            title (str | None): Table title for human-readable output.
+
+        Returns:
+            int: The number of rows written.
+        """
+
+    @abstractmethod
+    def record(
+        self,
+        data: Mapping[str, Any],
+        text: str | None = None,
+        title: str | None = None,
+        style: str | None = None,
+    ) -> None:
+        """
+        Output a single result.
+
+        Args:
+            data (Mapping[str, Any]): The result's fields.
+            text (str | None): Human-readable form; if omitted, the fields
+                are listed.
+            title (str | None): Title for the listed fields.
+            style (str | None): Rich style for ``text``.
+        """
+
+    def progress(self) -> Any:
+        """
+        Create a progress display for long-running work.
+
+        Returns:
+            Any: A ``rich.progress.Progress`` for the rich renderer; a
+                :class:`NullProgress` otherwise. Use it as a context manager.
+        """
+        return NullProgress()
+
+    def confirm(self, question: str, default: bool = False) -> bool:
+        """
+        Ask a yes/no question.
+
+        Args:
+            question (str): The question.
+            default (bool): The answer for an empty reply.
+
+        Returns:
+            bool: The answer.
+        """
+        import typer
+
+        self.flush()
+        return typer.confirm(question, default=default, err=self.structured)
+
+    def prompt(self, question: str, default: str | None = None) -> str:
+        """
+        Ask for a value.
+
+        Args:
+            question (str): The question.
+            default (str | None): The value for an empty reply.
+
+        Returns:
+            str: The answer.
+        """
+        import typer
+
+        self.flush()
+        return typer.prompt(question, default=default, err=self.structured)
+
+
+class RichRenderer(Renderer):
+    """Styled terminal output through a Rich console."""
+
+    mode = "rich"
+
+    def __init__(
+        self, stream: TextIO | None = None, buffer_size: int = _FLUSH_BYTES
+    ) -> None:
+        """
+        Initialize the renderer.
+
+        Args:
+            stream (TextIO | None): Destination; defaults to stdout.
+            buffer_size (int): Unused; the console writes directly.
+        """
+        super().__init__(stream, buffer_size)
+        self._console = None
+
+    @property
+    def console(self) -> Any:
+        """rich.console.Console: The console, created on first use."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(file=self.stream)
+        return self._console
+
+    def message(
+        self,
+        level: str,
+        text: str,
+        icon: str | None = None,
+        panel: bool = False,
+        style: str | None = None,
+    ) -> None:
+        """Print a styled message, optionally in a panel."""
+        icon = _LEVEL_ICONS[level] if icon is None else icon
+        content = f"{icon} {text}" if icon else text
+        style = style or _LEVEL_STYLES[level]
+        if panel:
+            from rich.panel import Panel
+
+            self.console.print(
+                Panel(
+                    content, title=_LEVEL_TITLES[level], title_align="left", style=style
+                )
+            )
+        else:
+            self.console.print(content, style=style)
+
+    def progress(self) -> Any:
+        """Create a Rich progress display on the console."""
+        from rich.progress import (
+            BarColumn,
+            MofNCompleteColumn,
+            Progress,
+            TextColumn,
+            TimeElapsedColumn,
+        )
+
+        return Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=self.console,
+        )
+
+    def confirm(self, question: str, default: bool = False) -> bool:
+        """Ask a yes/no question with a Rich prompt."""
+        from rich.prompt import Confirm
+
+        return Confirm.ask(question, default=default, console=self.console)
+
+    def prompt(self, question: str, default: str | None = None) -> str:
+        """Ask for a value with a Rich prompt."""
+        from rich.prompt import Prompt
+
+        if default is None:
+            return Prompt.ask(question, console=self.console)
+        return Prompt.ask(question, default=default, console=self.console)
+
+    def table(
+        self,
+        columns: Sequence[Column],
+        rows: Iterable[Sequence[Any]],
+        title: str | None = None,
+    ) -> int:
+        """Print a Rich table."""
+        from rich.table import Table
+
+        table = Table(title=title, show_header=True, header_style="bold magenta")
+        for column in columns:
+            table.add_column(
+                column.title,
+                style=column.style,
+                justify=column.justify,  # type: ignore[arg-type]
+                no_wrap=column is columns[0],
+            )
+
+        count = 0
+        for row in rows:
+            table.add_row(
+                *(column.render(v) for column, v in zip(columns, row, strict=True))
+            )
+            count += 1
+
+        self.console.print(table)
+        return count
+
+    def record(
+        self,
+        data: Mapping[str, Any],
+        text: str | None = None,
+        title: str | None = None,
+        style: str | None = None,
+    ) -> None:
+        """Print the text, or the fields as a property table."""
+        if text is not None:
+            self.console.print(text, style=style)
+            return
+
+        columns = (Column("Property", style="cyan"), Column("Value", style="green"))
+        self.table(columns, data.items(), title=title)
+
+
+class PlainRenderer(Renderer):
+    """Undecorated text; tables are tab-separated with a header line."""
+
+    mode = "plain"
+
+    def message(
+        self,
+        level: str,
+        text: str,
+        icon: str | None = None,
+        panel: bool = False,
+        style: str | None = None,
+    ) -> None:
+        """Write informational messages to stdout, problems to stderr."""
+        if level in ("warning", "error"):
+            self.flush()
+            sys.stderr.write(f"{level}: {text}\n")
+        else:
+            self.write(f"{text}\n")
+
+    def table(
+        self,
+        columns: Sequence[Column],
+        rows: Iterable[Sequence[Any]],
+        title: str | None = None,
+    ) -> int:
+        """Write a header line and one tab-separated line per row."""
+        self.write("\t".join(column.title for column in columns) + "\n")
+        count = 0
+        for row in rows:
+            cells = (column.render(v) for column, v in zip(columns, row, strict=True))
+            self.write("\t".join(cells) + "\n")
+            count += 1
+        return count
+
+    def record(
+        self,
+        data: Mapping[str, Any],
+        text: str | None = None,
+        title: str | None = None,
+        style: str | None = None,
+    ) -> None:
+        """Write the text, or one ``key: value`` line per field."""
+        if text is not None:
+            self.write(f"{text}\n")
+            return
+        for key, value in data.items():
+            self.write(f"{key}: {format_value(value)}\n")
+
+
+class JsonRenderer(Renderer):
+    """A single JSON document on stdout; messages as JSON on stderr."""
+
+    mode = "json"
+    structured = True
+
+    def message(
+        self,
+        level: str,
+        text: str,
+        icon: str | None = None,
+        panel: bool = False,
+        style: str | None = None,
+    ) -> None:
+        """Write the message to stderr as a JSON object."""
+        self.flush()
+        sys.stderr.write(_encode({"level": level, "message": text}) + "\n")
+
+    def table(
+        self,
+        columns: Sequence[Column],
+        rows: Iterable[Sequence[Any]],
+        title: str | None = None,
+    ) -> int:
+        """Write the rows as a JSON array of objects, one per line."""
+        fields = [column.field for column in columns]
+        count = 0
+        for row in rows:
+            self.write("[\n" if count == 0 else ",\n")
+            self.write(_encode(dict(zip(fields, row, strict=True))))
+            count += 1
+        self.write("\n]\n" if count else "[]\n")
+        return count
+
+    def record(
+        self,
+        data: Mapping[str, Any],
+        text: str | None = None,
+        title: str | None = None,
+        style: str | None = None,
+    ) -> None:
+        """Write the fields as a JSON object."""
+        self.write(_encode(data, indent=2) + "\n")
+
+
+class NdjsonRenderer(JsonRenderer):
+    """One JSON object per line on stdout."""
+
+    mode = "ndjson"
+
+    def table(
+        self,
+        columns: Sequence[Column],
+        rows: Iterable[Sequence[Any]],
+        title: str | None = None,
+    ) -> int:
+        """Write one JSON object line per row."""
+        fields = [column.field for column in columns]
+        count = 0
+        for row in rows:
+            self.write(_encode(dict(zip(fields, row, strict=True))) + "\n")
+            count += 1
+        return count
+
+    def record(
+        self,
+        data: Mapping[str, Any],
+        text: str | None = None,
+        title: str | None = None,
+        style: str | None = None,
+    ) -> None:
+        """Write the fields as one JSON object line."""
+        self.write(_encode(data) + "\n")
+
+
+_RENDERERS: dict[str, type[Renderer]] = {
+    "rich": RichRenderer,
+    "plain": PlainRenderer,
+    "json": JsonRenderer,
+    "ndjson": NdjsonRenderer,
+}
+
+
+def push_renderer(mode: str | None = None) -> Renderer:
+    """
+    Create the renderer for an invocation and make it the active one.
+
+    Args:
+        mode (str | None): One of ``OUTPUT_MODES``. If None, the enclosing
+            invocation's mode is inherited, then ``T3_OUTPUT``, then ``rich``.
+
+    Returns:
+        Renderer: The new renderer; call ``close()`` when the invocation ends.
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    renderer = _RENDERERS[_mode(mode)]()
+    _renderers.append(renderer)
+    return renderer
+
+
+def get_renderer() -> Renderer:
+    """
+    Get the active renderer.
+
+    Outside an invocation (e.g. when helpers are used as a library), an
+    unbuffered renderer for ``T3_OUTPUT`` is returned instead.
+
+    Returns:
+        Renderer: The active renderer.
+    """
+    if _renderers:
+        return _renderers[-1]
+    try:
+        mode = _mode(None)
+    except ValueError:
+        mode = "rich"
+    return _RENDERERS[mode](buffer_size=0)
+
+
+def _mode(mode: str | None) -> str:
+    """Resolve and validate an output mode."""
+    if mode is None:
+        mode = _renderers[-1].mode if _renderers else os.environ.get("T3_OUTPUT")
+    mode = (mode or "rich").lower()
+    if mode not in _RENDERERS:
+        raise ValueError(
+            f"Unknown output mode '{mode}' (choose from {', '.join(OUTPUT_MODES)})"
+        )
+    return mode
@@ -0,0 +1,444 @@
+"""Synthetic frame load for edge-video message pipelines.
+
+Each simulated camera publishes a JPEG-sized frame at its frame rate, plus
+a small metadata event per frame, over a pool of connections (and, for
+AMQP, channels per connection). Every channel allows a window of
+unconfirmed publishes; a full window is backpressure. A frame whose turn
+comes more than one frame interval late is dropped, as edge-video drops
+frames when its buffer is full.
+
+Publishes are confirmed (AMQP publisher confirms, MQTT QoS 1), and their
+latency is the time from publish to confirmation. Brokers are:
+
+- :class:`MockBroker`, an in-process stand-in with a fixed ingress
+  bandwidth and latency, so the generator runs offline; and
+- :class:`MqttPublisher`, a minimal MQTT 3.1.1 client for real brokers.
+"""
+
+import asyncio
+import json
+import os
+import random
+import struct
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple, Protocol
+from urllib.parse import unquote, urlsplit
+
+from t3.core.bench import percentile
+
+PROTOCOLS = ("amqp", "mqtt")
+
+MOCK_BROKER = "mock"
+
+# Latency samples kept for percentiles; more are sampled uniformly.
+_MAX_SAMPLES = 100_000
+
+_MQTT_PORT = 1883
+
+_MQTT_KEEPALIVE = 60
+
+
+class Publisher(Protocol):
+    """A broker connection that publishes with confirmation."""
+
+    async def publish(self, topic: str, payload: bytes) -> None:
+        """Publish a message and wait for the broker to confirm it."""
+        ...
+
+    async def close(self) -> None:
+        """Close the connection."""
+        ...
+
+
+class PipelineLoad(NamedTuple):
+    """The load to generate."""
+
+    cameras: list[str]
+    fps: float
+    frame_bytes: int
+    duration: float
+    connections: int = 4
+    channels: int = 1
+    window: int = 32
+    topic_prefix: str = "camera."
+    metadata_topic: str | None = "camera.metadata.event"
+
+
+class PipelineReport(NamedTuple):
+    """Throughput, latency and backpressure of a run."""
+
+    cameras: int
+    fps: float
+    frame_bytes: int
+    connections: int
+    channels: int
+    window: int
+    elapsed_s: float
+    offered_frames: int
+    frames: int
+    events: int
+    dropped_frames: int
+    messages_per_second: float
+    bytes_per_second: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+    backpressure_waits: int
+    backpressure_ms: float
+
+
+class MockBroker:
+    """An in-process broker with a fixed ingress bandwidth and latency.
+
+    Messages from all connections share the ingress link: each one is
+    confirmed once the link has carried it and ``latency`` has passed, so
+    offering more than the bandwidth fills publish windows.
+    """
+
+    def __init__(self, bandwidth: float = 125e6, latency: float = 0.001) -> None:
+        """
+        Initialize the broker.
+
+        Args:
+            bandwidth (float): Ingress bytes per second.
+            latency (float): Seconds from receipt to confirmation.
+        """
+        self.bandwidth = bandwidth
+        self.latency = latency
+        self.messages = 0
+        self.bytes = 0
+        self._link_free_at = 0.0
+
+    async def connect(self) -> "MockConnection":
+        """
+        Open a connection.
+
+        Returns:
+            MockConnection: The connection.
+        """
+        return MockConnection(self)
+
+    def _receive(self, size: int) -> float:
+        """Queue a message on the link; return its confirmation time."""
+        now = asyncio.get_running_loop().time()
+        self._link_free_at = max(now, self._link_free_at) + size / self.bandwidth
+        self.messages += 1
+        self.bytes += size
+        return self._link_free_at + self.latency
+
+
+class MockConnection:
+    """A connection to a :class:`MockBroker`."""
+
+    def __init__(self, broker: MockBroker) -> None:
+        """Initialize with the broker."""
+        self.broker = broker
+
+    async def publish(self, topic: str, payload: bytes) -> None:
+        """Publish a message and wait for the broker to confirm it."""
+        loop = asyncio.get_running_loop()
+        confirmed = loop.create_future()
+        confirm_at = self.broker._receive(len(topic) + len(payload))
+        loop.call_at(confirm_at, confirmed.set_result, None)
+        await confirmed
+
+    async def close(self) -> None:
+        """Close the connection."""
+
+
+class MqttPublisher:
+    """A minimal MQTT 3.1.1 client that publishes with QoS 1."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Initialize with a connected session; use :meth:`connect`."""
+        self._reader = reader
+        self._writer = writer
+        self._pending: dict[int, asyncio.Future[None]] = {}
+        self._next_id = 0
+        self._acks = asyncio.create_task(self._read_acks())
+
+    @classmethod
+    async def connect(cls, url: str, client_id: str) -> "MqttPublisher":
+        """
+        Connect to a broker.
+
+        Args:
+            url (str): ``tcp://``/``mqtt://`` URL, optionally with
+                credentials.
+            client_id (str): The MQTT client identifier.
+
+        Returns:
+            MqttPublisher: The connected publisher.
+
+        Raises:
+            ConnectionError: If the broker refuses the connection.
+            OSError: If the broker cannot be reached.
+        """
+        parts = urlsplit(url)
+        reader, writer = await asyncio.open_connection(
+            parts.hostname or "localhost", parts.port or _MQTT_PORT
+        )
+        flags = 0x02  # Clean session.
+        payload = _mqtt_string(client_id)
+        if parts.username is not None:
+            flags |= 0x80
+            payload += _mqtt_string(unquote(parts.username))
+        if parts.password is not None:
+            flags |= 0x40
+            payload += _mqtt_string(unquote(parts.password))
+        header = _mqtt_string("MQTT") + struct.pack("!BBH", 4, flags, _MQTT_KEEPALIVE)
+        writer.write(_mqtt_packet(0x10, header + payload))
+        await writer.drain()
+
+        packet_type, body = await _read_mqtt_packet(reader)
+        if packet_type != 0x20 or len(body) < 2 or body[1] != 0:
+            writer.close()
+            raise ConnectionError(f"MQTT broker refused the connection ({body!r})")
+        return cls(reader, writer)
+
+    async def publish(self, topic: str, payload: bytes) -> None:
+        """Publish a message and wait for its PUBACK."""
+        if self._acks.done():
+            raise ConnectionError("MQTT connection lost")
+        self._next_id = self._next_id % 0xFFFF + 1
+        packet_id = self._next_id
+        acked = asyncio.get_running_loop().create_future()
+        self._pending[packet_id] = acked
+        body = _mqtt_string(topic) + struct.pack("!H", packet_id) + payload
+        self._writer.write(_mqtt_packet(0x32, body))
+        await self._writer.drain()
+        await acked
+
+    async def close(self) -> None:
+        """Disconnect."""
+        self._acks.cancel()
+        try:
+            self._writer.write(_mqtt_packet(0xE0, b""))
+            await self._writer.drain()
+        except OSError:
+            pass
+        self._writer.close()
+
+    async def _read_acks(self) -> None:
+        """Resolve publishes as their PUBACKs arrive."""
+        try:
+            while True:
+                packet_type, body = await _read_mqtt_packet(self._reader)
+                if packet_type == 0x40 and len(body) >= 2:
+                    acked = self._pending.pop(struct.unpack("!H", body[:2])[0], None)
+                    if acked is not None and not acked.done():
+                        acked.set_result(None)
+        except (OSError, asyncio.IncompleteReadError) as e:
+            error = ConnectionError(f"MQTT connection lost: {e}")
+            for acked in self._pending.values():
+                if not acked.done():
+                    acked.set_exception(error)
+            self._pending.clear()
+
+
+def _mqtt_string(value: str) -> bytes:
+    """Encode a length-prefixed UTF-8 string."""
+    data = value.encode()
+    return struct.pack("!H", len(data)) + data
+
+
+def _mqtt_packet(header: int, body: bytes) -> bytes:
+    """Frame a control packet with its variable-length size."""
+    size = bytearray()
+    remaining = len(body)
+    while True:
+        remaining, digit = divmod(remaining, 128)
+        size.append(digit | (0x80 if remaining else 0))
+        if not remaining:
+            return bytes([header]) + bytes(size) + body
+
+
+async def _read_mqtt_packet(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read a control packet; return its type (high nibble) and body."""
+    header = (await reader.readexactly(1))[0]
+    size = shift = 0
+    while True:
+        digit = (await reader.readexactly(1))[0]
+        size += (digit & 0x7F) << shift
+        shift += 7
+        if not digit & 0x80:
+            break
+    return header & 0xF0, await reader.readexactly(size)
+
+
+class _Samples:
+    """A uniform sample of at most ``limit`` values (reservoir sampling)."""
+
+    def __init__(self, limit: int = _MAX_SAMPLES) -> None:
+        """Initialize with no values."""
+        self.limit = limit
+        self.values: list[float] = []
+        self.count = 0
+        self.maximum = 0.0
+        self._random = random.Random(0)
+
+    def add(self, value: float) -> None:
+        """Add a value."""
+        self.count += 1
+        self.maximum = max(self.maximum, value)
+        if len(self.values) < self.limit:
+            self.values.append(value)
+        else:
+            slot = self._random.randrange(self.count)
+            if slot < self.limit:
+                self.values[slot] = value
+
+    def percentile(self, pct: float) -> float:
+        """Get a percentile, 0 without values."""
+        return percentile(self.values, pct) if self.values else 0.0
+
+
+class _Run:
+    """Counters shared by the camera tasks of a run."""
+
+    def __init__(self) -> None:
+        """Initialize with zero counts."""
+        self.frames = 0
+        self.events = 0
+        self.dropped = 0
+        self.bytes = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.latencies = _Samples()
+        self.in_flight: set[asyncio.Task[None]] = set()
+        self.error: BaseException | None = None
+
+
+async def run_pipeline(
+    load: PipelineLoad,
+    connect: Callable[[int], Any],
+) -> PipelineReport:
+    """
+    Publish synthetic frames and events and measure the pipeline.
+
+    Args:
+        load (PipelineLoad): What to publish.
+        connect (Callable[[int], Any]): Opens connection ``n``; returns an
+            awaitable of a :class:`Publisher`.
+
+    Returns:
+        PipelineReport: The measurements.
+
+    Raises:
+        ConnectionError: If a connection fails during the run.
+        OSError: If a broker cannot be reached.
+    """
+    publishers = [await connect(n) for n in range(load.connections)]
+    lanes = [
+        (publisher, asyncio.Semaphore(load.window))
+        for publisher in publishers
+        for _ in range(load.channels)
+    ]
+    # Random bytes, like JPEG data, defeat compression along the way.
+    frame = os.urandom(load.frame_bytes)
+    run = _Run()
+    loop = asyncio.get_running_loop()
+    interval = 1 / load.fps
+    started = loop.time()
+    frames_per_camera = round(load.duration * load.fps)
+
+    async def publish(
+        lane: tuple[Publisher, asyncio.Semaphore], topic: str, payload: bytes
+    ) -> None:
+        publisher, window = lane
+        sent = time.perf_counter()
+        try:
+            await publisher.publish(topic, payload)
+        except OSError as e:
+            run.error = run.error or e
+        else:
+            run.latencies.add((time.perf_counter() - sent) * 1000)
+            run.bytes += len(payload)
+        finally:
+            window.release()
+
+    async def acquire(window: asyncio.Semaphore) -> None:
+        if window.locked():
+            run.waits += 1
+            waited = loop.time()
+            await window.acquire()
+            run.wait_seconds += loop.time() - waited
+        else:
+            await window.acquire()
+
+    def spawn(coroutine: Any) -> None:
+        task = asyncio.create_task(coroutine)
+        run.in_flight.add(task)
+        task.add_done_callback(run.in_flight.discard)
+
+    async def camera(position: int, camera_id: str) -> None:
+        lane = lanes[position % len(lanes)]
+        topic = load.topic_prefix + camera_id
+        # Stagger cameras across the frame interval.
+        offset = started + interval * position / len(load.cameras)
+        for sequence in range(frames_per_camera):
+            if run.error is not None:
+                break
+            due = offset + sequence * interval
+            await asyncio.sleep(max(0.0, due - loop.time()))
+            await acquire(lane[1])
+            if loop.time() - due > interval:
+                lane[1].release()
+                run.dropped += 1
+            else:
+                spawn(publish(lane, topic, frame))
+                run.frames += 1
+                if load.metadata_topic is not None:
+                    event = json.dumps(
+                        {
+                            "camera_id": camera_id,
+                            "sequence": sequence,
+                            "timestamp": time.time(),
+                            "size": load.frame_bytes,
+                        }
+                    ).encode()
+                    await acquire(lane[1])
+                    spawn(publish(lane, load.metadata_topic, event))
+                    run.events += 1
+
+    try:
+        await asyncio.gather(
+            *(camera(n, camera_id) for n, camera_id in enumerate(load.cameras))
+        )
+        while run.in_flight:
+            await asyncio.gather(*run.in_flight)
+    finally:
+        for task in run.in_flight:
+            task.cancel()
+        for publisher in publishers:
+            await publisher.close()
+    if run.error is not None:
+        raise run.error
+
+    elapsed = loop.time() - started
+    messages = run.frames + run.events
+    return PipelineReport(
+        cameras=len(load.cameras),
+        fps=load.fps,
+        frame_bytes=load.frame_bytes,
+        connections=load.connections,
+        channels=load.channels,
+        window=load.window,
+        elapsed_s=round(elapsed, 3),
+        offered_frames=run.frames + run.dropped,
+        frames=run.frames,
+        events=run.events,
+        dropped_frames=run.dropped,
+        messages_per_second=messages / elapsed,
+        bytes_per_second=run.bytes / elapsed,
+        latency_p50_ms=run.latencies.percentile(50),
+        latency_p95_ms=run.latencies.percentile(95),
+        latency_p99_ms=run.latencies.percentile(99),
+        latency_max_ms=run.latencies.maximum,
+        backpressure_waits=run.waits,
+        backpressure_ms=run.wait_seconds * 1000,
+    )
@@ -0,0 +1,333 @@
+"""RTSP reachability probes for edge-video cameras.
+
+Each probe opens a TCP connection (TLS for ``rtsps://``, verified against
+the system CA store or ``SSL_CERT_FILE``) and sends ``OPTIONS`` and,
+optionally, ``DESCRIBE``, authenticating with the credentials in the
+camera URL (Basic or Digest, as the camera asks). Probes run concurrently on one
+event loop, bounded by a semaphore, and each one has a single deadline
+covering connect and both requests, so probing any number of cameras
+takes about one timeout when the concurrency allows.
+"""
+
+import asyncio
+import base64
+import functools
+import hashlib
+import os
+import re
+import ssl
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from typing import NamedTuple
+from urllib.parse import unquote, urlsplit
+
+from t3.core.utils import redact_url
+
+DEFAULT_PORT = 554
+
+DEFAULT_TLS_PORT = 322
+
+DEFAULT_TIMEOUT = 5.0
+
+DEFAULT_CONCURRENCY = 512
+
+USER_AGENT = "t3-cli"
+
+# Probe outcomes.
+OK = "ok"
+UNAUTHORIZED = "unauthorized"
+FAILED = "failed"
+TIMEOUT = "timeout"
+UNREACHABLE = "unreachable"
+
+_AUTH_PARAM = re.compile(r'(\w+)="?([^",]*)"?')
+
+
+class ProbeResult(NamedTuple):
+    """The outcome of probing one camera."""
+
+    id: str
+    url: str
+    status: str
+    code: int | None
+    connect_ms: float | None
+    latency_ms: float | None
+    error: str | None
+
+
+class RtspResponse(NamedTuple):
+    """A parsed RTSP response."""
+
+    code: int
+    reason: str
+    headers: dict[str, str]
+
+
+class _Target(NamedTuple):
+    """Where and how to reach a camera."""
+
+    host: str
+    port: int
+    uri: str
+    username: str | None
+    password: str | None
+    tls: bool = False
+
+
+def _parse_target(url: str) -> _Target:
+    """Split a camera URL into address, request URI and credentials."""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ("rtsp", "rtsps") or not parts.hostname:
+        raise ValueError("not an rtsp:// URL")
+    tls = scheme == "rtsps"
+    port = parts.port or (DEFAULT_TLS_PORT if tls else DEFAULT_PORT)
+    host = f"[{parts.hostname}]" if ":" in parts.hostname else parts.hostname
+    uri = f"{scheme}://{host}:{port}{parts.path or '/'}"
+    if parts.query:
+        uri = f"{uri}?{parts.query}"
+    username = unquote(parts.username) if parts.username is not None else None
+    password = unquote(parts.password) if parts.password is not None else None
+    return _Target(parts.hostname, port, uri, username, password, tls)
+
+
+@functools.cache
+def _tls_context() -> ssl.SSLContext:
+    """Get the context for ``rtsps://`` connections, shared by every probe."""
+    return ssl.create_default_context()
+
+
+async def _read_response(reader: asyncio.StreamReader) -> RtspResponse:
+    """Read one response, discarding its body."""
+    status_line = (await reader.readline()).decode("latin-1").strip()
+    version, _, rest = status_line.partition(" ")
+    code, _, reason = rest.partition(" ")
+    if not version.startswith("RTSP/") or not code.isdigit():
+        raise ConnectionError(f"not an RTSP response: {status_line[:60]!r}")
+
+    headers = {}
+    while line := (await reader.readline()).decode("latin-1").strip():
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    if length:
+        await reader.readexactly(length)
+    return RtspResponse(int(code), reason, headers)
+
+
+def _authorization(challenge: str, method: str, target: _Target) -> str | None:
+    """Answer a ``WWW-Authenticate`` challenge with the URL's credentials."""
+    if target.username is None:
+        return None
+    scheme, _, params = challenge.partition(" ")
+    if scheme.lower() == "basic":
+        token = f"{target.username}:{target.password or ''}".encode()
+        return f"Basic {base64.b64encode(token).decode()}"
+    if scheme.lower() != "digest":
+        return None
+
+    fields = dict(_AUTH_PARAM.findall(params))
+    realm, nonce = fields.get("realm", ""), fields.get("nonce", "")
+    ha1 = _md5(f"{target.username}:{realm}:{target.password or ''}")
+    ha2 = _md5(f"{method}:{target.uri}")
+    response = _md5(f"{ha1}:{nonce}:{ha2}")
+    return (
+        f'Digest username="{target.username}", realm="{realm}", '
+        f'nonce="{nonce}", uri="{target.uri}", response="{response}"'
+    )
+
+
+def _md5(text: str) -> str:
+    """Get the hex MD5 digest used by Digest authentication."""
+    return hashlib.md5(text.encode(), usedforsecurity=False).hexdigest()
+
+
+class _Session:
+    """Sends requests on one connection, authenticating when challenged."""
+
+    def __init__(
+        self,
+        target: _Target,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Initialize with an open connection."""
+        self.target = target
+        self.reader = reader
+        self.writer = writer
+        self.cseq = 0
+        self.challenge: str | None = None
+
+    async def request(self, method: str) -> RtspResponse:
+        """Send a request, retrying once with credentials on a 401."""
+        response = await self._send(method)
+        if response.code == 401 and self.challenge is None:
+            self.challenge = response.headers.get("www-authenticate")
+            if self.challenge and _authorization(self.challenge, method, self.target):
+                response = await self._send(method)
+        return response
+
+    async def _send(self, method: str) -> RtspResponse:
+        """Send one request and read its response."""
+        self.cseq += 1
+        lines = [
+            f"{method} {self.target.uri} RTSP/1.0",
+            f"CSeq: {self.cseq}",
+            f"User-Agent: {USER_AGENT}",
+        ]
+        if method == "DESCRIBE":
+            lines.append("Accept: application/sdp")
+        if self.challenge:
+            authorization = _authorization(self.challenge, method, self.target)
+            if authorization:
+                lines.append(f"Authorization: {authorization}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await self.writer.drain()
+        return await _read_response(self.reader)
+
+
+async def probe_camera(
+    camera_id: str,
+    url: str,
+    timeout: float = DEFAULT_TIMEOUT,
+    describe: bool = True,
+) -> ProbeResult:
+    """
+    Check that a camera accepts connections and answers RTSP requests.
+
+    Args:
+        camera_id (str): The camera's ID, copied to the result.
+        url (str): The camera's RTSP URL, possibly with credentials.
+        timeout (float): Seconds allowed for the whole probe.
+        describe (bool): Send ``DESCRIBE`` after ``OPTIONS``, which checks
+            the stream path and credentials.
+
+    Returns:
+        ProbeResult: The outcome; the URL in it has credentials redacted.
+    """
+    redacted = redact_url(url)
+    try:
+        target = _parse_target(url)
+    except ValueError as e:
+        return ProbeResult(camera_id, redacted, FAILED, None, None, None, str(e))
+
+    started = time.perf_counter()
+    connect_ms = None
+    writer = None
+    try:
+        async with asyncio.timeout(timeout):
+            reader, writer = await asyncio.open_connection(
+                target.host, target.port, ssl=_tls_context() if target.tls else None
+            )
+            connect_ms = (time.perf_counter() - started) * 1000
+            session = _Session(target, reader, writer)
+            response = await session.request("OPTIONS")
+            if describe and response.code < 300:
+                response = await session.request("DESCRIBE")
+    except TimeoutError:
+        return ProbeResult(
+            camera_id,
+            redacted,
+            TIMEOUT,
+            None,
+            connect_ms,
+            None,
+            f"no answer in {timeout:g} s",
+        )
+    except ssl.SSLError as e:
+        # The camera is reachable but the TLS handshake failed.
+        error = getattr(e, "verify_message", None) or e.reason or str(e)
+        return ProbeResult(
+            camera_id, redacted, FAILED, None, connect_ms, None, f"TLS: {error}"
+        )
+    except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+        status = UNREACHABLE if connect_ms is None else FAILED
+        if isinstance(e, OSError) and e.errno:
+            error = os.strerror(e.errno)
+        else:
+            error = str(e) or type(e).__name__
+        return ProbeResult(camera_id, redacted, status, None, connect_ms, None, error)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    latency_ms = (time.perf_counter() - started) * 1000
+    if response.code < 300:
+        status, error = OK, None
+    else:
+        status = UNAUTHORIZED if response.code == 401 else FAILED
+        error = f"{response.code} {response.reason}".strip()
+    return ProbeResult(
+        camera_id, redacted, status, response.code, connect_ms, latency_ms, error
+    )
+
+
+async def probe_cameras(
+    cameras: Iterable[tuple[str, str]],
+    timeout: float = DEFAULT_TIMEOUT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    describe: bool = True,
+) -> AsyncIterator[ProbeResult]:
+    """
+    Probe cameras concurrently.
+
+    Args:
+        cameras (Iterable[tuple[str, str]]): (ID, URL) pairs.
+        timeout (float): Seconds allowed per camera.
+        concurrency (int): Probes in flight at once.
+        describe (bool): Send ``DESCRIBE`` after ``OPTIONS``.
+
+    Yields:
+        ProbeResult: Each outcome, in completion order.
+    """
+    semaphore = asyncio.BoundedSemaphore(concurrency)
+
+    async def bounded(camera_id: str, url: str) -> ProbeResult:
+        async with semaphore:
+            return await probe_camera(camera_id, url, timeout, describe)
+
+    tasks = [asyncio.create_task(bounded(*camera)) for camera in cameras]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def iter_probes(
+    cameras: Iterable[tuple[str, str]],
+    timeout: float = DEFAULT_TIMEOUT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    describe: bool = True,
+) -> Iterator[ProbeResult]:
+    """
+    Probe cameras concurrently, yielding outcomes to synchronous code.
+
+    The event loop runs only while the caller waits for the next result,
+    so results can be written out as they arrive.
+
+    Args:
+        cameras (Iterable[tuple[str, str]]): (ID, URL) pairs.
+        timeout (float): Seconds allowed per camera.
+        concurrency (int): Probes in flight at once.
+        describe (bool): Send ``DESCRIBE`` after ``OPTIONS``.
+
+    Yields:
+        ProbeResult: Each outcome, in completion order.
+    """
+    with asyncio.Runner() as runner:
+        results = probe_cameras(cameras, timeout, concurrency, describe)
+        try:
+            while True:
+                try:
+                    yield runner.run(_next(results))
+                except StopAsyncIteration:
+                    return
+        finally:
+            runner.run(results.aclose())
+
+
+async def _next(results: AsyncIterator[ProbeResult]) -> ProbeResult:
+    """Await the next result; ``Runner.run`` only accepts coroutines."""
+    return await anext(results)
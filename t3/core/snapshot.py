@@ -0,0 +1,150 @@
+"""Compiled configuration snapshots for T3 CLI.
+
+A snapshot is a ``marshal`` dump of a parsed ``config.json`` stored next to
+it as ``config.json.snapshot``. Its header records the source file's
+signature and the interpreter's marshal format, so a stale or foreign
+snapshot is ignored and rebuilt from the JSON, which stays the only file
+meant to be edited. Small files are not worth it and never get a snapshot.
+"""
+
+import gc
+import marshal
+import mmap
+import os
+import stat
+import struct
+import sys
+from pathlib import Path
+from typing import Any
+
+from t3.core.files import atomic_write_bytes
+
+# Below this size parsing JSON is already cheaper than opening a second file.
+SNAPSHOT_MIN_BYTES = 64 * 1024
+
+# Magic, marshal version, Python major/minor, then the source's
+# (st_mtime_ns, st_size, st_ino).
+_HEADER = struct.Struct(">4sBBBqQQ")
+_MAGIC = b"T3CS"
+
+
+def snapshot_enabled() -> bool:
+    """
+    Check whether compiled snapshots should be used.
+
+    Returns:
+        bool: False if ``T3_CONFIG_SNAPSHOT`` is set to a falsy value.
+    """
+    return os.environ.get("T3_CONFIG_SNAPSHOT", "").lower() not in (
+        "0",
+        "false",
+        "no",
+    )
+
+
+def snapshot_path(source: Path) -> Path:
+    """
+    Get the snapshot path for a configuration file.
+
+    Args:
+        source (Path): The JSON configuration file.
+
+    Returns:
+        Path: ``<source>.snapshot`` in the same directory.
+    """
+    return source.with_name(f"{source.name}.snapshot")
+
+
+def _header(signature: tuple[int, int, int]) -> bytes:
+    """Build the header identifying a source signature and this interpreter."""
+    return _HEADER.pack(
+        _MAGIC, marshal.version, sys.version_info[0], sys.version_info[1], *signature
+    )
+
+
+def read_snapshot(
+    source: Path, signature: tuple[int, int, int]
+) -> dict[str, Any] | None:
+    """
+    Load the snapshot for a configuration file if it is still valid.
+
+    The file is memory-mapped and decoded in place, with the cyclic garbage
+    collector paused since the result cannot contain cycles.
+
+    Args:
+        source (Path): The JSON configuration file.
+        signature (tuple[int, int, int]): The source's current signature.
+
+    Returns:
+        dict[str, Any] | None: The document, or None if there is no usable
+            snapshot for this signature.
+    """
+    if signature[1] < SNAPSHOT_MIN_BYTES or not snapshot_enabled():
+        return None
+
+    expected = _header(signature)
+    try:
+        with (
+            snapshot_path(source).open("rb") as snapshot_file,
+            mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            if mapped[: _HEADER.size] != expected:
+                return None
+            with memoryview(mapped) as view, view[_HEADER.size :] as payload:
+                gc_was_enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    document = marshal.loads(payload)
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+
+    return document if isinstance(document, dict) else None
+
+
+def write_snapshot(
+    source: Path, signature: tuple[int, int, int], document: dict[str, Any]
+) -> None:
+    """
+    Store a snapshot of a parsed configuration file.
+
+    Failures are ignored: the snapshot only speeds up later loads. A stale
+    snapshot is removed when the source became too small to need one.
+
+    Args:
+        source (Path): The JSON configuration file.
+        signature (tuple[int, int, int]): The signature of the parsed source.
+        document (dict[str, Any]): The parsed document.
+    """
+    if not snapshot_enabled():
+        return
+
+    path = snapshot_path(source)
+    try:
+        if signature[1] < SNAPSHOT_MIN_BYTES:
+            path.unlink(missing_ok=True)
+            return
+
+        # Same permissions as the source, which may hold credentials.
+        mode = stat.S_IMODE(source.stat().st_mode)
+        data = _header(signature) + marshal.dumps(document)
+        atomic_write_bytes(path, data, mode=mode, durable=False)
+    except (OSError, ValueError):
+        pass
+
+
+def remove_snapshot(source: Path) -> None:
+    """
+    Delete the snapshot for a configuration file, if any.
+
+    Args:
+        source (Path): The JSON configuration file.
+    """
+    path = snapshot_path(source)
+    try:
+        if path.exists():
+            path.unlink()
+    except OSError:
+        pass
@@ -0,0 +1,301 @@
+"""Enforcement of the ``storage`` limits written by ``t3 init docker``.
+
+Files older than ``cleanup_older_than_days`` are deleted first; if the
+rest still exceeds ``max_storage_gb``, the oldest files are evicted until
+it fits. Directories are walked with ``os.scandir`` by a thread pool that
+hands out files in fixed-size chunks through a bounded queue, so a
+directory with millions of recording segments is never listed in memory
+at once. Eviction needs the total size, so it walks again and keeps only
+a heap of the oldest files just large enough to cover the excess.
+"""
+
+import heapq
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple
+
+DEFAULT_CONFIG = "./config.yaml"
+
+# Directories scanned concurrently.
+DEFAULT_WORKERS = 8
+
+# Files handed from a scanning thread to the consumer at a time.
+CHUNK_SIZE = 1024
+
+GIGABYTE = 1024**3
+
+DAY = 86400
+
+
+class StoragePolicy(NamedTuple):
+    """The directories to keep in check and their limits."""
+
+    paths: tuple[Path, ...]
+    max_bytes: int | None
+    max_age: float | None
+
+
+class FileEntry(NamedTuple):
+    """A regular file found by a walk."""
+
+    path: str
+    size: int
+    mtime: float
+
+
+def storage_policy(config: dict[str, Any], base: Path = Path()) -> StoragePolicy:
+    """
+    Get the storage limits of a ``t3 init docker`` configuration.
+
+    ``storage.data_path`` and ``video.output.output_path`` share the quota.
+
+    Args:
+        config (dict[str, Any]): The parsed configuration.
+        base (Path): Directory relative paths are resolved against.
+
+    Returns:
+        StoragePolicy: The policy; a missing limit is None.
+
+    Raises:
+        ValueError: If a limit is not a positive number.
+    """
+    storage = config.get("storage") or {}
+    output = (config.get("video") or {}).get("output") or {}
+    paths: list[Path] = []
+    for value in (storage.get("data_path"), output.get("output_path")):
+        if value and (path := base / str(value)) not in paths:
+            paths.append(path)
+
+    max_gb = _positive(storage, "max_storage_gb")
+    max_days = _positive(storage, "cleanup_older_than_days")
+    return StoragePolicy(
+        tuple(paths),
+        round(max_gb * GIGABYTE) if max_gb is not None else None,
+        max_days * DAY if max_days is not None else None,
+    )
+
+
+def _positive(section: dict[str, Any], key: str) -> float | None:
+    """Get an optional positive number from a config section."""
+    value = section.get(key)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int | float) or value <= 0:
+        raise ValueError(f"storage.{key} must be a positive number, got {value!r}")
+    return float(value)
+
+
+def iter_files(
+    roots: Iterable[str | Path],
+    workers: int = DEFAULT_WORKERS,
+    on_error: Callable[[OSError], None] | None = None,
+) -> Iterator[list[FileEntry]]:
+    """
+    Walk directory trees with ``os.scandir`` in parallel.
+
+    Each directory is scanned by one pool thread, which passes its files
+    on in chunks of :data:`CHUNK_SIZE` through a queue of at most twice
+    ``workers`` chunks; subdirectories are scheduled as they are found.
+    Symbolic links are neither followed nor reported.
+
+    Args:
+        roots (Iterable[str | Path]): Directories to walk.
+        workers (int): Directories scanned concurrently.
+        on_error (Callable[[OSError], None] | None): Called when a
+            directory or file cannot be read; it is skipped.
+
+    Yields:
+        list[FileEntry]: Regular files, in no particular order.
+    """
+    results: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=workers * 2)
+    stopped = threading.Event()
+
+    def put(kind: str, value: Any) -> bool:
+        # Give up waiting for room once the consumer has stopped.
+        while not stopped.is_set():
+            try:
+                results.put((kind, value), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def scan(directory: str) -> None:
+        files: list[FileEntry] = []
+        subdirectories: list[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if stopped.is_set():
+                        return
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            files.append(
+                                FileEntry(entry.path, stat.st_size, stat.st_mtime)
+                            )
+                    except OSError as e:
+                        put("error", e)
+                    if len(files) >= CHUNK_SIZE:
+                        put("files", files)
+                        files = []
+                    if len(subdirectories) >= CHUNK_SIZE:
+                        put("directories", subdirectories)
+                        subdirectories = []
+        except OSError as e:
+            put("error", e)
+        finally:
+            if files:
+                put("files", files)
+            if subdirectories:
+                put("directories", subdirectories)
+            put("done", directory)
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = 0
+        for root in roots:
+            pool.submit(scan, os.fspath(root))
+            pending += 1
+        while pending:
+            kind, value = results.get()
+            if kind == "files":
+                yield value
+            elif kind == "directories":
+                for directory in value:
+                    pool.submit(scan, directory)
+                pending += len(value)
+            elif kind == "error":
+                if on_error is not None:
+                    on_error(value)
+            else:
+                pending -= 1
+    finally:
+        stopped.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+class GcReport:
+    """What a collection found and removed."""
+
+    def __init__(self) -> None:
+        """Initialize with nothing found."""
+        self.files = 0
+        self.bytes = 0
+        self.expired_files = 0
+        self.expired_bytes = 0
+        self.evicted_files = 0
+        self.evicted_bytes = 0
+        self.errors: list[OSError] = []
+
+    @property
+    def remaining_bytes(self) -> int:
+        """int: Size of the files left in place."""
+        return self.bytes - self.expired_bytes - self.evicted_bytes
+
+
+def collect_garbage(
+    policy: StoragePolicy,
+    dry_run: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    now: float | None = None,
+    on_batch: Callable[[int], None] | None = None,
+) -> GcReport:
+    """
+    Delete expired files, then the oldest ones until usage fits the quota.
+
+    Args:
+        policy (StoragePolicy): Directories and limits.
+        dry_run (bool): Only report what would be deleted.
+        workers (int): Directories scanned concurrently.
+        now (float | None): The current Unix time.
+        on_batch (Callable[[int], None] | None): Called with the number of
+            files in each scanned chunk.
+
+    Returns:
+        GcReport: Totals; files that could not be read or deleted are in
+            ``errors``.
+    """
+    now = time.time() if now is None else now
+    cutoff = now - policy.max_age if policy.max_age is not None else None
+    report = GcReport()
+
+    def expired(entry: FileEntry) -> bool:
+        return cutoff is not None and entry.mtime < cutoff
+
+    for chunk in iter_files(policy.paths, workers, report.errors.append):
+        for entry in chunk:
+            report.files += 1
+            report.bytes += entry.size
+            if expired(entry) and _delete(entry, dry_run, report):
+                report.expired_files += 1
+                report.expired_bytes += entry.size
+        if on_batch is not None:
+            on_batch(len(chunk))
+
+    if policy.max_bytes is None or report.remaining_bytes <= policy.max_bytes:
+        return report
+
+    excess = report.remaining_bytes - policy.max_bytes
+    for entry in oldest_covering(
+        (
+            entry
+            for chunk in iter_files(policy.paths, workers, report.errors.append)
+            for entry in chunk
+            if not expired(entry)
+        ),
+        excess,
+    ):
+        if report.evicted_bytes >= excess:
+            break
+        if _delete(entry, dry_run, report):
+            report.evicted_files += 1
+            report.evicted_bytes += entry.size
+    return report
+
+
+def oldest_covering(entries: Iterable[FileEntry], size: int) -> list[FileEntry]:
+    """
+    Find the oldest files whose sizes add up to at least ``size``.
+
+    A max-heap by modification time holds the candidates; the newest is
+    dropped whenever the others still cover ``size``, so memory is bounded
+    by the number of files needed rather than the number of files seen.
+
+    Args:
+        entries (Iterable[FileEntry]): The files.
+        size (int): Bytes to cover.
+
+    Returns:
+        list[FileEntry]: The files, oldest first; all of them if they do
+            not cover ``size``.
+    """
+    heap: list[tuple[float, str, FileEntry]] = []
+    held = 0
+    for entry in entries:
+        heapq.heappush(heap, (-entry.mtime, entry.path, entry))
+        held += entry.size
+        while held - heap[0][2].size >= size:
+            held -= heapq.heappop(heap)[2].size
+    return [entry for _, _, entry in sorted(heap, reverse=True)]
+
+
+def _delete(entry: FileEntry, dry_run: bool, report: GcReport) -> bool:
+    """Delete a file, recording failures; a file already gone counts."""
+    if dry_run:
+        return True
+    try:
+        os.unlink(entry.path)
+    except FileNotFoundError:
+        return True
+    except OSError as e:
+        report.errors.append(e)
+        return False
+    return True
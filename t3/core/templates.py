@@ -0,0 +1,650 @@
+"""Project templates for ``t3 init project``.
+
+A template is a directory holding a ``template.toml`` manifest and a
+``files`` tree that is copied into the new project::
+
+    python/
+        template.toml
+        files/
+            pyproject.toml
+            src/{{ name }}/__init__.py
+
+The manifest may set ``description``, ``extends`` (a template whose files
+are included first), ``directories`` (empty directories to create),
+``hidden`` (omit from listings) and a ``[variables]`` table of defaults.
+``{{ variable }}`` placeholders are substituted in file contents and paths;
+``name`` is always the project name. Files that are not UTF-8 text are
+copied verbatim.
+
+User templates in ``T3_TEMPLATES_PATH`` (``~/.t3/templates`` by default)
+take precedence over the built-in ones shipped in ``t3/templates``.
+Compiled templates are kept in the cache directory (see :mod:`t3.core.cache`).
+"""
+
+import hashlib
+import os
+import re
+import tomllib
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from t3.core.cache import DiskCache, get_cache
+from t3.core.files import sync_file
+
+BUILTIN_TEMPLATES = Path(__file__).resolve().parent.parent / "templates"
+
+MANIFEST_NAME = "template.toml"
+
+_PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+# Directories in a ``files`` tree that are never part of a template.
+_IGNORED_DIRS = {"__pycache__", ".git", ".hg", ".svn", ".ruff_cache"}
+
+# Files handled per thread pool task.
+_CHUNK_FILES = 32
+
+_CACHE_NAMESPACE = "templates"
+
+# Part of every cache key; bump when compiled templates change shape.
+_CACHE_FORMAT = 1
+
+# Substitution plan: literal text at even indices, variable names at odd ones.
+Plan = tuple[str, ...]
+
+
+class TemplateError(ValueError):
+    """Raised when a template is missing, malformed or cannot be rendered."""
+
+
+class TemplateFile(NamedTuple):
+    """A file of a compiled template."""
+
+    path: Plan
+    content: Plan | bytes
+    mode: int
+
+
+class Template(NamedTuple):
+    """A compiled template, with its ``extends`` chain already applied."""
+
+    name: str
+    description: str
+    variables: dict[str, Any]
+    directories: tuple[Plan, ...]
+    files: tuple[TemplateFile, ...]
+
+
+def compile_text(text: str) -> Plan:
+    """
+    Compile text with ``{{ variable }}`` placeholders into a plan.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        Plan: Literal text at even indices and variable names at odd ones.
+    """
+    return tuple(_PLACEHOLDER.split(text))
+
+
+def render_plan(plan: Plan, variables: Mapping[str, Any]) -> str:
+    """
+    Substitute variables into a compiled plan.
+
+    Args:
+        plan (Plan): Output of :func:`compile_text`.
+        variables (Mapping[str, Any]): Values for the placeholders.
+
+    Returns:
+        str: The rendered text.
+
+    Raises:
+        TemplateError: If a placeholder has no value.
+    """
+    if len(plan) == 1:
+        return plan[0]
+
+    parts = list(plan)
+    for index in range(1, len(parts), 2):
+        try:
+            parts[index] = str(variables[parts[index]])
+        except KeyError:
+            raise TemplateError(f"No value for variable '{parts[index]}'") from None
+    return "".join(parts)
+
+
+def template_dirs() -> list[Path]:
+    """
+    Get the directories searched for templates, in order of precedence.
+
+    Returns:
+        list[Path]: The user templates directory, then the built-in one.
+    """
+    from t3.core.layers import get_setting
+
+    user_dir = Path(str(get_setting("templates_path", "~/.t3/templates")))
+    return [user_dir.expanduser(), BUILTIN_TEMPLATES]
+
+
+def find_template(name: str, search_path: Iterable[Path] | None = None) -> Path:
+    """
+    Find a template directory by name.
+
+    Args:
+        name (str): The template name.
+        search_path (Iterable[Path] | None): Directories to search; defaults
+            to :func:`template_dirs`.
+
+    Returns:
+        Path: The template directory.
+
+    Raises:
+        TemplateError: If no directory provides the template.
+    """
+    if not name or name.startswith(".") or "/" in name or os.sep in name:
+        raise TemplateError(f"Invalid template name '{name}'")
+
+    for directory in template_dirs() if search_path is None else search_path:
+        candidate = directory / name
+        if (candidate / MANIFEST_NAME).is_file():
+            return candidate
+    raise TemplateError(f"Unknown template '{name}'")
+
+
+def list_templates(
+    search_path: Iterable[Path] | None = None,
+) -> list[tuple[str, str, Path]]:
+    """
+    List the available templates.
+
+    Args:
+        search_path (Iterable[Path] | None): Directories to search; defaults
+            to :func:`template_dirs`.
+
+    Returns:
+        list[tuple[str, str, Path]]: Name, description and directory of each
+            visible template, sorted by name; user templates shadow
+            built-in ones.
+    """
+    found: dict[str, tuple[str, str, Path]] = {}
+    for directory in template_dirs() if search_path is None else search_path:
+        if not directory.is_dir():
+            continue
+        for candidate in sorted(directory.iterdir()):
+            if candidate.name in found or not (candidate / MANIFEST_NAME).is_file():
+                continue
+            manifest = read_manifest(candidate)
+            if not manifest.get("hidden", False):
+                description = str(manifest.get("description", ""))
+                found[candidate.name] = (candidate.name, description, candidate)
+    return sorted(found.values())
+
+
+def read_manifest(directory: Path) -> dict[str, Any]:
+    """
+    Read and validate a template manifest.
+
+    Args:
+        directory (Path): The template directory.
+
+    Returns:
+        dict[str, Any]: The manifest.
+
+    Raises:
+        TemplateError: If the manifest is unreadable or malformed.
+    """
+    try:
+        with (directory / MANIFEST_NAME).open("rb") as manifest_file:
+            manifest = tomllib.load(manifest_file)
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        raise TemplateError(f"Invalid manifest for '{directory.name}': {e}") from e
+
+    if not isinstance(manifest.get("variables", {}), dict) or not isinstance(
+        manifest.get("directories", []), list
+    ):
+        raise TemplateError(
+            f"Invalid manifest for '{directory.name}': 'variables' must be a "
+            "table and 'directories' a list"
+        )
+    return manifest
+
+
+def load_template(
+    name: str,
+    search_path: Iterable[Path] | None = None,
+    executor: ThreadPoolExecutor | None = None,
+    use_cache: bool = True,
+) -> Template:
+    """
+    Load and compile a template and the templates it extends.
+
+    Compiled templates are cached in ``T3_CACHE_DIR`` under a content hash
+    of their manifests and files. A second entry, keyed by the template name
+    and search path, lists that hash with the stat signature of every file
+    and directory the template was read from; while none of them changes,
+    the compiled template is loaded without reading or parsing the tree.
+
+    Args:
+        name (str): The template name.
+        search_path (Iterable[Path] | None): Directories to search; defaults
+            to :func:`template_dirs`.
+        executor (ThreadPoolExecutor | None): Pool to read files with; a
+            temporary one is used if omitted.
+        use_cache (bool): Whether to use the compile cache, if enabled.
+
+    Returns:
+        Template: The compiled template.
+
+    Raises:
+        TemplateError: If a template in the chain is missing or malformed,
+            or the chain is circular.
+    """
+    search_path = template_dirs() if search_path is None else list(search_path)
+    cache = get_cache(_CACHE_NAMESPACE) if use_cache else None
+    index_key = _digest(name, *(str(directory) for directory in search_path))
+    if cache is not None:
+        template = _load_cached(cache, index_key)
+        if template is not None:
+            return template
+
+    chain = template_chain(name, search_path)
+    # Every search directory's manifest for each name in the chain is
+    # tracked, so a newly added template that shadows one is noticed.
+    # Signatures are taken before files are read: an edit racing with this
+    # load is seen as a change on the next one.
+    signatures = {
+        str(directory / template_dir.name / MANIFEST_NAME): None
+        for directory in search_path
+        for template_dir, _ in chain
+    }
+    variables: dict[str, Any] = {}
+    directories: dict[Plan, None] = {}
+    sources: dict[str, str] = {}
+    for directory, manifest in reversed(chain):
+        variables.update(manifest.get("variables", {}))
+        directories.update(
+            dict.fromkeys(compile_text(d) for d in manifest.get("directories", []))
+        )
+        for relative, path in _walk_files(directory / "files", signatures):
+            sources[relative] = path
+    for path in signatures:
+        signatures[path] = _stat_signature(path)
+
+    with _pool(executor) as pool:
+        chunks = pool.map(_read_files, _chunks(list(sources.items())))
+        contents = [entry for chunk in chunks for entry in chunk]
+
+    hasher = hashlib.sha256(f"{_CACHE_FORMAT}\0{name}".encode())
+    for _, manifest in chain:
+        hasher.update(repr(manifest).encode())
+    for relative, data, mode in contents:
+        hasher.update(f"\0{relative}\0{mode}\0{len(data)}\0".encode())
+        hasher.update(data)
+    content_key = hasher.hexdigest()
+
+    cached = cache.get(content_key) if cache is not None else None
+    if cached is not None:
+        template = _thaw(cached)
+    else:
+        template = Template(
+            name=name,
+            description=str(chain[0][1].get("description", "")),
+            variables=variables,
+            directories=tuple(directories),
+            files=tuple(_compile_file(*entry) for entry in contents),
+        )
+        if cache is not None:
+            cache.put(content_key, _freeze(template))
+
+    if cache is not None:
+        cache.put(index_key, (content_key, tuple(signatures.items())))
+    return template
+
+
+def _load_cached(cache: DiskCache, index_key: str) -> Template | None:
+    """Load a compiled template if none of its sources changed."""
+    index = cache.get(index_key)
+    if index is None:
+        return None
+    content_key, signatures = index
+    for path, signature in signatures:
+        if _stat_signature(path) != signature:
+            return None
+    cached = cache.get(content_key)
+    return None if cached is None else _thaw(cached)
+
+
+def _freeze(template: Template) -> tuple[Any, ...]:
+    """Convert a template to plain tuples, which marshal can store."""
+    name, description, variables, directories, files = template
+    return (name, description, variables, directories, tuple(map(tuple, files)))
+
+
+def _thaw(value: tuple[Any, ...]) -> Template:
+    """Rebuild a template stored by :func:`_freeze`."""
+    name, description, variables, directories, files = value
+    return Template(
+        name,
+        description,
+        variables,
+        directories,
+        tuple(TemplateFile(*f) for f in files),
+    )
+
+
+def _stat_signature(path: str) -> tuple[int, int, int, int] | None:
+    """Identify a file's state; ctime also catches permission changes."""
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return (
+        stat_result.st_mtime_ns,
+        stat_result.st_ctime_ns,
+        stat_result.st_size,
+        stat_result.st_ino,
+    )
+
+
+def _digest(*parts: str) -> str:
+    """Hash strings into a cache key."""
+    return hashlib.sha256("\0".join((str(_CACHE_FORMAT), *parts)).encode()).hexdigest()
+
+
+def template_chain(
+    name: str, search_path: Iterable[Path]
+) -> list[tuple[Path, dict[str, Any]]]:
+    """
+    Resolve a template and the templates it extends.
+
+    Args:
+        name (str): The template name.
+        search_path (Iterable[Path]): Directories to search.
+
+    Returns:
+        list[tuple[Path, dict[str, Any]]]: Directory and manifest of each
+            template, starting with ``name`` itself.
+
+    Raises:
+        TemplateError: If a template is missing or the chain is circular.
+    """
+    search_path = list(search_path)
+    chain: list[tuple[Path, dict[str, Any]]] = []
+    seen = set()
+    while name:
+        if name in seen:
+            raise TemplateError(f"Template '{name}' extends itself")
+        seen.add(name)
+        directory = find_template(name, search_path)
+        manifest = read_manifest(directory)
+        chain.append((directory, manifest))
+        name = str(manifest.get("extends", ""))
+    return chain
+
+
+def _walk_files(
+    root: Path, signatures: dict[str, Any] | None = None
+) -> Iterator[tuple[str, str]]:
+    """
+    List the files of a ``files`` tree as (relative POSIX path, path).
+
+    If ``signatures`` is given, the tree's directories and files are added
+    to it as keys.
+    """
+    if signatures is not None:
+        signatures[str(root)] = None
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name not in _IGNORED_DIRS)
+        prefix = os.path.relpath(directory, root).replace(os.sep, "/")
+        for filename in sorted(filenames):
+            relative = filename if prefix == "." else f"{prefix}/{filename}"
+            yield relative, os.path.join(directory, filename)
+        if signatures is not None:
+            signatures[directory] = None
+            for filename in filenames:
+                signatures[os.path.join(directory, filename)] = None
+
+
+def _read_files(entries: list[tuple[str, str]]) -> list[tuple[str, bytes, int]]:
+    """Read template files as (relative path, content, permission bits)."""
+    contents = []
+    for relative, path in entries:
+        with open(path, "rb") as source:
+            data = source.read()
+            mode = os.fstat(source.fileno()).st_mode & 0o777
+        contents.append((relative, data, mode))
+    return contents
+
+
+def _compile_file(relative: str, data: bytes, mode: int) -> TemplateFile:
+    """Compile a file's path and, if it is text, its contents."""
+    try:
+        content: Plan | bytes = compile_text(data.decode("utf-8"))
+    except UnicodeDecodeError:
+        content = data
+    return TemplateFile(compile_text(relative), content, mode)
+
+
+def render_template(
+    template: Template, variables: Mapping[str, Any]
+) -> tuple[list[str], list[tuple[str, Callable[[], bytes], int]]]:
+    """
+    Plan the output of a template.
+
+    Paths are rendered immediately; contents are rendered by the returned
+    callables so the work can be spread over threads.
+
+    Args:
+        template (Template): The compiled template.
+        variables (Mapping[str, Any]): Values for the placeholders, on top of
+            the template's defaults.
+
+    Returns:
+        tuple[list[str], list[tuple[str, Callable[[], bytes], int]]]: The
+            relative directories to create, and the relative path, content
+            renderer and permission bits of each file.
+
+    Raises:
+        TemplateError: If a path is unsafe or a placeholder has no value.
+    """
+    values = {**template.variables, **variables}
+    directories = [_safe_path(render_plan(d, values)) for d in template.directories]
+    files = []
+    for template_file in template.files:
+        relative = _safe_path(render_plan(template_file.path, values))
+        files.append(
+            (
+                relative,
+                _content_renderer(template_file.content, values),
+                template_file.mode,
+            )
+        )
+    return directories, files
+
+
+def _content_renderer(
+    content: Plan | bytes, values: Mapping[str, Any]
+) -> Callable[[], bytes]:
+    """Bind a file's content plan to the variables."""
+    if isinstance(content, bytes):
+        return lambda: content
+    return lambda: render_plan(content, values).encode("utf-8")
+
+
+def _safe_path(relative: str) -> str:
+    """Reject rendered paths that would leave the project directory."""
+    parts = Path(relative).parts
+    if not parts or Path(relative).is_absolute() or ".." in parts:
+        raise TemplateError(f"Unsafe path in template: '{relative}'")
+    return relative
+
+
+def scaffold(
+    template: Template,
+    destination: Path,
+    variables: Mapping[str, Any],
+    executor: ThreadPoolExecutor | None = None,
+    dry_run: bool = False,
+) -> list[tuple[str, Path]]:
+    """
+    Render a template into a directory, writing only what differs.
+
+    Directories are created up front in one batch, then files are rendered
+    and compared with the existing ones concurrently. Files that already
+    have the rendered content are left untouched and the others are written
+    atomically (see :func:`t3.core.files.sync_file`), so scaffolding again
+    is idempotent.
+
+    Args:
+        template (Template): The compiled template.
+        destination (Path): The project directory.
+        variables (Mapping[str, Any]): Values for the placeholders.
+        executor (ThreadPoolExecutor | None): Pool to render and write files
+            with; a temporary one is used if omitted.
+        dry_run (bool): Only compare; create and write nothing.
+
+    Returns:
+        list[tuple[str, Path]]: ``created``, ``updated`` or ``unchanged``
+            and the path of each file of the template, in template order.
+
+    Raises:
+        TemplateError: If the template cannot be rendered.
+        OSError: If a file cannot be read or written.
+    """
+    jobs = [(template, destination, variables)]
+    for result in scaffold_many(jobs, executor, dry_run):
+        if result.error is not None:
+            raise result.error
+        return result.changes
+    return []
+
+
+class ScaffoldResult(NamedTuple):
+    """The outcome of one project of :func:`scaffold_many`."""
+
+    index: int
+    changes: list[tuple[str, Path]]
+    error: Exception | None = None
+
+
+def scaffold_many(
+    jobs: Iterable[tuple[Template, Path, Mapping[str, Any]]],
+    executor: ThreadPoolExecutor | None = None,
+    dry_run: bool = False,
+) -> Iterator[ScaffoldResult]:
+    """
+    Render templates into several directories over one pool.
+
+    Each project is prepared (paths rendered, directories created) in the
+    calling thread; the file chunks of every project then share the pool,
+    so small projects are generated concurrently with each other. Closing
+    the iterator early cancels the work not yet started.
+
+    Args:
+        jobs (Iterable[tuple[Template, Path, Mapping[str, Any]]]): Template,
+            project directory and variables of each project.
+        executor (ThreadPoolExecutor | None): Pool to render and write files
+            with; a temporary one is used if omitted.
+        dry_run (bool): Only compare; create and write nothing.
+
+    Yields:
+        ScaffoldResult: Each project's changes, as for :func:`scaffold`, or
+            the ``TemplateError`` or ``OSError`` that stopped it; in
+            completion order.
+    """
+    with _pool(executor) as pool:
+        tasks: dict[Future[list[tuple[str, Path]]], tuple[int, int]] = {}
+        chunks_done: dict[int, list[list[tuple[str, Path]] | None]] = {}
+        try:
+            for index, (template, destination, variables) in enumerate(jobs):
+                try:
+                    files = _prepare(template, destination, variables, dry_run)
+                except (TemplateError, OSError) as e:
+                    yield ScaffoldResult(index, [], e)
+                    continue
+                chunks = _chunks(files)
+                chunks_done[index] = [None] * len(chunks)
+                for number, chunk in enumerate(chunks):
+                    future = pool.submit(_sync_chunk, destination, chunk, dry_run)
+                    tasks[future] = (index, number)
+                if not chunks:
+                    del chunks_done[index]
+                    yield ScaffoldResult(index, [])
+
+            for future in as_completed(tasks):
+                index, number = tasks[future]
+                results = chunks_done.get(index)
+                if results is None or future.cancelled():
+                    continue
+                error = future.exception()
+                if error is not None:
+                    # Skip the project's remaining chunks.
+                    del chunks_done[index]
+                    for other, (owner, _) in tasks.items():
+                        if owner == index:
+                            other.cancel()
+                    if not isinstance(error, (TemplateError, OSError)):
+                        raise error
+                    yield ScaffoldResult(index, [], error)
+                    continue
+                results[number] = future.result()
+                if all(chunk is not None for chunk in results):
+                    del chunks_done[index]
+                    yield ScaffoldResult(
+                        index, [change for chunk in results for change in chunk or ()]
+                    )
+        finally:
+            for future in tasks:
+                future.cancel()
+
+
+def _prepare(
+    template: Template,
+    destination: Path,
+    variables: Mapping[str, Any],
+    dry_run: bool,
+) -> list[tuple[str, Callable[[], bytes], int]]:
+    """Render a project's paths and create its directories."""
+    directories, files = render_template(template, variables)
+    if not dry_run:
+        # Only the deepest directories need a mkdir; their parents come along.
+        needed = {destination, *(destination / d for d in directories)}
+        needed.update((destination / relative).parent for relative, _, _ in files)
+        ancestors = {parent for directory in needed for parent in directory.parents}
+        for directory in sorted(needed - ancestors):
+            directory.mkdir(parents=True, exist_ok=True)
+    return files
+
+
+def _sync_chunk(
+    destination: Path,
+    chunk: list[tuple[str, Callable[[], bytes], int]],
+    dry_run: bool,
+) -> list[tuple[str, Path]]:
+    """Render and sync a chunk of a project's files."""
+    changes = []
+    for relative, render, mode in chunk:
+        path = destination / relative
+        changes.append((sync_file(path, render(), bool(mode & 0o111), dry_run), path))
+    return changes
+
+
+def _chunks(items: list[Any]) -> list[list[Any]]:
+    """Split work into chunks, so each pool task amortizes its overhead."""
+    return [
+        items[start : start + _CHUNK_FILES]
+        for start in range(0, len(items), _CHUNK_FILES)
+    ]
+
+
+@contextmanager
+def _pool(executor: ThreadPoolExecutor | None) -> Iterator[ThreadPoolExecutor]:
+    """Use the given executor, or a temporary one for the block."""
+    if executor is not None:
+        yield executor
+        return
+    with ThreadPoolExecutor() as pool:
+        yield pool
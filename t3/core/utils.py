@@ -3,10 +3,7 @@
 import sys
 from pathlib import Path
 
-from rich.console import Console
-from rich.panel import Panel
-
-console = Console()
+from t3.core.output import get_renderer
 
 
 def show_error(message: str) -> None:
@@ -16,9 +13,7 @@ def show_error(message: str) -> None:
     Args:
         message (str): The error message to display.
     """
-    console.print(
-        Panel(f"❌ {message}", title="Error", title_align="left", style="red")
-    )
+    get_renderer().message("error", message, panel=True)
 
 
 def show_success(message: str) -> None:
@@ -28,9 +23,7 @@ def show_success(message: str) -> None:
     Args:
         message (str): The success message to display.
     """
-    console.print(
-        Panel(f"✅ {message}", title="Success", title_align="left", style="green")
-    )
+    get_renderer().message("success", message, panel=True)
 
 
 def show_info(message: str) -> None:
@@ -40,7 +33,7 @@ def show_info(message: str) -> None:
     Args:
         message (str): The info message to display.
     """
-    console.print(Panel(f"ℹ️ {message}", title="Info", title_align="left", style="blue"))
+    get_renderer().message("info", message, panel=True)
 
 
 def show_warning(message: str) -> None:
@@ -50,9 +43,7 @@ def show_warning(message: str) -> None:
     Args:
         message (str): The warning message to display.
     """
-    console.print(
-        Panel(f"⚠️ {message}", title="Warning", title_align="left", style="yellow")
-    )
+    get_renderer().message("warning", message, panel=True)
 
 
 def exit_with_error(message: str, code: int = 1) -> None:
@@ -136,3 +127,23 @@ def is_valid_project_name(name: str) -> bool:
         return False
 
     return True
+
+
+def redact_url(url: str) -> str:
+    """
+    Hide the credentials of a URL.
+
+    Args:
+        url (str): URL, possibly with ``user:password@`` before the host.
+
+    Returns:
+        str: The URL with the user information replaced by ``***``.
+    """
+    scheme, separator, rest = url.partition("://")
+    if not separator:
+        return url
+    authority, slash, path = rest.partition("/")
+    _, at, host = authority.rpartition("@")
+    if not at:
+        return url
+    return f"{scheme}://***@{host}{slash}{path}"
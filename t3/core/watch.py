@@ -0,0 +1,394 @@
+"""Change watching for configuration files.
+
+:class:`ConfigWatcher` waits for changes to a set of configuration files,
+re-parses the files that changed once writes have settled (debouncing), and
+reports the keys that differ from the previous parse.
+
+On Linux, change notification uses inotify on the files' directories, so
+editors that save by writing a temporary file and renaming it over the
+original are followed like in-place writes, and an idle watcher uses no CPU.
+Elsewhere, or when inotify is unavailable, file signatures are polled.
+"""
+
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from t3.core.config import (
+    default_config_path,
+    file_signature,
+    get_config,
+    same_value,
+)
+from t3.core.journal import journal_path
+
+# inotify event masks (see inotify(7)).
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_Q_OVERFLOW = 0x4000
+
+_WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+_MISSING = object()
+
+# Continuous writes are reported after at most this many debounce periods.
+_MAX_DEBOUNCE_PERIODS = 10
+
+
+class Change(NamedTuple):
+    """A changed key in a watched file."""
+
+    event: str
+    file: str
+    key: str
+    old: Any
+    new: Any
+
+
+def diff_documents(
+    old: dict[str, Any], new: dict[str, Any], prefix: str = ""
+) -> Iterator[tuple[str, str, Any, Any]]:
+    """
+    Compare two nested documents leaf by leaf.
+
+    Subtrees shared by both documents are skipped without being walked, so
+    diffing successive versions of a copy-on-write document costs time
+    proportional to the change.
+
+    Args:
+        old (dict[str, Any]): The previous document.
+        new (dict[str, Any]): The current document.
+        prefix (str): Dotted path of the documents within a larger one.
+
+    Yields:
+        tuple[str, str, Any, Any]: ``(event, key, old, new)`` where event is
+            ``added``, ``changed`` or ``removed``; missing values are None.
+    """
+    for key, old_value in old.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        new_value = new.get(key, _MISSING)
+        if old_value is new_value:
+            continue
+        if new_value is _MISSING:
+            for leaf, value in _leaves(path, old_value):
+                yield "removed", leaf, value, None
+        elif _is_section(old_value) and _is_section(new_value):
+            yield from diff_documents(old_value, new_value, path)
+        else:
+            yield from _diff_leaves(
+                dict(_leaves(path, old_value)), dict(_leaves(path, new_value))
+            )
+
+    for key, new_value in new.items():
+        if key not in old:
+            path = f"{prefix}.{key}" if prefix else str(key)
+            for leaf, value in _leaves(path, new_value):
+                yield "added", leaf, None, value
+
+
+def _is_section(value: Any) -> bool:
+    """Check whether a value is a non-empty section (empty ones are leaves)."""
+    return isinstance(value, dict) and bool(value)
+
+
+def _leaves(path: str, value: Any) -> Iterator[tuple[str, Any]]:
+    """Flatten a value into dotted-path leaves, like ``config show``."""
+    if _is_section(value):
+        for key, item in value.items():
+            yield from _leaves(f"{path}.{key}", item)
+    else:
+        yield path, value
+
+
+def _diff_leaves(
+    old: dict[str, Any], new: dict[str, Any]
+) -> Iterator[tuple[str, str, Any, Any]]:
+    """Compare two flat mappings, telling apart values like 1 and true."""
+    for key, value in old.items():
+        if key not in new:
+            yield "removed", key, value, None
+        elif not same_value(value, new[key]):
+            yield "changed", key, value, new[key]
+    for key, value in new.items():
+        if key not in old:
+            yield "added", key, None, value
+
+
+def load_watched_document(path: Path) -> dict[str, Any] | None:
+    """
+    Parse a watched file.
+
+    The user configuration is read through :func:`get_config`, which
+    replays its journal; other files by extension (JSON, TOML or YAML).
+
+    Args:
+        path (Path): The file.
+
+    Returns:
+        dict[str, Any] | None: The document, ``{}`` if the file does not
+            exist, or None if it cannot be parsed (e.g. mid-write).
+    """
+    if path == default_config_path():
+        return get_config(str(path)).document
+
+    from t3.core.config_io import detect_format, load_document, to_json_value
+
+    try:
+        with path.open("r", encoding="utf-8") as stream:
+            return to_json_value(load_document(stream, detect_format(str(path))))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        return None
+
+
+class PollingWatcher:
+    """Detects file changes by comparing stat signatures periodically."""
+
+    def __init__(self, files: Iterable[Path], interval: float = 1.0) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            files (Iterable[Path]): The files to watch; they need not exist.
+            interval (float): Seconds between checks.
+        """
+        self.interval = interval
+        self._signatures = {path: file_signature(path) for path in files}
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """
+        Wait until watched files change.
+
+        Args:
+            timeout (float | None): Seconds to wait at most; None to wait
+                indefinitely.
+
+        Returns:
+            set[Path]: The files that changed; empty if the timeout expired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(deadline - time.monotonic(), 0.0))
+            time.sleep(delay)
+
+            changed = set()
+            for path, signature in self._signatures.items():
+                current = file_signature(path)
+                if current != signature:
+                    self._signatures[path] = current
+                    changed.add(path)
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        """Release resources (none for polling)."""
+
+
+class InotifyWatcher:
+    """Detects file changes with Linux inotify watches on their directories."""
+
+    def __init__(self, files: Iterable[Path]) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            files (Iterable[Path]): The files to watch; their directories must
+                exist.
+
+        Raises:
+            OSError: If inotify is unavailable or a directory cannot be
+                watched.
+        """
+        import ctypes
+
+        self._files = set(files)
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self._directories: dict[int, Path] = {}
+        try:
+            for directory in {path.parent for path in self._files}:
+                descriptor = self._libc.inotify_add_watch(
+                    self._fd, os.fsencode(directory), _WATCH_MASK
+                )
+                if descriptor < 0:
+                    errno = ctypes.get_errno()
+                    raise OSError(errno, os.strerror(errno), str(directory))
+                self._directories[descriptor] = directory
+        except OSError:
+            self.close()
+            raise
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """
+        Wait until watched files change.
+
+        Args:
+            timeout (float | None): Seconds to wait at most; None to wait
+                indefinitely.
+
+        Returns:
+            set[Path]: The files that changed; empty if the timeout expired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0.0)
+            if not select.select([self._fd], [], [], remaining)[0]:
+                return set()
+
+            changed = self._read_events()
+            if changed:
+                return changed
+
+    def _read_events(self) -> set[Path]:
+        """Drain pending events and map them to watched files."""
+        changed = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+            while offset < len(data):
+                descriptor, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    changed.update(self._files)
+                    continue
+                directory = self._directories.get(descriptor)
+                if directory is not None and name:
+                    path = directory / os.fsdecode(name)
+                    if path in self._files:
+                        changed.add(path)
+
+    def close(self) -> None:
+        """Close the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_watcher(
+    files: Iterable[Path], poll_interval: float = 1.0, polling: bool = False
+) -> InotifyWatcher | PollingWatcher:
+    """
+    Create the best available watcher for a set of files.
+
+    Args:
+        files (Iterable[Path]): The files to watch.
+        poll_interval (float): Seconds between checks when polling.
+        polling (bool): Force polling even where inotify is available.
+
+    Returns:
+        InotifyWatcher | PollingWatcher: The watcher.
+    """
+    files = list(files)
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(files)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(files, poll_interval)
+
+
+class ConfigWatcher:
+    """Reports debounced key-level changes to configuration files."""
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        debounce: float = 0.2,
+        poll_interval: float = 1.0,
+        polling: bool = False,
+    ) -> None:
+        """
+        Parse the files and start watching them.
+
+        Args:
+            paths (Iterable[Path]): Configuration files to watch.
+            debounce (float): Seconds without further writes before changes
+                are reported.
+            poll_interval (float): Seconds between checks when polling.
+            polling (bool): Force polling even where inotify is available.
+        """
+        self.debounce = debounce
+        self._documents: dict[Path, dict[str, Any]] = {}
+        self._sources: dict[Path, Path] = {}
+        for path in paths:
+            path = path.expanduser().absolute()
+            self._documents[path] = load_watched_document(path) or {}
+            for trigger in (path, journal_path(path), path.resolve()):
+                self._sources[trigger] = path
+
+        self._watcher = open_watcher(self._sources, poll_interval, polling)
+
+    def __enter__(self) -> "ConfigWatcher":
+        """Return the watcher."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop watching."""
+        self.close()
+
+    def __iter__(self) -> Iterator[list[Change]]:
+        """
+        Wait for changes indefinitely.
+
+        Yields:
+            list[Change]: The keys changed by one settled burst of writes.
+        """
+        while True:
+            changed = self._watcher.wait()
+            deadline = time.monotonic() + self.debounce * _MAX_DEBOUNCE_PERIODS
+            while time.monotonic() < deadline:
+                more = self._watcher.wait(self.debounce)
+                if not more:
+                    break
+                changed |= more
+
+            changes = []
+            for path in sorted({self._sources[trigger] for trigger in changed}):
+                changes.extend(self._reload(path))
+            if changes:
+                yield changes
+
+    def _reload(self, path: Path) -> list[Change]:
+        """Re-parse a file and diff it against the previous parse."""
+        document = load_watched_document(path)
+        if document is None:
+            return []
+
+        previous = self._documents[path]
+        self._documents[path] = document
+        return [
+            Change(event, str(path), key, old, new)
+            for event, key, old, new in diff_documents(previous, document)
+        ]
+
+    def close(self) -> None:
+        """Stop watching."""
+        self._watcher.close()
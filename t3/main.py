@@ -1,36 +1,47 @@
 """Main CLI application entry point."""
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from t3 import __version__
-from t3.commands.config import config_app
-from t3.commands.init import init_app
+from t3.core.lazy import LazyTyperGroup
+from t3.core.output import OUTPUT_MODES, Column, get_renderer, push_renderer
+
+
+class T3Group(LazyTyperGroup):
+    """Top-level command group; subcommand groups are imported on demand."""
+
+    lazy_subcommands = {
+        "init": "t3.commands.init:init_app",
+        "config": "t3.commands.config:config_app",
+        "bench": "t3.commands.bench:bench_app",
+        "daemon": "t3.commands.daemon:daemon_app",
+        "batch": "t3.commands.batch:batch_command",
+        "edge": "t3.commands.edge:edge_app",
+        "cameras": "t3.commands.cameras:cameras_app",
+        "frames": "t3.commands.frames:frames_app",
+        "storage": "t3.commands.storage:storage_app",
+    }
 
-console = Console()
 
 app = typer.Typer(
     name="t3",
+    cls=T3Group,
     help="T3 CLI - A powerful command-line interface tool",
     rich_markup_mode="rich",
     add_completion=True,
 )
 
-# Add subcommands
-app.add_typer(init_app, name="init")
-app.add_typer(config_app, name="config")
-
 
 def version_callback(value: bool) -> None:
     """Show version information."""
     if value:
-        console.print(f"T3 CLI version: {__version__}", style="bold green")
+        typer.secho(f"T3 CLI version: {__version__}", fg="green", bold=True)
         raise typer.Exit()
 
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     version: bool | None = typer.Option(
         None,
         "--version",
@@ -39,9 +50,21 @@ def main(
         callback=version_callback,
         is_eager=True,
     ),
+    output: str | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help=f"Output format: {', '.join(OUTPUT_MODES)}",
+        envvar="T3_OUTPUT",
+        show_default="rich",
+    ),
 ) -> None:
     """T3 CLI - A powerful command-line interface tool."""
-    pass
+    try:
+        renderer = push_renderer(output)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="'--output'") from None
+    ctx.call_on_close(renderer.close)
 
 
 @app.command()
@@ -49,22 +72,33 @@ def hello(
     name: str = typer.Option("World", "--name", "-n", help="Name to greet"),
 ) -> None:
     """Say hello to someone."""
-    console.print(f"Hello, [bold cyan]{name}[/bold cyan]! 👋", style="bold")
+    renderer = get_renderer()
+    shown = name
+    if renderer.mode == "rich":
+        from rich.markup import escape
+
+        shown = f"[bold cyan]{escape(name)}[/bold cyan]"
+    renderer.record(
+        {"greeting": f"Hello, {name}!"},
+        text=f"Hello, {shown}! 👋",
+        style="bold",
+    )
 
 
 @app.command()
 def status() -> None:
     """Show current system status."""
-    table = Table(title="T3 CLI Status", show_header=True, header_style="bold magenta")
-    table.add_column("Component", style="cyan", no_wrap=True)
-    table.add_column("Status", style="green")
-    table.add_column("Version", justify="right", style="blue")
-
-    table.add_row("CLI", "✅ Active", __version__)
-    table.add_row("Configuration", "✅ Loaded", "1.0")
-    table.add_row("Database", "🟡 Connecting", "N/A")
-
-    console.print(table)
+    columns = (
+        Column("Component", style="cyan"),
+        Column("Status", style="green"),
+        Column("Version", style="blue", justify="right"),
+    )
+    rows = (
+        ("CLI", "✅ Active", __version__),
+        ("Configuration", "✅ Loaded", "1.0"),
+        ("Database", "🟡 Connecting", "N/A"),
+    )
+    get_renderer().table(columns, rows, title="T3 CLI Status")
 
 
 if __name__ == "__main__":
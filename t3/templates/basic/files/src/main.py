@@ -0,0 +1,7 @@
+"""Main module for {{ name }}."""
+
+def main():
+    print("Hello from {{ name }}!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Tests for batch parsing and the batch command."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from t3.core import config as core_config
+from t3.core.batch import parse_batch
+from t3.main import app
+
+runner = CliRunner()
+
+
+class TestParseBatch:
+    """Test cases for batch input parsing."""
+
+    def test_parse_lines(self) -> None:
+        """Test newline-delimited input with comments and blank lines."""
+        text = "# provisioning\nt3 config set a 1\n\nconfig set b 'two words'  # c\n"
+
+        assert parse_batch(text) == [
+            ["config", "set", "a", "1"],
+            ["config", "set", "b", "two words"],
+        ]
+
+    def test_parse_json_array(self) -> None:
+        """Test JSON arrays of strings and argument lists."""
+        text = json.dumps(["t3 status", ["config", "get", "a b"], ""])
+
+        assert parse_batch(text) == [["status"], ["config", "get", "a b"]]
+
+    def test_parse_invalid_json_item(self) -> None:
+        """Test that non-string JSON items are rejected."""
+        with pytest.raises(ValueError, match="Item 0"):
+            parse_batch("[1]")
+
+    def test_parse_unbalanced_quotes(self) -> None:
+        """Test that unbalanced quotes report the line number."""
+        with pytest.raises(ValueError, match="Line 2"):
+            parse_batch("status\nconfig set a 'b\n")
+
+
+class TestBatchCommand:
+    """Test cases for ``t3 batch``."""
+
+    @pytest.fixture(autouse=True)
+    def _home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Point the default config location at a temporary home."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+    def test_shares_one_config_write(self, tmp_path: Path) -> None:
+        """Test that config changes are written once at the end."""
+        config_file = tmp_path / ".t3" / "config.json"
+        batch_input = "config set a 1\nconfig set b 2\nconfig delete a\n"
+
+        with patch.object(
+            core_config, "atomic_write_text", wraps=core_config.atomic_write_text
+        ) as mock_write:
+            result = runner.invoke(app, ["batch"], input=batch_input)
+
+        assert result.exit_code == 0
+        mock_write.assert_called_once()
+        assert json.loads(config_file.read_text()) == {"b": 2}
+
+    def test_reads_own_writes(self) -> None:
+        """Test that reads see changes not yet written to disk."""
+        batch_input = (
+            "config get a\nconfig set a 2\nconfig get a\n"
+            "config get a --explain\nconfig delete a\nconfig get a\n"
+        )
+        runner.invoke(app, ["config", "set", "a", "1"])
+
+        result = runner.invoke(
+            app,
+            ["-o", "plain", "batch", "--continue-on-error"],
+            input=batch_input,
+        )
+
+        lines = result.stdout.splitlines()
+        assert lines[:4] == ["a = 1", "Set a = 2", "a = 2", "a = 2"]
+        assert lines[5].endswith("\t2")
+        assert "Key 'a' not found" in result.stderr
+
+    def test_crashing_command(self, tmp_path: Path) -> None:
+        """Test that an exception fails one command, not the batch."""
+        config_file = tmp_path / ".t3" / "config.json"
+        batch_input = "config set a 1\nhello\nconfig set b 2\n"
+
+        with patch("t3.main.get_renderer", side_effect=RuntimeError("boom")):
+            result = runner.invoke(
+                app,
+                ["-o", "plain", "batch", "--continue-on-error"],
+                input=batch_input,
+            )
+
+        assert result.exit_code == 1
+        assert "'hello' crashed: RuntimeError: boom" in result.stderr
+        assert "2 succeeded, 1 failed" in result.stderr
+        assert json.loads(config_file.read_text()) == {"a": 1, "b": 2}
+
+    def test_stops_on_first_error(self, tmp_path: Path) -> None:
+        """Test that execution stops at the first failing command."""
+        batch_file = tmp_path / "batch.txt"
+        batch_file.write_text("hello\nconfig get missing\nhello -n Again\n")
+
+        result = runner.invoke(app, ["batch", str(batch_file), "--json"])
+
+        report = json.loads(result.output[result.output.index("{") :])
+        assert result.exit_code == 1
+        assert report["executed"] == 2
+        assert [entry["exit_code"] for entry in report["commands"]] == [0, 1]
+
+    def test_continue_on_error(self, tmp_path: Path) -> None:
+        """Test that --continue-on-error runs every command."""
+        result = runner.invoke(
+            app,
+            ["batch", "--continue-on-error", "--json"],
+            input="config get missing\nbatch nested\nhello\n",
+        )
+
+        report = json.loads(result.output[result.output.index("{") :])
+        assert result.exit_code == 1
+        assert report["failed"] == 2
+        assert [entry["exit_code"] for entry in report["commands"]] == [1, 1, 0]
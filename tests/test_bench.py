@@ -0,0 +1,102 @@
+"""Tests for startup benchmarking helpers."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from t3.core.bench import (
+    aggregate_imports,
+    benchmark_startup,
+    parse_importtime,
+    percentile,
+)
+from t3.main import app
+
+runner = CliRunner()
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 |     typer.core
+import time:      2000 |       2900 |   typer
+some unrelated stderr line
+"""
+
+
+class TestPercentile:
+    """Test cases for percentile computation."""
+
+    def test_median_of_odd_sample(self) -> None:
+        """Test the 50th percentile of an odd-sized sample."""
+        assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+
+    def test_interpolates_between_ranks(self) -> None:
+        """Test linear interpolation between neighbouring ranks."""
+        assert percentile([10.0, 20.0], 50) == 15.0
+        assert percentile([0.0, 100.0], 95) == pytest.approx(95.0)
+
+    def test_single_value(self) -> None:
+        """Test that a single sample is its own percentile."""
+        assert percentile([7.0], 95) == 7.0
+
+
+class TestImportTime:
+    """Test cases for ``-X importtime`` parsing and aggregation."""
+
+    def test_parse_importtime(self) -> None:
+        """Test parsing skips the header and unrelated lines."""
+        timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert timings == {
+            "_io": (120, 120),
+            "typer.core": (300, 900),
+            "typer": (2000, 2900),
+        }
+
+    def test_aggregate_imports_sorted_by_self_time(self) -> None:
+        """Test averaging across runs and sorting by self time."""
+        first = {"typer": (2000, 2900), "_io": (100, 100)}
+        second = {"typer": (1000, 1900), "_io": (300, 300)}
+
+        timings = aggregate_imports([first, second])
+
+        assert [timing.module for timing in timings] == ["typer", "_io"]
+        assert timings[0].self_us == 1500
+        assert timings[0].cumulative_us == 2400
+
+    def test_aggregate_imports_top(self) -> None:
+        """Test truncating the breakdown to the slowest modules."""
+        timings = aggregate_imports([parse_importtime(IMPORTTIME_OUTPUT)], top=1)
+
+        assert [timing.module for timing in timings] == ["typer"]
+
+    def test_aggregate_imports_empty(self) -> None:
+        """Test aggregating no samples."""
+        assert aggregate_imports([]) == []
+
+
+class TestBenchmarkStartup:
+    """Test cases for timed launches and their exit status."""
+
+    @patch("t3.core.bench._launch")
+    def test_first_failure_is_reported(self, mock_launch: Mock) -> None:
+        """Test that a failed launch is not hidden by later successful ones."""
+        mock_launch.side_effect = [(10.0, 0, ""), (12.0, 3, ""), (11.0, 0, "")]
+
+        result = benchmark_startup("hello", ["hello"], runs=3, import_runs=0)
+
+        assert result.exit_code == 3
+
+    @patch("t3.core.bench._launch")
+    def test_command_fails(self, mock_launch: Mock) -> None:
+        """Test that t3 bench startup exits non-zero after a failed launch."""
+        mock_launch.side_effect = [(10.0, 2, ""), (11.0, 0, "")]
+
+        result = runner.invoke(
+            app,
+            ["bench", "startup", "-n", "2", "--import-runs", "0", "-c", "x", "--json"],
+        )
+
+        assert result.exit_code == 1
+        assert '"exit_code": 2' in result.stdout
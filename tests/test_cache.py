@@ -0,0 +1,65 @@
+"""Tests for the on-disk cache."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from t3.core import layers
+from t3.core.cache import DiskCache, get_cache
+
+
+class TestDiskCache:
+    """Test cases for cache entries, expiry and eviction."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test storing and reading plain values."""
+        cache = DiskCache("test", tmp_path / "cache")
+        value = ("name", {"version": "1.0"}, (("a", "b"), b"\xff"))
+
+        assert cache.get("key") is None
+        assert cache.put("key", value)
+        assert cache.get("key") == value
+        assert 0 <= cache.age("key") < 60
+
+    def test_ttl_expiry(self, tmp_path: Path) -> None:
+        """Test that entries older than the TTL are misses and removed."""
+        cache = DiskCache("test", tmp_path, ttl=0.05)
+        cache.put("key", 1)
+        time.sleep(0.1)
+
+        assert cache.get("key") is None
+        assert not cache.path("key").exists()
+
+    def test_unserializable_value(self, tmp_path: Path) -> None:
+        """Test that values marshal cannot store are skipped."""
+        cache = DiskCache("test", tmp_path)
+
+        assert not cache.put("key", object())
+        assert cache.get("key") is None
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test that the least recently used entries are evicted first."""
+        cache = DiskCache("test", tmp_path, max_bytes=3500)
+        for index, key in enumerate(("a", "b", "c")):
+            cache.put(key, b"x" * 1000)
+            os.utime(cache.path(key), ns=(index * 10**9, index * 10**9))
+        cache.get("a")  # "a" becomes the most recently used.
+
+        cache.put("d", b"x" * 1000)
+
+        assert [key for key in "abcd" if cache.path(key).exists()] == ["a", "c", "d"]
+
+    def test_disabled(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that T3_CACHE_ENABLED=false disables caches."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(layers, "_resolved", {})
+        monkeypatch.setenv("T3_CACHE_TTL", "60")
+        assert get_cache("test").ttl == 60
+
+        for value in ("no", "0", "false", "OFF"):
+            monkeypatch.setenv("T3_CACHE_ENABLED", value)
+            assert get_cache("test") is None, value
+        monkeypatch.setenv("T3_CACHE_ENABLED", "yes")
+        assert get_cache("test") is not None
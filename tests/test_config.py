@@ -4,7 +4,17 @@ import json
 from pathlib import Path
 from unittest.mock import Mock, mock_open, patch
 
-from t3.core.config import ConfigManager
+import pytest
+
+from t3.core.config import (
+    ConfigConflictError,
+    ConfigManager,
+    cached_manager,
+    get_config,
+    parse_bool,
+    parse_value,
+    same_value,
+)
 
 
 class TestConfigManager:
@@ -62,21 +72,18 @@ class TestConfigManager:
         config_manager = ConfigManager()
         assert config_manager._config_data == {}
 
-    @patch("pathlib.Path.mkdir")
-    @patch("pathlib.Path.open")
-    def test_save_config(self, mock_open_file: Mock, mock_mkdir: Mock) -> None:
+    def test_save_config(self, tmp_path: Path) -> None:
         """Test saving config to file."""
+        config_path = tmp_path / "nested" / "config.json"
         test_data = {"key": "value"}
 
-        mock_file = mock_open()
-        mock_open_file.return_value = mock_file.return_value
-
-        config_manager = ConfigManager()
+        config_manager = ConfigManager(str(config_path))
         config_manager._config_data = test_data
         config_manager.save_config()
 
-        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-        mock_file.return_value.write.assert_called()
+        assert json.loads(config_path.read_text()) == test_data
+        assert list(config_path.parent.iterdir()) == [config_path]
+        assert config_manager.dirty is False
 
     def test_get_existing_key(self) -> None:
         """Test getting an existing configuration key."""
@@ -138,6 +145,84 @@ class TestConfigManager:
         assert result == test_data
         assert result is not config_manager._config_data  # Should be a copy
 
+    @patch.object(ConfigManager, "save_config")
+    def test_set_unchanged_value_does_not_save(self, mock_save: Mock) -> None:
+        """Test that setting an identical value is not written."""
+        config_manager = ConfigManager()
+        config_manager._config_data = {"key": "value"}
+
+        config_manager.set("key", "value")
+
+        assert config_manager.dirty is False
+        mock_save.assert_not_called()
+
+    def test_transaction_writes_once(self, tmp_path: Path) -> None:
+        """Test that a transaction defers all writes to a single commit."""
+        config_path = tmp_path / "config.json"
+        config_manager = ConfigManager(str(config_path))
+
+        with patch.object(
+            ConfigManager, "save_config", wraps=config_manager.save_config
+        ) as mock_save:
+            with config_manager.transaction():
+                for index in range(500):
+                    config_manager.set(f"key{index}", index)
+                config_manager.delete("key0")
+                assert config_manager.dirty is True
+                assert not config_path.exists()
+
+        mock_save.assert_called_once()
+        saved = json.loads(config_path.read_text())
+        assert len(saved) == 499
+        assert config_manager.dirty is False
+
+    def test_nested_transaction_commits_at_outermost(self, tmp_path: Path) -> None:
+        """Test that nested transactions only write when the outer one exits."""
+        config_path = tmp_path / "config.json"
+        config_manager = ConfigManager(str(config_path))
+
+        with config_manager.transaction():
+            with config_manager.transaction():
+                config_manager.set("key", "value")
+            assert not config_path.exists()
+
+        assert json.loads(config_path.read_text()) == {"key": "value"}
+
+    def test_transaction_rolls_back_on_error(self, tmp_path: Path) -> None:
+        """Test that a failing transaction restores the previous state."""
+        config_path = tmp_path / "config.json"
+        config_manager = ConfigManager(str(config_path))
+        config_manager.set("keep", 1)
+
+        with pytest.raises(RuntimeError), config_manager.transaction():
+            config_manager.set("discard", 2)
+            raise RuntimeError("boom")
+
+        assert config_manager.get_all() == {"keep": 1}
+        assert config_manager.dirty is False
+        assert json.loads(config_path.read_text()) == {"keep": 1}
+
+    @patch.object(ConfigManager, "save_config")
+    def test_update_writes_once(self, mock_save: Mock) -> None:
+        """Test that update() sets many keys with a single save."""
+        config_manager = ConfigManager()
+        config_manager._config_data = {}
+
+        config_manager.update({"a": 1, "b": 2})
+
+        assert config_manager.get_all() == {"a": 1, "b": 2}
+        mock_save.assert_called_once()
+
+    @patch.object(ConfigManager, "save_config")
+    def test_update_unchanged_does_not_save(self, mock_save: Mock) -> None:
+        """Test that update() with identical values does not write."""
+        config_manager = ConfigManager()
+        config_manager._config_data = {"a": 1}
+
+        config_manager.update({"a": 1})
+
+        mock_save.assert_not_called()
+
     @patch("pathlib.Path.unlink")
     def test_reset(self, mock_unlink: Mock) -> None:
         """Test resetting configuration."""
@@ -148,3 +233,257 @@ class TestConfigManager:
 
         assert config_manager._config_data == {}
         mock_unlink.assert_called_once_with(missing_ok=True)
+
+
+class TestConfigCache:
+    """Test cases for the shared config cache and conflict detection."""
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path) -> None:
+        """Test that a second load of an unchanged file skips json.load."""
+        config_path = tmp_path / "config.json"
+        ConfigManager(str(config_path)).set("key", "value")
+
+        with patch("t3.core.config.json.load") as mock_load:
+            config_manager = ConfigManager(str(config_path))
+
+        mock_load.assert_not_called()
+        assert config_manager.get("key") == "value"
+
+    def test_get_config_is_shared_and_revalidated(self, tmp_path: Path) -> None:
+        """Test that get_config reuses one manager and sees external writes."""
+        config_path = str(tmp_path / "config.json")
+        config_manager = get_config(config_path)
+        config_manager.set("key", "old")
+
+        ConfigManager(config_path).set("key", "new")
+
+        assert get_config(config_path) is config_manager
+        assert config_manager.get("key") == "new"
+        assert cached_manager(tmp_path / "config.json") is config_manager
+        assert cached_manager(tmp_path / "other.json") is None
+
+    def test_concurrent_writers_are_merged(self, tmp_path: Path) -> None:
+        """Test that a stale writer re-applies its change on top of others'."""
+        config_path = tmp_path / "config.json"
+        first = ConfigManager(str(config_path))
+        second = ConfigManager(str(config_path))
+
+        first.set("owner", "first")
+        second.set("video.fps", 30)
+        second.set("owner", "second")
+
+        assert json.loads(config_path.read_text()) == {
+            "owner": "second",
+            "video": {"fps": 30},
+        }
+        assert first.get("video.fps") is None
+
+    def test_concurrent_modification_conflict(self, tmp_path: Path) -> None:
+        """Test that a change that no longer applies raises."""
+        config_path = tmp_path / "config.json"
+        first = ConfigManager(str(config_path))
+        second = ConfigManager(str(config_path))
+
+        first.set("video", "disabled")
+
+        with pytest.raises(ConfigConflictError):
+            second.set("video.fps", 30)
+        assert json.loads(config_path.read_text()) == {"video": "disabled"}
+
+    def test_failed_write_is_discarded_on_refresh(self, tmp_path: Path) -> None:
+        """Test that refresh drops changes left over from a conflict."""
+        config_path = tmp_path / "config.json"
+        config_manager = ConfigManager(str(config_path))
+        ConfigManager(str(config_path)).set("key", "theirs")
+
+        with pytest.raises(ConfigConflictError):
+            config_manager.set("key.nested", "mine")
+        config_manager.refresh()
+
+        assert config_manager.dirty is False
+        assert config_manager.get("key") == "theirs"
+
+    def test_change_does_not_leak_into_shared_document(self, tmp_path: Path) -> None:
+        """Test that changing a cached document copies what it touches."""
+        config_path = str(tmp_path / "config.json")
+        first = ConfigManager(config_path)
+        first.update({"video.fps": 30, "video.codec": "h264", "site": "store"})
+        second = ConfigManager(config_path)
+
+        with patch.object(ConfigManager, "save_config"):
+            second.set("video.fps", 15)
+            second.set("video.extra.level", 2)
+
+        assert first.get_all() == {
+            "video": {"fps": 30, "codec": "h264"},
+            "site": "store",
+        }
+        assert second.get("video.codec") == "h264"
+        assert second.get("video.extra") == {"level": 2}
+
+
+class TestDottedPaths:
+    """Test cases for nested documents addressed by dotted paths."""
+
+    @pytest.fixture
+    def config_manager(self, tmp_path: Path) -> ConfigManager:
+        """Create a manager backed by a temporary file."""
+        return ConfigManager(str(tmp_path / "config.json"))
+
+    def test_set_creates_sections(self, config_manager: ConfigManager) -> None:
+        """Test that setting a dotted path creates nested sections."""
+        config_manager.set("video.processing.batch_size", 4)
+
+        assert config_manager.get_all() == {"video": {"processing": {"batch_size": 4}}}
+        assert config_manager.get("video.processing") == {"batch_size": 4}
+        assert "video.processing.batch_size" in config_manager
+
+    def test_set_replaces_subtree_index(self, config_manager: ConfigManager) -> None:
+        """Test that replacing a section drops its old paths from the index."""
+        config_manager.set("video", {"fps": 30, "input": {"source": "camera"}})
+        config_manager.set("video", {"fps": 15})
+
+        assert config_manager.get("video.fps") == 15
+        assert config_manager.get("video.input.source") is None
+
+    def test_set_copies_value(self, config_manager: ConfigManager) -> None:
+        """Test that changing a value after setting it leaves the config alone."""
+        value = {"fps": 30, "sizes": [1, 2]}
+        config_manager.set("video", value)
+        value["fps"] = 15
+        value["sizes"].append(3)
+
+        assert config_manager.get("video") == {"fps": 30, "sizes": [1, 2]}
+
+        with config_manager.transaction():
+            config_manager.set("audio", value)
+            value["fps"] = 5
+        assert config_manager.get("audio.fps") == 15
+
+    def test_set_changes_type(
+        self, config_manager: ConfigManager, tmp_path: Path
+    ) -> None:
+        """Test that 1, 1.0 and true are different values."""
+        config_manager.set("b", 1)
+        config_manager.set("b", True)
+        config_manager.set("c", {"d": [1]})
+        config_manager.set("c", {"d": [1.0]})
+
+        reloaded = ConfigManager(str(tmp_path / "config.json"))
+        assert reloaded.get("b") is True
+        assert isinstance(reloaded.get("c.d")[0], float)
+        assert same_value({"d": [1]}, {"d": [1]})
+        assert not same_value([1], [True])
+
+    def test_set_through_scalar_fails(self, config_manager: ConfigManager) -> None:
+        """Test that a scalar cannot be used as a section."""
+        config_manager.set("video", "disabled")
+
+        with pytest.raises(ValueError, match="not a section"):
+            config_manager.set("video.fps", 30)
+
+    def test_delete_section(self, config_manager: ConfigManager) -> None:
+        """Test that deleting a section removes every path below it."""
+        config_manager.update({"video.fps": 30, "video.input.source": "camera"})
+
+        assert config_manager.delete("video.input") is True
+        assert config_manager.get("video.input.source") is None
+        assert config_manager.get_all() == {"video": {"fps": 30}}
+        assert config_manager.delete("video.input") is False
+
+    def test_items_lists_subtree(self, config_manager: ConfigManager) -> None:
+        """Test flattened listing of the whole document and of a subtree."""
+        config_manager.update(
+            {"video.fps": 30, "video.input.source": "camera", "theme": "dark"}
+        )
+        config_manager.set("empty", {})
+
+        assert dict(config_manager.items()) == {
+            "video.fps": 30,
+            "video.input.source": "camera",
+            "theme": "dark",
+            "empty": {},
+        }
+        assert list(config_manager.items("video.input")) == [
+            ("video.input.source", "camera")
+        ]
+        assert list(config_manager.items("missing")) == []
+
+    def test_literal_dotted_keys_still_resolve(self, tmp_path: Path) -> None:
+        """Test that existing flat keys containing dots keep working."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"app.name": "T3"}))
+        config_manager = ConfigManager(str(config_path))
+
+        assert config_manager.get("app.name") == "T3"
+        config_manager.set("app.name", "T3 CLI")
+        assert json.loads(config_path.read_text()) == {"app.name": "T3 CLI"}
+
+    def test_cached_document_is_not_mutated(self, tmp_path: Path) -> None:
+        """Test that nested changes do not leak into other managers."""
+        config_path = str(tmp_path / "config.json")
+        ConfigManager(config_path).set("video.fps", 30)
+        first = ConfigManager(config_path)
+        second = ConfigManager(config_path)
+
+        with first.transaction():
+            first.set("video.fps", 15)
+            assert second.get("video.fps") == 30
+
+    def test_rollback_restores_nested_values(
+        self, config_manager: ConfigManager
+    ) -> None:
+        """Test that a failed transaction restores nested values."""
+        config_manager.set("video.fps", 30)
+
+        with pytest.raises(RuntimeError), config_manager.transaction():
+            config_manager.set("video.fps", 15)
+            raise RuntimeError("boom")
+
+        assert config_manager.get("video.fps") == 30
+
+
+class TestParseValue:
+    """Test cases for typed value parsing."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("8080", 8080),
+            ("0.5", 0.5),
+            ("true", True),
+            ("False", False),
+            ("null", None),
+            ('["a", 1]', ["a", 1]),
+            ('{"fps": 30}', {"fps": 30}),
+            ('"8080"', "8080"),
+            ("007", "007"),
+            ("hello world", "hello world"),
+            ("NaN", "NaN"),
+        ],
+    )
+    def test_parse_value(self, text: str, expected: object) -> None:
+        """Test that JSON literals are typed and other text stays a string."""
+        assert parse_value(text) == expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("no", False),
+            ("0", False),
+            ("false", False),
+            (" Off ", False),
+            ("yes", True),
+            ("1", True),
+            (0, False),
+            (True, True),
+            ("maybe", None),
+            (None, None),
+        ],
+    )
+    def test_parse_bool(self, value: object, expected: bool | None) -> None:
+        """Test flag words; unknown values fall back to the default."""
+        assert parse_bool(value, default=True) is (
+            True if expected is None else expected
+        )
+        assert parse_bool(value) is bool(expected)
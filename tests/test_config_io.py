@@ -0,0 +1,183 @@
+"""Tests for bulk configuration import and export."""
+
+import io
+import json
+import tomllib
+from pathlib import Path
+
+import pytest
+
+from t3.core.config import ConfigManager
+from t3.core.config_io import (
+    detect_format,
+    dump_toml,
+    export_config,
+    import_entries,
+    iter_entries,
+)
+
+EDGE_TOML = """\
+target_fps = 30
+protocol = "amqp"
+
+[optimization]
+max_workers = 20
+frame_resolution = "1280x720"
+
+[[cameras]]
+id = "cam1"
+url = "rtsp://camera/1"
+
+[[cameras]]
+id = "cam2"
+url = "rtsp://camera/2"
+"""
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> ConfigManager:
+    """Create a manager backed by a temporary file."""
+    return ConfigManager(str(tmp_path / "config.json"))
+
+
+class TestImport:
+    """Test cases for reading and applying imports."""
+
+    def test_detect_format(self) -> None:
+        """Test format detection from file extensions."""
+        assert detect_format("dump.jsonl") == "ndjson"
+        assert detect_format("edge.TOML") == "toml"
+        assert detect_format("site.yml") == "yaml"
+        assert detect_format("-") == "json"
+
+    def test_ndjson_records(self) -> None:
+        """Test key/value records and nested objects in NDJSON."""
+        stream = io.StringIO(
+            '{"key": "video.fps", "value": 30}\n\n{"redis": {"ttl_seconds": 60}}\n'
+        )
+
+        assert list(iter_entries(stream, "ndjson")) == [
+            ("video.fps", 30),
+            ("redis.ttl_seconds", 60),
+        ]
+
+    def test_ndjson_is_streamed(self) -> None:
+        """Test that NDJSON entries are produced before the input is consumed."""
+        lines = iter(['{"key": "a", "value": 1}\n', "not json\n"])
+
+        entries = iter_entries(lines, "ndjson")
+
+        assert next(entries) == ("a", 1)
+        with pytest.raises(ValueError, match="Line 2"):
+            next(entries)
+
+    def test_toml_document(self) -> None:
+        """Test flattening a TOML document with an array of tables."""
+        entries = dict(iter_entries(io.StringIO(EDGE_TOML), "toml"))
+
+        assert entries["optimization.max_workers"] == 20
+        assert entries["cameras"][1] == {"id": "cam2", "url": "rtsp://camera/2"}
+
+    def test_invalid_document(self) -> None:
+        """Test that malformed or non-mapping documents are rejected."""
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            list(iter_entries(io.StringIO("a: [1"), "yaml"))
+        with pytest.raises(ValueError, match="mapping"):
+            list(iter_entries(io.StringIO("[1, 2]"), "json"))
+
+    def test_merge_strategy(self, config: ConfigManager) -> None:
+        """Test that merge overrides leaves and keeps other sections."""
+        config.update({"video.fps": 30, "video.codec": "h264"})
+
+        counts = import_entries(
+            config, [("video.fps", 15), ("video.codec", "h264")], "merge"
+        )
+
+        assert counts == {"changed": 1, "unchanged": 1, "skipped": 0}
+        assert config.get_all() == {"video": {"fps": 15, "codec": "h264"}}
+
+    def test_missing_strategy(self, config: ConfigManager) -> None:
+        """Test that only absent paths are added."""
+        config.update({"video.fps": 30, "mode": "edge"})
+
+        counts = import_entries(
+            config,
+            [("video.fps", 15), ("video.codec", "h264"), ("mode.name", "x")],
+            "missing",
+        )
+
+        assert counts == {"changed": 1, "unchanged": 0, "skipped": 2}
+        assert config.get_all() == {
+            "video": {"fps": 30, "codec": "h264"},
+            "mode": "edge",
+        }
+
+    def test_replace_strategy_writes_once(self, config: ConfigManager) -> None:
+        """Test that replace discards old values with a single write."""
+        config.set("old", True)
+        mtime = config.config_path.stat().st_mtime_ns
+
+        import_entries(config, iter([("new", 1), ("other.value", 2)]), "replace")
+
+        assert json.loads(config.config_path.read_text()) == {
+            "new": 1,
+            "other": {"value": 2},
+        }
+        assert config.config_path.stat().st_mtime_ns != mtime
+
+    def test_type_change_is_imported(self, config: ConfigManager) -> None:
+        """Test that true over 1 and 1.0 over 1 are changes, not no-ops."""
+        config.update({"a": 1, "b": 1, "c": 1})
+
+        counts = import_entries(config, [("a", True), ("b", 1.0), ("c", 1)], "merge")
+
+        assert counts == {"changed": 2, "unchanged": 1, "skipped": 0}
+        assert config.get("a") is True
+        assert isinstance(config.get("b"), float)
+
+    def test_failed_import_is_rolled_back(self, config: ConfigManager) -> None:
+        """Test that an invalid entry leaves the configuration untouched."""
+        config.set("video", "disabled")
+
+        with pytest.raises(ValueError):
+            import_entries(config, [("a", 1), ("video.fps", 30)], "merge")
+
+        assert config.get_all() == {"video": "disabled"}
+
+
+class TestExport:
+    """Test cases for exporting configuration."""
+
+    def test_ndjson_roundtrip(self, config: ConfigManager, tmp_path: Path) -> None:
+        """Test that an NDJSON export imports back to the same document."""
+        config.update({"video.fps": 30, "tags": ["a"], "site.name": "store"})
+        stream = io.StringIO()
+
+        assert export_config(config, stream, "ndjson") == 3
+
+        other = ConfigManager(str(tmp_path / "other.json"))
+        stream.seek(0)
+        import_entries(other, iter_entries(stream, "ndjson"), "replace")
+        assert other.get_all() == config.get_all()
+
+    def test_export_section(self, config: ConfigManager) -> None:
+        """Test exporting a single section as JSON."""
+        config.update({"video.fps": 30, "theme": "dark"})
+        stream = io.StringIO()
+
+        export_config(config, stream, "json", prefix="video")
+
+        assert json.loads(stream.getvalue()) == {"fps": 30}
+
+    def test_toml_roundtrip(self) -> None:
+        """Test that dump_toml output parses back to the same document."""
+        document = tomllib.loads(EDGE_TOML)
+        document["nested"] = {"deep": {"key with space": [1, 2.5, True]}}
+
+        assert tomllib.loads(dump_toml(document)) == document
+        assert "[[cameras]]" in dump_toml(document)
+
+    def test_toml_rejects_null(self) -> None:
+        """Test that null values cannot be exported to TOML."""
+        with pytest.raises(ValueError, match="video.fps"):
+            dump_toml({"video": {"fps": None}})
@@ -0,0 +1,190 @@
+"""Tests for the persistent daemon and its client."""
+
+import marshal
+import os
+import socket
+import subprocess
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from t3.core.daemon import (
+    EXIT,
+    REQUEST,
+    STDOUT,
+    _read_stdin,
+    build_daemon,
+    control,
+    recv_frame,
+    run_remote,
+    send_frame,
+)
+
+
+@pytest.fixture
+def daemon_socket(tmp_path: Path) -> Iterator[Path]:
+    """Run a daemon in a background thread for the duration of a test."""
+    socket_path = tmp_path / "t3.sock"
+    daemon = build_daemon(socket_path)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    for _ in range(200):
+        if control("ping", socket_path) is not None:
+            break
+        threading.Event().wait(0.01)
+
+    yield socket_path
+
+    control("shutdown", socket_path)
+    thread.join(timeout=5)
+
+
+def _run_client(socket_path: Path, home: Path, *argv: str, stdin: str = "") -> tuple:
+    """Run the daemon client in a fresh interpreter."""
+    env = {**os.environ, "HOME": str(home), "T3_DAEMON_SOCKET": str(socket_path)}
+    env["T3_USE_DAEMON"] = "1"
+    result = subprocess.run(
+        [sys.executable, "-m", "t3", *argv],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    return result.returncode, result.stdout, result.stderr
+
+
+class TestFraming:
+    """Test cases for the wire format."""
+
+    def test_frame_roundtrip(self) -> None:
+        """Test that frames survive a socket roundtrip."""
+        left, right = socket.socketpair()
+        with left, right:
+            send_frame(left, STDOUT, b"hello")
+            assert recv_frame(right) == (STDOUT, b"hello")
+
+    def test_recv_frame_closed_connection(self) -> None:
+        """Test that a closed connection raises ConnectionError."""
+        left, right = socket.socketpair()
+        with right:
+            left.close()
+            with pytest.raises(ConnectionError):
+                recv_frame(right)
+
+
+class TestStdinForwarding:
+    """Test cases for forwarding the client's stdin."""
+
+    def test_reads_in_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that stdin is read in chunks and the surplus kept."""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"line one\nline two\n")
+        os.close(write_fd)
+        monkeypatch.setattr(sys, "stdin", SimpleNamespace(fileno=lambda: read_fd))
+        surplus = bytearray()
+
+        try:
+            first = _read_stdin(5, surplus)
+            assert surplus == b"one\nline two\n"
+            rest = [_read_stdin(5, surplus) for _ in range(4)]
+        finally:
+            os.close(read_fd)
+
+        assert [first, *rest] == [b"line ", b"one\nl", b"ine t", b"wo\n", b""]
+
+
+class TestDaemon:
+    """Test cases for daemon execution and the client shim."""
+
+    def test_control_unreachable(self, tmp_path: Path) -> None:
+        """Test that control requests report an absent daemon as None."""
+        assert control("ping", tmp_path / "missing.sock") is None
+        assert run_remote(["status"], tmp_path / "missing.sock") is None
+
+    def test_ping_reports_status(self, daemon_socket: Path) -> None:
+        """Test that ping returns the daemon status."""
+        info = control("ping", daemon_socket)
+
+        assert info is not None
+        assert info["pid"] == os.getpid()
+        assert info["requests_served"] == 0
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            b"\xffgarbage",
+            marshal.dumps(["not", "a", "mapping"]),
+            marshal.dumps({"argv": ["hello", 1]}),
+            marshal.dumps({"env": "HOME=/"}),
+        ],
+    )
+    def test_survives_malformed_requests(
+        self, daemon_socket: Path, payload: bytes
+    ) -> None:
+        """Test that a bad request gets an error exit and the daemon keeps serving."""
+        with socket.socket(socket.AF_UNIX) as conn:
+            conn.connect(str(daemon_socket))
+            send_frame(conn, REQUEST, payload)
+            frames = [recv_frame(conn), recv_frame(conn)]
+        with socket.socket(socket.AF_UNIX) as conn:
+            conn.connect(str(daemon_socket))
+            conn.sendall(b"raw garbage")
+
+        assert frames[1] == (EXIT, marshal.dumps({"exit_code": 2}))
+        assert b"malformed request" in frames[0][1]
+        assert control("ping", daemon_socket) is not None
+
+    def test_forwards_output_and_exit_code(
+        self, daemon_socket: Path, tmp_path: Path
+    ) -> None:
+        """Test that stdout, stderr and exit codes are relayed."""
+        code, stdout, _ = _run_client(daemon_socket, tmp_path, "hello", "-n", "T3")
+        assert code == 0
+        assert "Hello, T3!" in stdout
+
+        code, stdout, _ = _run_client(daemon_socket, tmp_path, "config", "get", "nope")
+        assert code == 1
+        assert "Key 'nope' not found" in stdout
+
+        code, _, stderr = _run_client(daemon_socket, tmp_path, "no-such-command")
+        assert code == 2
+        assert "No such command" in stderr
+
+        assert control("ping", daemon_socket)["requests_served"] == 3
+
+    def test_uses_client_environment(self, daemon_socket: Path, tmp_path: Path) -> None:
+        """Test that the client's environment and stdin are used."""
+        _run_client(daemon_socket, tmp_path, "config", "set", "theme", "dark")
+
+        code, stdout, _ = _run_client(
+            daemon_socket, tmp_path, "config", "reset", stdin="n\n"
+        )
+
+        assert code == 0
+        assert "Reset cancelled" in stdout
+        assert (tmp_path / ".t3" / "config.json").exists()
+
+    def test_forwards_large_stdin(self, daemon_socket: Path, tmp_path: Path) -> None:
+        """Test that piped input larger than one chunk arrives intact."""
+        lines = "".join(
+            f'{{"key": "bulk.k{n}", "value": "{"x" * 64}"}}\n' for n in range(2000)
+        )
+
+        code, stdout, stderr = _run_client(
+            daemon_socket,
+            tmp_path,
+            "config",
+            "import",
+            "-",
+            "--format",
+            "ndjson",
+            stdin=lines,
+        )
+
+        assert code == 0, stderr
+        assert "Imported 2000 keys" in stdout
@@ -0,0 +1,94 @@
+"""Tests for file helpers."""
+
+import os
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from t3.core.files import (
+    DEFAULT_FILE_MODE,
+    atomic_write_text,
+    file_action,
+    sync_file,
+)
+
+
+class TestAtomicWriteText:
+    """Test cases for atomic_write_text."""
+
+    def test_creates_file_with_default_mode(self, tmp_path: Path) -> None:
+        """Test writing a new file in a missing directory."""
+        target = tmp_path / "sub" / "file.txt"
+
+        atomic_write_text(target, "hello")
+
+        assert target.read_text() == "hello"
+        assert stat.S_IMODE(target.stat().st_mode) == DEFAULT_FILE_MODE
+
+    def test_preserves_existing_mode(self, tmp_path: Path) -> None:
+        """Test that replacing a file keeps its permissions."""
+        target = tmp_path / "file.txt"
+        target.write_text("old")
+        target.chmod(0o600)
+
+        atomic_write_text(target, "new")
+
+        assert target.read_text() == "new"
+        assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+    def test_failure_keeps_original_and_cleans_up(self, tmp_path: Path) -> None:
+        """Test that a failed replace leaves the original file intact."""
+        target = tmp_path / "file.txt"
+        target.write_text("original")
+
+        with (
+            patch("t3.core.files.os.replace", side_effect=OSError("boom")),
+            pytest.raises(OSError),
+        ):
+            atomic_write_text(target, "new")
+
+        assert target.read_text() == "original"
+        assert os.listdir(tmp_path) == ["file.txt"]
+
+
+class TestSyncFile:
+    """Test cases for sync_file."""
+
+    def test_actions(self, tmp_path: Path) -> None:
+        """Test created, unchanged and updated outcomes."""
+        target = tmp_path / "file.txt"
+
+        assert sync_file(target, b"hello") == "created"
+        mtime = target.stat().st_mtime_ns
+        assert sync_file(target, b"hello") == "unchanged"
+        assert target.stat().st_mtime_ns == mtime
+        assert sync_file(target, b"hellO") == "updated"
+        assert target.read_bytes() == b"hellO"
+
+    def test_dry_run(self, tmp_path: Path) -> None:
+        """Test that a dry run writes nothing."""
+        target = tmp_path / "file.txt"
+
+        assert sync_file(target, b"hello", dry_run=True) == "created"
+        assert not target.exists()
+
+    def test_large_content_compared_in_chunks(self, tmp_path: Path) -> None:
+        """Test a difference beyond the first chunk of an equal-size file."""
+        target = tmp_path / "big.bin"
+        data = bytes(200 * 1024)
+        target.write_bytes(data)
+
+        assert file_action(target, data) == "unchanged"
+        assert file_action(target, data[:-1] + b"\x01") == "updated"
+
+    def test_executable_bit(self, tmp_path: Path) -> None:
+        """Test that only the executable bit is compared and fixed."""
+        target = tmp_path / "run.sh"
+        target.write_bytes(b"#!/bin/sh\n")
+        target.chmod(0o640)
+
+        assert file_action(target, b"#!/bin/sh\n") == "unchanged"
+        assert sync_file(target, b"#!/bin/sh\n", executable=True) == "updated"
+        assert stat.S_IMODE(target.stat().st_mode) == 0o750
@@ -0,0 +1,205 @@
+"""Tests for ``t3 init docker``."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from t3.core import layers
+from t3.core.docker import PullProgress, pull_image
+from t3.main import app
+
+runner = CliRunner()
+
+# Stands in for docker, keeping its "image store" next to itself. A pull
+# only completes once config.yaml exists, so it fails unless the config is
+# written while the pull runs.
+FAKE_DOCKER = """#!{python}
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+store = Path(__file__).with_name("image.json")
+with Path(__file__).with_name("calls.log").open("a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+
+if sys.argv[1:3] == ["image", "inspect"]:
+    if not store.exists():
+        print("Error: No such image: " + sys.argv[3], file=sys.stderr)
+        sys.exit(1)
+    print(store.read_text())
+    sys.exit(0)
+
+print("latest: Pulling from t3-labs/edge-video", flush=True)
+for layer in ("a1b2c3d4e5f6", "0123456789ab"):
+    print(f"{{layer}}: Pulling fs layer", flush=True)
+for _ in range(200):
+    if os.path.exists("config.yaml"):
+        break
+    time.sleep(0.05)
+else:
+    print("config.yaml was not written during the pull", flush=True)
+    sys.exit(3)
+print("a1b2c3d4e5f6: Already exists", flush=True)
+print("0123456789ab: Download complete", flush=True)
+print("0123456789ab: Pull complete", flush=True)
+print("Digest: sha256:{digest}", flush=True)
+print("Status: Downloaded newer image for " + sys.argv[2], flush=True)
+if {status} == 0:
+    image = {{"Id": "sha256:" + "1" * 64, "RepoDigests": [sys.argv[2]]}}
+    store.write_text(json.dumps([image]))
+sys.exit({status})
+"""
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run in an empty directory, with no docker executable on PATH."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+    monkeypatch.delenv("T3_CACHE_TTL", raising=False)
+    monkeypatch.setattr(layers, "_resolved", {})
+    work = tmp_path / "work"
+    work.mkdir()
+    monkeypatch.chdir(work)
+    return work
+
+
+def pulls(docker: Path) -> int:
+    """Count the pulls the fake docker has performed."""
+    log = docker.with_name("calls.log").read_text().splitlines()
+    return sum(line.startswith("pull ") for line in log)
+
+
+def install_docker(workdir: Path, status: int = 0) -> Path:
+    """Put a fake docker executable on PATH."""
+    docker = workdir.parent / "bin" / "docker"
+    docker.parent.mkdir(exist_ok=True)
+    docker.write_text(
+        FAKE_DOCKER.format(python=sys.executable, digest="f" * 64, status=status)
+    )
+    docker.chmod(0o755)
+    return docker
+
+
+class TestPullImage:
+    """Test cases for the streamed pull."""
+
+    def test_streams_lines(self, workdir: Path) -> None:
+        """Test that lines are delivered and layer progress is tracked."""
+        install_docker(workdir)
+        (workdir / "config.yaml").touch()
+        tracker = PullProgress()
+
+        result = asyncio.run(pull_image("edge:latest", tracker.feed))
+
+        assert result.returncode == 0
+        assert result.digest == "sha256:" + "f" * 64
+        assert (tracker.completed, tracker.total) == (2, 2)
+        assert tracker.status == "Downloaded newer image for edge:latest"
+
+
+class TestInitDockerCommand:
+    """Test cases for ``t3 init docker``."""
+
+    def test_creates_config_and_directories(self, workdir: Path) -> None:
+        """Test a first run, then an idempotent second one."""
+        result = runner.invoke(app, ["-o", "json", "init", "docker"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["created"] == 5
+        config = yaml.safe_load((workdir / "config.yaml").read_text())
+        assert config["storage"]["max_storage_gb"] == 100
+        assert (workdir / "recordings").is_dir()
+
+        mtime = (workdir / "config.yaml").stat().st_mtime_ns
+        result = runner.invoke(app, ["-o", "json", "init", "docker"])
+
+        assert json.loads(result.stdout)["unchanged"] == 5
+        assert (workdir / "config.yaml").stat().st_mtime_ns == mtime
+
+    def test_pull_overlaps_config(self, workdir: Path) -> None:
+        """Test that the config is written while the image is pulled."""
+        install_docker(workdir)
+
+        result = runner.invoke(app, ["-o", "plain", "init", "docker"])
+
+        assert result.exit_code == 0
+        assert f"Docker image pulled successfully! (sha256:{'f' * 64})" in (
+            result.stdout
+        )
+
+    def test_failed_pull_continues(self, workdir: Path) -> None:
+        """Test that a failed pull is reported with its last output lines."""
+        install_docker(workdir, status=1)
+
+        result = runner.invoke(app, ["-o", "plain", "init", "docker"])
+
+        assert result.exit_code == 0
+        assert "Failed to pull Docker image" in result.stderr
+        assert "0123456789ab: Pull complete" in result.stderr
+        assert (workdir / "config.yaml").is_file()
+
+    def test_pull_skipped_while_fresh(
+        self, workdir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a recently pulled image is not pulled again."""
+        docker = install_docker(workdir)
+
+        runner.invoke(app, ["init", "docker"])
+        result = runner.invoke(app, ["-o", "plain", "init", "docker"])
+
+        assert pulls(docker) == 1
+        assert "Skipping docker pull: image is up to date" in result.stdout
+
+        runner.invoke(app, ["init", "docker", "--force"])
+        assert pulls(docker) == 2
+
+        monkeypatch.setenv("T3_CACHE_TTL", "0.01")
+        runner.invoke(app, ["init", "docker"])
+        assert pulls(docker) == 3
+
+    @pytest.mark.parametrize(
+        ("present", "policy", "expected"),
+        [
+            (False, "never", 0),
+            (False, "missing", 1),
+            (True, "missing", 0),
+            (True, "always", 1),
+        ],
+    )
+    def test_pull_policy(
+        self, workdir: Path, present: bool, policy: str, expected: int
+    ) -> None:
+        """Test --pull without a record of earlier pulls."""
+        docker = install_docker(workdir)
+        if present:
+            docker.with_name("image.json").write_text('[{"Id": "sha256:1"}]')
+
+        result = runner.invoke(app, ["init", "docker", "--pull", policy])
+
+        assert result.exit_code == 0
+        assert pulls(docker) == expected
+
+    def test_differing_config_asks(self, workdir: Path) -> None:
+        """Test that an edited config is only replaced after confirmation."""
+        (workdir / "config.yaml").write_text("edited: true\n")
+
+        result = runner.invoke(app, ["init", "docker"], input="n\n")
+
+        assert "cancelled" in result.stdout
+        assert (workdir / "config.yaml").read_text() == "edited: true\n"
+
+    def test_dry_run(self, workdir: Path) -> None:
+        """Test that --dry-run writes nothing."""
+        result = runner.invoke(app, ["-o", "plain", "init", "docker", "--dry-run"])
+
+        assert result.exit_code == 0
+        assert "created\tconfig.yaml" in result.stdout.splitlines()
+        assert list(workdir.iterdir()) == []
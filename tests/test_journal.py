@@ -0,0 +1,137 @@
+"""Tests for the configuration journal and concurrent writers."""
+
+import json
+import stat
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from t3.core import config as core_config
+from t3.core import journal
+from t3.core.config import ConfigManager
+from t3.core.journal import (
+    append_journal,
+    encode_operations,
+    journal_path,
+    read_journal,
+)
+
+LARGE = {"cameras": {f"cam{i}": {"fps": 30, "enabled": True} for i in range(3000)}}
+
+WRITER = """
+import sys
+from t3.core.config import ConfigManager
+
+manager = ConfigManager(sys.argv[1])
+for index in range(int(sys.argv[3])):
+    manager.set(f"{sys.argv[2]}.key{index}", index)
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Isolate each test from documents cached by other tests."""
+    monkeypatch.setattr(core_config, "_document_cache", {})
+
+
+def _load_uncached(config_path: Path) -> ConfigManager:
+    """Load a manager as a new process would, without the in-memory cache."""
+    core_config._document_cache.clear()
+    return ConfigManager(str(config_path))
+
+
+def _large_config(config_path: Path) -> None:
+    """Write a configuration large enough to be journaled."""
+    config_path.write_text(json.dumps(LARGE, indent=2))
+    config_path.chmod(0o600)
+
+
+class TestJournalFile:
+    """Test cases for reading and appending journal lines."""
+
+    def test_roundtrip_skips_incomplete_and_malformed(self, tmp_path: Path) -> None:
+        """Test that only complete, valid lines are replayed."""
+        config_path = tmp_path / "config.json"
+        operations = [("set", "a.b", [1, 2]), ("delete", "c"), ("clear",)]
+        data = encode_operations(operations)
+        journal_path(config_path).write_bytes(data + b"not json\n" + b'{"op":"set"')
+
+        assert read_journal(config_path) == (operations, len(data) + 9)
+
+    def test_append_terminates_incomplete_line(self, tmp_path: Path) -> None:
+        """Test that an interrupted append does not swallow the next one."""
+        config_path = tmp_path / "config.json"
+        journal_path(config_path).write_bytes(b'{"op":"del')
+
+        append_journal(config_path, encode_operations([("delete", "x")]), 0o600)
+
+        assert read_journal(config_path)[0] == [("delete", "x")]
+
+
+class TestJournaledConfig:
+    """Test cases for journaled writes through ConfigManager."""
+
+    def test_small_config_is_rewritten(self, tmp_path: Path) -> None:
+        """Test that small files are rewritten without a journal."""
+        config_path = tmp_path / "config.json"
+
+        ConfigManager(str(config_path)).set("key", "value")
+
+        assert json.loads(config_path.read_text()) == {"key": "value"}
+        assert not journal_path(config_path).exists()
+
+    def test_large_config_appends_to_journal(self, tmp_path: Path) -> None:
+        """Test that changes to a large file are appended and replayed."""
+        config_path = tmp_path / "config.json"
+        _large_config(config_path)
+        base = config_path.read_bytes()
+
+        config_manager = ConfigManager(str(config_path))
+        config_manager.set("cameras.cam1.fps", 15)
+        config_manager.delete("cameras.cam2")
+
+        assert config_path.read_bytes() == base
+        assert stat.S_IMODE(journal_path(config_path).stat().st_mode) == 0o600
+        loaded = _load_uncached(config_path)
+        assert loaded.get("cameras.cam1.fps") == 15
+        assert "cameras.cam2" not in loaded
+
+    def test_journal_is_compacted(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a long journal is folded back into the file."""
+        monkeypatch.setattr(journal, "JOURNAL_COMPACT_RATIO", 0.001)
+        config_path = tmp_path / "config.json"
+        _large_config(config_path)
+
+        config_manager = ConfigManager(str(config_path))
+        for index in range(10):
+            config_manager.set(f"sites.s{index}", index)
+
+        assert not journal_path(config_path).exists()
+        assert json.loads(config_path.read_text())["sites"]["s9"] == 9
+        assert stat.S_IMODE(config_path.stat().st_mode) == 0o600
+
+    @pytest.mark.parametrize("large", [False, True])
+    def test_concurrent_processes_lose_no_updates(
+        self, tmp_path: Path, large: bool
+    ) -> None:
+        """Test that writers in separate processes all land their changes."""
+        config_path = tmp_path / "config.json"
+        if large:
+            _large_config(config_path)
+
+        writers = [
+            subprocess.Popen(
+                [sys.executable, "-c", WRITER, str(config_path), f"w{n}", "20"]
+            )
+            for n in range(4)
+        ]
+        assert [writer.wait(timeout=60) for writer in writers] == [0] * 4
+
+        loaded = _load_uncached(config_path)
+        for n in range(4):
+            assert loaded.get(f"w{n}") == {f"key{i}": i for i in range(20)}
+        assert (loaded.get("cameras") is not None) == large
@@ -0,0 +1,157 @@
+"""Tests for layered configuration resolution."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from t3.core import layers
+from t3.core.config import get_config
+from t3.core.layers import (
+    env_document,
+    find_project_config,
+    merge_documents,
+    resolve_config,
+)
+from t3.main import app
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a home with a user file and a project with a TOML config."""
+    home = tmp_path / "home"
+    (home / ".t3").mkdir(parents=True)
+    (home / ".t3" / "config.json").write_text(
+        json.dumps({"log_level": "WARNING", "video": {"fps": 30, "codec": "h264"}})
+    )
+
+    root = tmp_path / "site"
+    (root / ".t3").mkdir(parents=True)
+    (root / ".t3" / "config.toml").write_text("[video]\nfps = 15\n")
+    (root / "src" / "deep").mkdir(parents=True)
+
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.delenv("T3_CONFIG_PATH", raising=False)
+    monkeypatch.chdir(root / "src" / "deep")
+    monkeypatch.setattr(layers, "_resolved", {})
+    return root
+
+
+class TestLayerHelpers:
+    """Test cases for environment parsing, merging and discovery."""
+
+    def test_env_document(self) -> None:
+        """Test that T3_* variables become typed, nested settings."""
+        environ = {
+            "T3_LOG_LEVEL": "DEBUG",
+            "T3_VIDEO__FPS": "10",
+            "T3_CACHE_ENABLED": "false",
+            "T3_": "ignored",
+            "T3_BAD__": "ignored",
+            "PATH": "/bin",
+        }
+
+        assert env_document(environ) == {
+            "log_level": "DEBUG",
+            "video": {"fps": 10},
+            "cache_enabled": False,
+        }
+
+    def test_merge_shares_untouched_subtrees(self) -> None:
+        """Test that merging is deep and leaves its inputs unchanged."""
+        lower = {"video": {"fps": 30, "codec": "h264"}, "cameras": {"cam1": {}}}
+        higher = {"video": {"fps": 15}, "theme": "dark"}
+
+        merged = merge_documents(lower, higher)
+
+        assert merged == {
+            "video": {"fps": 15, "codec": "h264"},
+            "cameras": {"cam1": {}},
+            "theme": "dark",
+        }
+        assert merged["cameras"] is lower["cameras"]
+        assert lower["video"] == {"fps": 30, "codec": "h264"}
+
+    def test_find_project_config(self, project: Path) -> None:
+        """Test walking up to the nearest project file, skipping home."""
+        assert find_project_config(Path.cwd()) == project / ".t3" / "config.toml"
+        assert find_project_config(Path.home()) is None
+
+
+class TestResolveConfig:
+    """Test cases for resolving and caching the layered view."""
+
+    def test_precedence_and_explain(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that env beats project, project beats user, user beats defaults."""
+        monkeypatch.setenv("T3_THEME", "dark")
+        config = resolve_config()
+
+        assert config.get("video") == {"fps": 15, "codec": "h264"}
+        assert config.get("log_level") == "WARNING"
+        assert config.get("theme") == "dark"
+        assert config.get("cache_ttl") == 3600
+        assert "missing" not in config
+        assert [entry[0] for entry in config.explain("video.fps")] == [
+            "project",
+            "user",
+        ]
+        assert config.explain("theme")[0][:2] == ("env", "T3_THEME")
+
+    def test_config_path_variable(
+        self, project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that T3_CONFIG_PATH selects the user file."""
+        custom = tmp_path / "custom.json"
+        custom.write_text(json.dumps({"theme": "light"}))
+        monkeypatch.setenv("T3_CONFIG_PATH", str(custom))
+
+        assert resolve_config().explain("theme")[0][1:] == (str(custom), "light")
+        assert get_config().config_path == custom
+
+    def test_merge_is_cached_on_disk(self, project: Path) -> None:
+        """Test that a new process reuses the merge until a layer changes."""
+        resolve_config()
+        cache_files = list((Path.home() / ".t3" / "cache").glob("layers-*"))
+        assert len(cache_files) == 1
+
+        layers._resolved.clear()
+        with patch.object(layers, "load_project_document") as mock_load:
+            assert resolve_config().get("video.fps") == 15
+        mock_load.assert_not_called()
+
+        (project / ".t3" / "config.toml").write_text("[video]\nfps = 5\n")
+        layers._resolved.clear()
+        assert resolve_config().get("video.fps") == 5
+
+    @pytest.mark.parametrize("value", ["no", "0", "false"])
+    def test_disabled_disk_cache(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch, value: str
+    ) -> None:
+        """Test that T3_CACHE_ENABLED switches off the on-disk merge cache."""
+        monkeypatch.setenv("T3_CACHE_ENABLED", value)
+
+        assert resolve_config().get("video.fps") == 15
+        assert not list((Path.home() / ".t3" / "cache").glob("layers-*"))
+
+    def test_user_changes_invalidate_memo(self, project: Path) -> None:
+        """Test that the per-process memo follows writes to the user file."""
+        assert resolve_config().get("log_level") == "WARNING"
+
+        get_config().set("log_level", "ERROR")
+
+        assert resolve_config().get("log_level") == "ERROR"
+
+    def test_get_explain_command(self, project: Path) -> None:
+        """Test ``t3 config get --explain``."""
+        result = runner.invoke(app, ["config", "get", "video.fps", "--explain"])
+
+        assert result.exit_code == 0
+        assert "video.fps = 15" in result.output
+        assert "project" in result.output
+        assert "user" in result.output
@@ -0,0 +1,67 @@
+"""Tests for the CLI entry point and lazy subcommand loading."""
+
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from t3 import __version__
+from t3.main import T3Group, app
+
+runner = CliRunner()
+
+
+class TestEntryPoint:
+    """Test cases for the top-level ``t3`` application."""
+
+    def test_version(self) -> None:
+        """Test that --version prints the version and exits cleanly."""
+        result = runner.invoke(app, ["--version"])
+
+        assert result.exit_code == 0
+        assert f"T3 CLI version: {__version__}" in result.output
+
+    def test_lazy_subcommand_resolves(self) -> None:
+        """Test that lazily registered groups are invocable."""
+        result = runner.invoke(app, ["config", "--help"])
+
+        assert result.exit_code == 0
+        assert "Configuration management" in result.output
+
+    def test_help_lists_lazy_subcommands(self) -> None:
+        """Test that --help lists lazy and eager subcommands."""
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in ("hello", "status", *T3Group.lazy_subcommands):
+            assert name in result.output
+
+    def test_version_does_not_import_commands(self) -> None:
+        """Test that --version imports neither Rich nor command modules."""
+        script = (
+            "import sys\n"
+            "from t3.main import app\n"
+            "try:\n"
+            "    app(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "loaded = [m for m in sys.modules\n"
+            "          if m.startswith(('rich', 't3.commands', 'yaml'))]\n"
+            "print(loaded)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().endswith("[]")
+
+    def test_module_fast_path(self) -> None:
+        """Test that ``python -m t3 --version`` answers without Typer."""
+        result = subprocess.run(
+            [sys.executable, "-m", "t3", "--version"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout == f"T3 CLI version: {__version__}\n"
@@ -0,0 +1,174 @@
+"""Tests for output renderers and the global --output option."""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from t3.core import output
+from t3.core.output import Column, NdjsonRenderer, push_renderer
+from t3.main import app
+
+runner = CliRunner()
+
+NO_RICH = """
+import sys
+from t3.main import app
+
+try:
+    app(["--output", sys.argv[1], "config", "show"])
+except SystemExit:
+    pass
+sys.stderr.write(",".join(name for name in sys.modules if name.startswith("rich")))
+"""
+
+
+@pytest.fixture(autouse=True)
+def _home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use a temporary home with a small configuration."""
+    (tmp_path / ".t3").mkdir()
+    (tmp_path / ".t3" / "config.json").write_text(
+        json.dumps({"video": {"fps": 30, "codec": "h264"}, "name": "edge"})
+    )
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("T3_CONFIG_PATH", raising=False)
+    monkeypatch.delenv("T3_OUTPUT", raising=False)
+
+
+class TestRenderers:
+    """Test cases for the renderer classes."""
+
+    def test_ndjson_streams_rows(self) -> None:
+        """Test that rows are consumed lazily and flushed in chunks."""
+        stream = io.StringIO()
+        renderer = NdjsonRenderer(stream, buffer_size=64)
+        consumed = []
+
+        def rows():
+            for index in range(10):
+                consumed.append(index)
+                yield (f"key{index}", index)
+
+        columns = (Column("Key"), Column("Value"))
+        assert renderer.table(columns, rows()) == 10
+        assert 0 < len(stream.getvalue()) < 10 * len('{"key": "key0", "value": 0}\n')
+
+        renderer.close()
+        lines = stream.getvalue().splitlines()
+        assert [json.loads(line) for line in lines][9] == {"key": "key9", "value": 9}
+
+    def test_unknown_mode(self) -> None:
+        """Test that unknown modes are rejected."""
+        with pytest.raises(ValueError, match="Unknown output mode"):
+            push_renderer("xml")
+
+    def test_incomplete_renderer(self) -> None:
+        """Test that a renderer missing an output method cannot be created."""
+
+        class NoTables(output.Renderer):
+            def message(self, level: str, text: str, **options: object) -> None:
+                pass
+
+            def record(self, data: object, **options: object) -> None:
+                pass
+
+        with pytest.raises(TypeError, match="table"):
+            NoTables()
+
+    def test_nested_renderer_restores_outer(self) -> None:
+        """Test that closing a nested renderer reactivates the outer one."""
+        outer = push_renderer("plain")
+        try:
+            inner = push_renderer()
+            assert inner.mode == "plain"
+            assert output.get_renderer() is inner
+            inner.close()
+            assert output.get_renderer() is outer
+        finally:
+            outer.close()
+
+
+class TestOutputOption:
+    """Test cases for ``t3 --output``."""
+
+    def test_json_config_show(self) -> None:
+        """Test that JSON mode writes one array of rows."""
+        result = runner.invoke(app, ["--output", "json", "config", "show"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == [
+            {"key": "video.fps", "value": 30},
+            {"key": "video.codec", "value": "h264"},
+            {"key": "name", "value": "edge"},
+        ]
+
+    def test_ndjson_keeps_messages_off_stdout(self) -> None:
+        """Test that messages go to stderr as JSON in machine modes."""
+        result = runner.invoke(app, ["-o", "ndjson", "config", "set", "a.b", "1"])
+
+        assert result.exit_code == 0
+        assert result.stdout == ""
+        assert json.loads(result.stderr)["level"] == "success"
+
+        result = runner.invoke(app, ["-o", "ndjson", "config", "get", "a.b"])
+        assert json.loads(result.stdout) == {"key": "a.b", "value": 1}
+
+    def test_plain_config_show(self) -> None:
+        """Test tab-separated plain output."""
+        result = runner.invoke(app, ["-o", "plain", "config", "show", "video"])
+
+        assert result.stdout.splitlines() == [
+            "Key\tValue",
+            "video.fps\t30",
+            "video.codec\th264",
+        ]
+
+    def test_environment_variable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that T3_OUTPUT selects the mode."""
+        monkeypatch.setenv("T3_OUTPUT", "ndjson")
+
+        result = runner.invoke(app, ["hello", "--name", "T3"])
+
+        assert json.loads(result.stdout) == {"greeting": "Hello, T3!"}
+
+    def test_hello_styles_name_in_rich_only(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that only Rich output styles the greeted name."""
+        monkeypatch.setenv("FORCE_COLOR", "1")
+
+        rich_result = runner.invoke(app, ["hello", "--name", "T3"])
+        plain_result = runner.invoke(app, ["-o", "plain", "hello", "--name", "T3"])
+
+        assert "\x1b[1;36mT3" in rich_result.stdout
+        assert plain_result.stdout == "Hello, T3! 👋\n"
+
+    def test_batch_commands_inherit_mode(self) -> None:
+        """Test that commands inside a batch use the batch's mode."""
+        result = runner.invoke(
+            app, ["-o", "ndjson", "batch"], input="config get name\nhello\n"
+        )
+
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert records[0] == {"key": "name", "value": "edge"}
+        assert records[1] == {"greeting": "Hello, World!"}
+        assert records[2]["executed"] == 2
+
+    @pytest.mark.parametrize("mode", ["json", "ndjson"])
+    def test_rich_is_not_imported(self, mode: str) -> None:
+        """Test that machine-readable modes never import Rich."""
+        project_root = Path(__file__).resolve().parent.parent
+        result = subprocess.run(
+            [sys.executable, "-c", NO_RICH, mode],
+            capture_output=True,
+            text=True,
+            cwd=project_root,
+            check=True,
+        )
+
+        assert '"key": "name"' in result.stdout
+        assert result.stderr == ""
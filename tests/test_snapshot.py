@@ -0,0 +1,96 @@
+"""Tests for compiled configuration snapshots."""
+
+import json
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from t3.core import config as core_config
+from t3.core import snapshot
+from t3.core.config import ConfigManager, file_signature
+from t3.core.snapshot import read_snapshot, snapshot_path
+
+LARGE = {
+    "cameras": [
+        {"id": f"cam{i}", "url": f"rtsp://10.0.0.{i % 255}/stream", "fps": 30}
+        for i in range(2000)
+    ]
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Isolate each test from parses cached by other tests."""
+    monkeypatch.setattr(core_config, "_document_cache", {})
+    monkeypatch.delenv("T3_CONFIG_SNAPSHOT", raising=False)
+
+
+def _load_uncached(config_path: Path) -> ConfigManager:
+    """Load a manager as a new process would, without the in-memory cache."""
+    core_config._document_cache.clear()
+    return ConfigManager(str(config_path))
+
+
+class TestConfigSnapshot:
+    """Test cases for writing and loading snapshots."""
+
+    def test_large_config_loads_from_snapshot(self, tmp_path: Path) -> None:
+        """Test that a parsed large config is loaded without parsing JSON."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(LARGE, indent=2))
+        config_path.chmod(0o600)
+        ConfigManager(str(config_path))
+
+        with patch("t3.core.config.json.load") as mock_load:
+            loaded = _load_uncached(config_path)
+
+        mock_load.assert_not_called()
+        assert loaded.get_all() == LARGE
+        assert stat.S_IMODE(snapshot_path(config_path).stat().st_mode) == 0o600
+
+    def test_edited_json_regenerates_snapshot(self, tmp_path: Path) -> None:
+        """Test that an external edit of the JSON invalidates the snapshot."""
+        config_path = tmp_path / "config.json"
+        ConfigManager(str(config_path)).update(LARGE)
+
+        config_path.write_text(json.dumps({**LARGE, "edited": True}, indent=2))
+
+        assert _load_uncached(config_path).get("edited") is True
+        signature = file_signature(config_path)
+        assert signature is not None
+        assert read_snapshot(config_path, signature) == {**LARGE, "edited": True}
+
+    def test_corrupt_snapshot_falls_back_to_json(self, tmp_path: Path) -> None:
+        """Test that a damaged snapshot is ignored."""
+        config_path = tmp_path / "config.json"
+        ConfigManager(str(config_path)).update(LARGE)
+        path = snapshot_path(config_path)
+        path.write_bytes(path.read_bytes()[:100])
+
+        assert _load_uncached(config_path).get_all() == LARGE
+
+    def test_small_or_disabled_config_has_no_snapshot(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that small files and T3_CONFIG_SNAPSHOT=0 skip snapshots."""
+        config_path = tmp_path / "config.json"
+        ConfigManager(str(config_path)).set("key", "value")
+        assert not snapshot_path(config_path).exists()
+
+        monkeypatch.setenv("T3_CONFIG_SNAPSHOT", "0")
+        monkeypatch.setattr(snapshot, "SNAPSHOT_MIN_BYTES", 0)
+        ConfigManager(str(config_path)).set("key", "other")
+        assert not snapshot_path(config_path).exists()
+
+    def test_reset_removes_snapshot(self, tmp_path: Path) -> None:
+        """Test that reset deletes the snapshot with the file."""
+        config_path = tmp_path / "config.json"
+        config_manager = ConfigManager(str(config_path))
+        config_manager.update(LARGE)
+
+        config_manager.reset()
+
+        assert not snapshot_path(config_path).exists()
+        assert not config_path.exists()
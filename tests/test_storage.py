@@ -0,0 +1,255 @@
+"""Tests for storage limits and ``t3 storage gc``."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from t3.commands import storage as storage_command
+from t3.commands.init import _DOCKER_CONFIG
+from t3.core import storage
+from t3.core.storage import (
+    DAY,
+    GIGABYTE,
+    FileEntry,
+    GcReport,
+    StoragePolicy,
+    collect_garbage,
+    iter_files,
+    oldest_covering,
+    storage_policy,
+)
+from t3.main import app
+
+runner = CliRunner()
+
+NOW = 1_700_000_000.0
+
+
+def _make(path: Path, size: int, age_days: float) -> Path:
+    """Create a file of ``size`` bytes last modified ``age_days`` before NOW."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    mtime = NOW - age_days * DAY
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def recordings(tmp_path: Path) -> Path:
+    """Create segments aged 0-9 days in nested directories, 100 bytes each."""
+    root = tmp_path / "recordings"
+    for day in range(10):
+        _make(root / f"cam{day % 2}" / f"day{day}" / "segment.mp4", 100, day + 0.5)
+    return root
+
+
+class TestStoragePolicy:
+    """Test cases for reading the storage block."""
+
+    def test_docker_config(self, tmp_path: Path) -> None:
+        """Test the limits and directories written by ``t3 init docker``."""
+        policy = storage_policy(_DOCKER_CONFIG, tmp_path)
+
+        assert policy.paths == (tmp_path / "data", tmp_path / "recordings")
+        assert policy.max_bytes == 100 * GIGABYTE
+        assert policy.max_age == 7 * DAY
+
+    def test_invalid_limit(self) -> None:
+        """Test that a limit must be a positive number."""
+        with pytest.raises(ValueError, match="max_storage_gb"):
+            storage_policy({"storage": {"max_storage_gb": "lots"}})
+        assert storage_policy({}) == StoragePolicy((), None, None)
+
+
+class TestIterFiles:
+    """Test cases for the parallel directory walk."""
+
+    def test_walk(
+        self, recordings: Path, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test nested directories, chunking, symlinks and missing roots."""
+        monkeypatch.setattr(storage, "CHUNK_SIZE", 2)
+        for n in range(5):
+            _make(recordings / "flat" / f"{n}.ts", n, 0)
+        (recordings / "link").symlink_to(recordings / "flat")
+        errors: list[OSError] = []
+
+        chunks = list(iter_files([recordings, tmp_path / "missing"], 3, errors.append))
+
+        assert all(len(chunk) <= 2 for chunk in chunks)
+        files = [entry for chunk in chunks for entry in chunk]
+        assert len(files) == 15
+        assert sum(entry.size for entry in files) == 1000 + 10
+        assert [type(error) for error in errors] == [FileNotFoundError]
+
+    def test_stop_early(
+        self, recordings: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that abandoning the walk does not wait for a full scan."""
+        monkeypatch.setattr(storage, "CHUNK_SIZE", 1)
+        walk = iter_files([recordings], workers=1)
+
+        assert len(next(walk)) == 1
+        walk.close()
+
+
+class TestCollectGarbage:
+    """Test cases for expiry and quota eviction."""
+
+    def test_oldest_covering(self) -> None:
+        """Test that only the oldest files covering the size are kept."""
+        entries = [
+            FileEntry(f"f{n}", 10, mtime) for n, mtime in enumerate([5, 1, 9, 3])
+        ]
+
+        covering = oldest_covering(entries, 15)
+
+        assert [entry.mtime for entry in covering] == [1, 3]
+
+    def test_expire_and_evict(self, recordings: Path) -> None:
+        """Test deleting by age, then oldest-first down to the quota."""
+        policy = StoragePolicy((recordings,), max_bytes=350, max_age=7 * DAY)
+
+        report = collect_garbage(policy, workers=2, now=NOW)
+
+        assert (report.files, report.bytes) == (10, 1000)
+        assert (report.expired_files, report.expired_bytes) == (3, 300)
+        assert (report.evicted_files, report.evicted_bytes) == (4, 400)
+        assert report.remaining_bytes == 300
+        left = sorted(path.parent.name for path in recordings.rglob("*.mp4"))
+        assert left == ["day0", "day1", "day2"]
+
+    def test_eviction_walk_errors(
+        self, recordings: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that read errors of the second walk are reported."""
+        scandir = os.scandir
+        calls: list[str] = []
+
+        def flaky_scandir(path: str) -> Any:
+            calls.append(path)
+            if path.endswith("day9") and calls.count(path) > 1:
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        monkeypatch.setattr(storage.os, "scandir", flaky_scandir)
+        policy = StoragePolicy((recordings,), max_bytes=350, max_age=None)
+
+        report = collect_garbage(policy, workers=2, now=NOW)
+
+        assert [type(error) for error in report.errors] == [PermissionError]
+        assert report.evicted_files == 7
+
+    def test_dry_run(self, recordings: Path) -> None:
+        """Test that a dry run reports the same totals but deletes nothing."""
+        policy = StoragePolicy((recordings,), max_bytes=350, max_age=7 * DAY)
+
+        report = collect_garbage(policy, dry_run=True, now=NOW)
+
+        assert report.remaining_bytes == 300
+        assert len(list(recordings.rglob("*.mp4"))) == 10
+
+
+class TestStorageGcCommand:
+    """Test cases for ``t3 storage gc``."""
+
+    def test_config(self, recordings: Path, tmp_path: Path) -> None:
+        """Test the configured limits, relative to the config file."""
+        config = tmp_path / "config.yaml"
+        config.write_text(
+            yaml.dump(
+                {
+                    "storage": {"data_path": "./data", "max_storage_gb": 100},
+                    "video": {"output": {"output_path": "./recordings"}},
+                }
+            )
+        )
+        old = _make(tmp_path / "data" / "old.bin", 10, NOW / DAY)
+
+        result = runner.invoke(
+            app,
+            [
+                "-o",
+                "json",
+                "storage",
+                "gc",
+                "-c",
+                str(config),
+                "--older-than-days",
+                "10000",
+                "--dry-run",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        report = json.loads(result.stdout)
+        assert report["files"] == 11
+        assert (report["expired_files"], report["evicted_files"]) == (1, 0)
+        assert report["dry_run"] is True
+        assert old.exists()
+
+    def test_quota(self, recordings: Path, tmp_path: Path) -> None:
+        """Test evicting with --path when there is no config file."""
+        result = runner.invoke(
+            app,
+            [
+                "-o",
+                "plain",
+                "storage",
+                "gc",
+                "-c",
+                str(tmp_path / "none.yaml"),
+                "--path",
+                str(recordings),
+                "--max-gb",
+                str(500 / GIGABYTE),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert len(list(recordings.rglob("*.mp4"))) == 5
+        assert "500.0 B" in result.stdout
+
+    @pytest.mark.parametrize("option", ["--max-gb", "--older-than-days"])
+    def test_rejects_zero(self, recordings: Path, option: str) -> None:
+        """Test that a zero limit is an error, not "delete everything"."""
+        result = runner.invoke(
+            app, ["storage", "gc", "--path", str(recordings), option, "0"]
+        )
+
+        assert result.exit_code == 2
+        assert "must be a positive number" in result.output
+        assert len(list(recordings.rglob("*.mp4"))) == 10
+
+    def test_still_over_quota(
+        self, recordings: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a run leaving storage over its quota fails."""
+        report = GcReport()
+        report.files, report.bytes = 10, 1000
+        monkeypatch.setattr(
+            storage_command, "collect_garbage", lambda *args, **kwargs: report
+        )
+
+        result = runner.invoke(
+            app,
+            ["-o", "plain", "storage", "gc", "--path", str(recordings)]
+            + ["--max-gb", str(500 / GIGABYTE)],
+        )
+
+        assert result.exit_code == 1
+        assert "over the 500.0 B quota" in result.stderr
+
+    def test_missing_config(self, tmp_path: Path) -> None:
+        """Test that there is nothing to clean without a config or --path."""
+        result = runner.invoke(
+            app, ["-o", "plain", "storage", "gc", "-c", str(tmp_path / "config.yaml")]
+        )
+
+        assert result.exit_code == 1
+        assert "run t3 init docker or use --path" in result.output
@@ -0,0 +1,292 @@
+"""Tests for project templates and ``t3 init project``."""
+
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from t3.core import layers, templates
+from t3.core.templates import (
+    TemplateError,
+    compile_text,
+    list_templates,
+    load_template,
+    render_plan,
+    scaffold,
+    scaffold_many,
+)
+from t3.main import app
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def _home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Use a temporary home and working directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("T3_TEMPLATES_PATH", raising=False)
+    monkeypatch.setattr(layers, "_resolved", {})
+    work = tmp_path / "work"
+    work.mkdir()
+    monkeypatch.chdir(work)
+    return tmp_path
+
+
+@pytest.fixture
+def user_templates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a user templates directory selected by T3_TEMPLATES_PATH."""
+    root = tmp_path / "templates"
+    service = root / "service" / "files"
+    (service / "src" / "{{ name }}").mkdir(parents=True)
+    (root / "service" / "template.toml").write_text(
+        'description = "Service"\nextends = "basic"\n'
+        'directories = ["deploy/{{ env }}"]\n[variables]\nenv = "dev"\n'
+    )
+    (service / "src" / "{{ name }}" / "__init__.py").write_text('NAME = "{{ name }}"\n')
+    (service / "logo.bin").write_bytes(b"\xff\xfe{{ name }}")
+    (service / "run.sh").write_text("#!/bin/sh\necho {{ name }}\n")
+    (service / "run.sh").chmod(0o755)
+
+    (root / "basic").mkdir()
+    (root / "basic" / "template.toml").write_text('description = "Mine"\n')
+    monkeypatch.setenv("T3_TEMPLATES_PATH", str(root))
+    return root
+
+
+class TestPlans:
+    """Test cases for substitution plans."""
+
+    def test_compile_and_render(self) -> None:
+        """Test that placeholders alternate with literal text."""
+        plan = compile_text("# {{ name }} v{{version}}\n")
+
+        assert plan == ("# ", "name", " v", "version", "\n")
+        assert render_plan(plan, {"name": "app", "version": 2}) == "# app v2\n"
+
+    def test_missing_variable(self) -> None:
+        """Test that an unset placeholder is an error."""
+        with pytest.raises(TemplateError, match="'version'"):
+            render_plan(compile_text("{{ version }}"), {})
+
+
+class TestTemplates:
+    """Test cases for loading and rendering templates."""
+
+    def test_builtin_chain(self) -> None:
+        """Test that the python template includes the files it extends."""
+        template = load_template("python")
+
+        paths = {render_plan(f.path, {}) for f in template.files}
+        assert paths == {".gitignore", "README.md", "src/main.py", "pyproject.toml"}
+        assert template.variables["version"] == "0.1.0"
+        assert [d[0] for d in template.directories] == ["src", "docs", "tests"]
+
+    def test_user_templates_shadow_builtin(self, user_templates: Path) -> None:
+        """Test listing with user templates first and hidden ones omitted."""
+        listed = {name: description for name, description, _ in list_templates()}
+
+        assert listed == {
+            "basic": "Mine",
+            "python": "Python package with pyproject.toml",
+            "service": "Service",
+            "web": "Static web site",
+        }
+
+    def test_scaffold(self, user_templates: Path, tmp_path: Path) -> None:
+        """Test paths, directories, binary files and executable bits."""
+        destination = tmp_path / "out"
+        scaffold(load_template("service"), destination, {"name": "orders"})
+
+        assert (destination / "src" / "orders" / "__init__.py").read_text() == (
+            'NAME = "orders"\n'
+        )
+        assert (destination / "logo.bin").read_bytes() == b"\xff\xfe{{ name }}"
+        assert os.access(destination / "run.sh", os.X_OK)
+        assert not stat.S_IMODE((destination / "logo.bin").stat().st_mode) & 0o111
+        assert (destination / "deploy" / "dev").is_dir()
+        # The user's "basic" replaces the built-in one, so no src/main.py.
+        assert not (destination / "src" / "main.py").exists()
+
+    def test_scaffold_many(self, tmp_path: Path) -> None:
+        """Test that one failing project does not stop the others."""
+        template = load_template("python")
+        jobs = [
+            (template, tmp_path / "a", {"name": "a"}),
+            (template, tmp_path / "b", {}),
+            (template, tmp_path / "c", {"name": "c"}),
+        ]
+
+        results = sorted(scaffold_many(jobs))
+
+        assert [len(result.changes) for result in results] == [4, 0, 4]
+        assert isinstance(results[1].error, TemplateError)
+        assert (tmp_path / "c" / "pyproject.toml").is_file()
+
+    def test_unsafe_path(self, user_templates: Path, tmp_path: Path) -> None:
+        """Test that variables cannot move files outside the project."""
+        with pytest.raises(TemplateError, match="Unsafe path"):
+            scaffold(load_template("service"), tmp_path / "out", {"name": ".."})
+
+    def test_circular_extends(self, user_templates: Path) -> None:
+        """Test that a template extending itself is rejected."""
+        (user_templates / "basic" / "template.toml").write_text('extends = "service"\n')
+
+        with pytest.raises(TemplateError, match="extends itself"):
+            load_template("service")
+
+
+class TestTemplateCache:
+    """Test cases for the compiled template cache."""
+
+    def test_warm_load_reads_nothing(
+        self, user_templates: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an unchanged template is loaded without parsing it."""
+        cold = load_template("service")
+        monkeypatch.setattr(templates, "_read_files", _fail)
+        monkeypatch.setattr(templates, "read_manifest", _fail)
+
+        assert load_template("service") == cold
+
+    def test_edit_invalidates(self, user_templates: Path) -> None:
+        """Test that changed, added and shadowing files are picked up."""
+        load_template("service")
+        script = user_templates / "service" / "files" / "run.sh"
+        script.write_text("#!/bin/sh\nexit {{ env }}\n")
+        (script.parent / "new.txt").write_text("new")
+        (user_templates / "base").mkdir()
+        (user_templates / "base" / "template.toml").write_text("")
+
+        template = load_template("service")
+
+        paths = {render_plan(f.path, {"name": "x"}): f for f in template.files}
+        assert paths["run.sh"].content == ("#!/bin/sh\nexit ", "env", "\n")
+        assert "new.txt" in paths
+        # The user's empty "base" now shadows the built-in .gitignore.
+        assert ".gitignore" not in paths
+
+    def test_same_content_reuses_compiled(
+        self, user_templates: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that touched but unchanged files skip compilation."""
+        load_template("service")
+        (user_templates / "service" / "files" / "run.sh").touch()
+        monkeypatch.setattr(templates, "_compile_file", _fail)
+
+        assert load_template("service").name == "service"
+
+
+def _fail(*args: object) -> None:
+    """Stand in for functions a cached load must not call."""
+    raise AssertionError("template was parsed")
+
+
+class TestInitProjectCommand:
+    """Test cases for ``t3 init project``."""
+
+    def test_python_template(self) -> None:
+        """Test scaffolding with a variable override."""
+        result = runner.invoke(
+            app,
+            ["init", "project", "-n", "demo", "-t", "python", "--var", "version=2.0"],
+        )
+
+        assert result.exit_code == 0
+        project = Path.cwd() / "demo"
+        assert (project / "README.md").read_text().startswith("# demo\n")
+        assert 'version = "2.0"' in (project / "pyproject.toml").read_text()
+        assert (project / "docs").is_dir()
+
+    def test_rerun_is_idempotent(self) -> None:
+        """Test that re-initializing rewrites only files that differ."""
+        runner.invoke(app, ["init", "project", "-n", "demo", "-t", "python"])
+        project = Path.cwd() / "demo"
+        readme = project / "README.md"
+        readme.write_text("edited\n")
+        main_mtime = (project / "src" / "main.py").stat().st_mtime_ns
+
+        result = runner.invoke(
+            app, ["-o", "json", "init", "project", "-n", "demo", "-t", "python", "-f"]
+        )
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == {"created": 0, "updated": 1, "unchanged": 3}
+        assert readme.read_text().startswith("# demo\n")
+        assert (project / "src" / "main.py").stat().st_mtime_ns == main_mtime
+
+    def test_dry_run(self) -> None:
+        """Test that --dry-run reports the plan and writes nothing."""
+        result = runner.invoke(
+            app, ["-o", "plain", "init", "project", "-n", "demo", "--dry-run"]
+        )
+
+        assert result.exit_code == 0
+        assert "created\tdemo/src/main.py" in result.stdout.splitlines()
+        assert not (Path.cwd() / "demo").exists()
+
+    def test_unknown_template(self) -> None:
+        """Test that an unknown template fails before anything is created."""
+        result = runner.invoke(app, ["init", "project", "-n", "demo", "-t", "nope"])
+
+        assert result.exit_code == 1
+        assert "Unknown template 'nope'" in result.output
+        assert not (Path.cwd() / "demo").exists()
+
+    def test_list_templates(self) -> None:
+        """Test ``t3 init templates``."""
+        result = runner.invoke(app, ["-o", "plain", "init", "templates"])
+
+        assert result.stdout.splitlines()[1].startswith("basic\t")
+
+
+class TestInitManyCommand:
+    """Test cases for ``t3 init many``."""
+
+    def test_manifest(self) -> None:
+        """Test per-project templates, variables and paths."""
+        Path("projects.yaml").write_text(
+            "template: python\n"
+            "variables: {version: '1.0'}\n"
+            "projects:\n"
+            "  - name: orders\n"
+            "    variables: {version: '2.0'}\n"
+            "  - {name: site, template: web, path: web/site}\n"
+        )
+
+        result = runner.invoke(app, ["-o", "json", "init", "many", "projects.yaml"])
+
+        assert result.exit_code == 0
+        rows = {row["project"]: row for row in json.loads(result.stdout)}
+        assert rows["orders"]["created"] == 4
+        assert rows["site"]["status"] == "ok"
+        pyproject = (Path("orders") / "pyproject.toml").read_text()
+        assert 'version = "2.0"' in pyproject
+        assert (Path("web") / "site" / "public" / "index.html").is_file()
+
+    def test_failure_policy(self) -> None:
+        """Test that failures are reported without prompting."""
+        Path("projects.toml").write_text(
+            '[projects.api]\n[projects.bad]\ntemplate = "nope"\n[projects.kept]\n'
+        )
+        Path("kept").mkdir()
+        Path("kept", "README.md").write_text("mine\n")
+
+        result = runner.invoke(app, ["-o", "json", "init", "many", "projects.toml"])
+
+        assert result.exit_code == 1
+        status = {row["project"]: row["status"] for row in json.loads(result.stdout)}
+        assert status == {
+            "api": "ok",
+            "bad": "Unknown template 'nope'",
+            "kept": "1 existing file(s) differ (use --force)",
+        }
+        assert Path("kept", "README.md").read_text() == "mine\n"
+
+        result = runner.invoke(
+            app, ["-o", "json", "init", "many", "projects.toml", "--on-error", "stop"]
+        )
+        status = {row["project"]: row["status"] for row in json.loads(result.stdout)}
+        assert status["api"] == "skipped"
@@ -0,0 +1,132 @@
+"""Tests for configuration change watching."""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from t3.core.watch import Change, ConfigWatcher, diff_documents
+from t3.main import app
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def _home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use a temporary home."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("T3_CONFIG_PATH", raising=False)
+
+
+class TestDiffDocuments:
+    """Test cases for leaf-level document diffs."""
+
+    def test_added_changed_removed(self) -> None:
+        """Test the three kinds of change, including typed values."""
+        shared = {"cam1": {"fps": 30}}
+        old = {"cameras": shared, "video": {"fps": 30, "hd": 1}, "gone": {"a": 1}}
+        new = {"cameras": shared, "video": {"fps": 15, "hd": True}, "log": "INFO"}
+
+        assert sorted(diff_documents(old, new)) == [
+            ("added", "log", None, "INFO"),
+            ("changed", "video.fps", 30, 15),
+            ("changed", "video.hd", 1, True),
+            ("removed", "gone.a", 1, None),
+        ]
+
+    def test_section_replaced_by_value(self) -> None:
+        """Test that replacing a section reports its leaves."""
+        old = {"video": {"fps": 30}}
+        new = {"video": "off"}
+
+        assert list(diff_documents(old, new)) == [
+            ("removed", "video.fps", 30, None),
+            ("added", "video", None, "off"),
+        ]
+
+
+@pytest.mark.parametrize("polling", [False, True])
+class TestConfigWatcher:
+    """Test cases for watching files with inotify and with polling."""
+
+    def test_rename_over_write(self, tmp_path: Path, polling: bool) -> None:
+        """Test that an editor-style save reports only the changed keys."""
+        path = tmp_path / "config.toml"
+        path.write_text('[video]\nfps = 30\ncodec = "h264"\n')
+
+        with ConfigWatcher(
+            [path], debounce=0.05, poll_interval=0.02, polling=polling
+        ) as watcher:
+            temporary = tmp_path / ".config.toml.swp"
+            temporary.write_text('[video]\nfps = 15\ncodec = "h264"\n')
+            os.replace(temporary, path)
+
+            assert next(iter(watcher)) == [
+                Change("changed", str(path), "video.fps", 30, 15)
+            ]
+
+    def test_burst_is_debounced(self, tmp_path: Path, polling: bool) -> None:
+        """Test that a burst of writes is reported once, as its net diff."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"a": 1}))
+
+        with ConfigWatcher(
+            [path], debounce=0.3, poll_interval=0.02, polling=polling
+        ) as watcher:
+            for value in (2, 3, 4):
+                path.write_text(json.dumps({"a": value}))
+
+            assert next(iter(watcher)) == [Change("changed", str(path), "a", 1, 4)]
+
+    def test_user_config_journal(self, tmp_path: Path, polling: bool) -> None:
+        """Test that the user configuration is followed through its manager."""
+        from t3.core.config import get_config
+
+        path = tmp_path / ".t3" / "config.json"
+        get_config(str(path)).set("video.fps", 30)
+
+        with ConfigWatcher(
+            [path], debounce=0.05, poll_interval=0.02, polling=polling
+        ) as watcher:
+            get_config(str(path)).delete("video.fps")
+
+            assert next(iter(watcher)) == [
+                Change("removed", str(path), "video.fps", 30, None),
+                Change("added", str(path), "video", None, {}),
+            ]
+
+
+def test_watch_command(tmp_path: Path) -> None:
+    """Test ``t3 config watch`` emitting NDJSON events."""
+    path = tmp_path / "edge.yaml"
+    path.write_text("fps: 30\n")
+    stop = threading.Event()
+
+    def write() -> None:
+        # Keep changing the file until the watcher has reported something.
+        value = 30
+        while not stop.wait(0.1):
+            value += 1
+            temporary = tmp_path / "edge.yaml.tmp"
+            temporary.write_text(f"fps: {value}\n")
+            os.replace(temporary, path)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        result = runner.invoke(
+            app,
+            ["config", "watch", "--path", str(path), "--debounce", "0", "-n", "1"],
+        )
+    finally:
+        stop.set()
+        writer.join()
+
+    assert result.exit_code == 0
+    event = json.loads(result.stdout)
+    assert event["event"] == "changed"
+    assert event["key"] == "fps"
+    assert event["new"] > event["old"] >= 30